@@ -24,6 +24,8 @@ LOG = logging.getLogger(__name__)
 # ADS-B frequency (1090 MHz)
 ADSB_FREQUENCY_HZ = 1_090_000_000
 
+DEFAULT_AIRCRAFT_TOPIC = "neo_rx/adsb/aircraft"
+
 
 @dataclass
 class AircraftState:
@@ -212,6 +214,8 @@ class AdsbCapture:
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._aircraft_file = self._data_dir / "adsb_aircraft.jsonl"
         self._publisher = publisher
+        # Resolved once; the publisher's topic does not change while capturing.
+        self._topic = getattr(publisher, "topic", DEFAULT_AIRCRAFT_TOPIC)
         self._reporter = reporter
         self._station_config = station_config
         self._callbacks: list[Callable[[list[AircraftState]], None]] = []
@@ -358,7 +362,7 @@ class AdsbCapture:
         if not self._publisher:
             return
         try:
-            topic = getattr(self._publisher, "topic", "neo_rx/adsb/aircraft")
+            topic = self._topic
             count = 0
             for ac in aircraft:
                 payload = json.dumps(
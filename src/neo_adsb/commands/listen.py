@@ -145,7 +145,7 @@ def run_listen(args: Namespace) -> int:
                 publisher.topic,
             )
             publisher.connect()
-            LOG.info("MQTT: connected; publishing enabled")
+            LOG.info("MQTT: publishing enabled")
         except Exception:
             LOG.exception("Failed to create/connect publisher; continuing without")
 
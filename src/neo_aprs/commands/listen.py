@@ -118,6 +118,7 @@ def run_listen(args: Namespace) -> int:
         gain=station_config.gain,
         ppm=station_config.ppm_correction or 0,
         device_index=0,
+        read_chunk_bytes=_AUDIO_CHUNK_BYTES,
     )
 
     capture = RtlFmAudioCapture(rtl_config)
@@ -143,15 +144,16 @@ def run_listen(args: Namespace) -> int:
     summary_log_path = config_module.get_logs_dir("aprs") / "neo-rx.log"
 
     def _pump_audio() -> None:
+        chunk = memoryview(bytearray(_AUDIO_CHUNK_BYTES))
         try:
             while not stop_event.is_set():
-                chunk = capture.read(_AUDIO_CHUNK_BYTES)
-                if not chunk:
+                count = capture.read_into(chunk)
+                if not count:
                     continue
                 if direwolf_proc is None or direwolf_proc.stdin is None:
                     continue
                 try:
-                    direwolf_proc.stdin.write(chunk)
+                    direwolf_proc.stdin.write(chunk[:count])
                     direwolf_proc.stdin.flush()
                 except (
                     BrokenPipeError
@@ -5,8 +5,7 @@ import sys
 import time
 from typing import List
 
-# Temporary imports to delegate to existing implementation during refactor
-from neo_rx.cli import main as legacy_main
+from neo_core.loglevel import resolve_log_level
 
 
 def _add_common_flags(p: argparse.ArgumentParser) -> None:
@@ -23,6 +22,9 @@ def _add_common_flags(p: argparse.ArgumentParser) -> None:
     p.add_argument(
         "--json", action="store_true", help="Enable JSON output for diagnostics"
     )
+    p.add_argument(
+        "--pretty", action="store_true", help="Indent JSON output for reading"
+    )
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -105,6 +107,9 @@ def build_parser() -> argparse.ArgumentParser:
     wspr_cal = wspr_sub.add_parser("calibrate", help="Run PPM calibration")
     _add_common_flags(wspr_cal)
     wspr_cal.add_argument("--samples", help="Path to IQ samples for calibration")
+    wspr_cal.add_argument(
+        "--tail", type=int, help="Only use the most recent N spots from the file"
+    )
 
     wspr_up = wspr_sub.add_parser(
         "upload", help="Upload decoded spots from a directory"
@@ -177,27 +182,6 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     # Configure logging (stdout + file) similarly to legacy CLI
-    def _resolve_log_level(candidate: str | None) -> int:
-        aliases = {
-            "critical": logging.CRITICAL,
-            "error": logging.ERROR,
-            "warning": logging.WARNING,
-            "info": logging.INFO,
-            "debug": logging.DEBUG,
-        }
-        for value in (candidate, os.getenv("NEO_RX_LOG_LEVEL")):
-            if not value:
-                continue
-            stripped = value.strip()
-            if not stripped:
-                continue
-            lower = stripped.lower()
-            if lower in aliases:
-                return aliases[lower]
-            if stripped.isdigit():
-                return int(stripped)
-        return logging.INFO
-
     def _configure_logging(level_name: str | None, mode: str | None) -> None:
         stream_handler = logging.StreamHandler(sys.stdout)
         stream_handler.setFormatter(logging.Formatter("%(message)s"))
@@ -232,7 +216,7 @@ def main(argv: list[str] | None = None) -> int:
             pass
 
         logging.basicConfig(
-            level=_resolve_log_level(level_name), handlers=handlers, force=True
+            level=resolve_log_level(level_name), handlers=handlers, force=True
         )
 
     # Propagate instance/data directory overrides via environment so that
@@ -266,6 +250,9 @@ def main(argv: list[str] | None = None) -> int:
     elif args.mode == "wspr":
         if args.verb == "setup":
             # No dedicated legacy setup; keep existing diagnostics mapping
+            # Temporary delegation to the legacy CLI during refactor
+            from neo_rx.cli import main as legacy_main
+
             argv2: List[str] = ["wspr", "--diagnostics"]
             if getattr(args, "json", False):
                 argv2.append("--json")
@@ -0,0 +1,63 @@
+"""JSON encode/decode helpers shared by the neo-rx packages.
+
+``orjson`` is used when installed (``pip install neo-core[fast]``); otherwise
+the stdlib ``json`` module is used. Callers should treat ``ValueError`` as the
+decode failure type, which covers both implementations.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import Any, TextIO
+
+try:  # Optional dependency for faster JSON parsing/serialization
+    import orjson as _orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover - orjson not installed
+    _orjson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a single JSON document from bytes or text."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, stringifying unknown types.
+
+    Output is compact unless ``indent`` is set, in which case two-space
+    indentation is used.
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        return _orjson.dumps(obj, default=str, option=option)
+    if indent:
+        text = json.dumps(obj, default=str, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False)
+    return text.encode("utf-8")
+
+
+def write_json(obj: Any, stream: TextIO | None = None, *, indent: bool = False) -> None:
+    """Write ``obj`` as one JSON line to ``stream`` (stdout by default).
+
+    The payload goes to the underlying binary buffer in a single write so
+    no intermediate ``str`` copy is made; streams without a buffer (e.g.
+    ``io.StringIO``) fall back to a text write.
+    """
+    out = stream if stream is not None else sys.stdout
+    payload = dumps(obj, indent=indent) + b"\n"
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        out.write(payload.decode("utf-8"))
+        out.flush()
+        return
+    # Flush pending text first so output ordering is preserved.
+    out.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+__all__ = ["dumps", "loads", "write_json"]
@@ -0,0 +1,44 @@
+"""Log-level parsing shared by the neo-rx command-line entry points."""
+
+from __future__ import annotations
+
+import functools
+import logging
+import os
+
+LOG_LEVEL_ENV = "NEO_RX_LOG_LEVEL"
+
+LOG_LEVEL_ALIASES: dict[str, int] = {
+    "critical": logging.CRITICAL,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def parse_log_level(value: str) -> int | None:
+    """Return the level named (or numbered) by ``value``, or None if invalid."""
+    stripped = value.strip()
+    level = LOG_LEVEL_ALIASES.get(stripped.lower())
+    if level is None and stripped.isdigit():
+        level = int(stripped)
+    return level
+
+
+def resolve_log_level(candidate: str | None) -> int:
+    """Pick the level from ``candidate``, then ``$NEO_RX_LOG_LEVEL``, else INFO.
+
+    The environment is consulted on every call (tests and embedders change it
+    in-process); only the parse of each distinct value is cached.
+    """
+    for value in (candidate, os.environ.get(LOG_LEVEL_ENV)):
+        if value:
+            level = parse_log_level(value)
+            if level is not None:
+                return level
+    return logging.INFO
+
+
+__all__ = ["LOG_LEVEL_ALIASES", "parse_log_level", "resolve_log_level"]
@@ -2,12 +2,20 @@
 
 from __future__ import annotations
 
-from collections import deque
+import functools
+import io
+import os
 import shutil
 import subprocess
 import threading
 from dataclasses import dataclass
-from typing import Deque, IO, Sequence
+from typing import IO, Sequence
+
+
+STDERR_TAIL_BYTES = 8192
+STDERR_TAIL_LINES = 8
+_STDERR_READ_BYTES = 4096
+STOP_TIMEOUT_S = 2.0
 
 
 class AudioCaptureError(RuntimeError):
@@ -25,6 +33,7 @@ class RtlFmConfig:
     device_index: int = 0
     squelch_db: int | None = None
     additional_args: Sequence[str] | None = None
+    read_chunk_bytes: int = 4096
 
 
 class RtlFmAudioCapture:
@@ -35,7 +44,7 @@ class RtlFmAudioCapture:
         self._process: subprocess.Popen[bytes] | None = None
         self._command: list[str] | None = None
         self._stderr_thread: threading.Thread | None = None
-        self._stderr_buffer: Deque[str] = deque(maxlen=8)
+        self._stderr_buffer = bytearray()
 
     @property
     def command(self) -> list[str] | None:
@@ -88,7 +97,7 @@ class RtlFmAudioCapture:
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                bufsize=0,
+                bufsize=max(self._config.read_chunk_bytes, io.DEFAULT_BUFFER_SIZE),
             )
         except OSError as exc:
             raise AudioCaptureError(f"Failed to launch rtl_fm: {exc}") from exc
@@ -102,24 +111,33 @@ class RtlFmAudioCapture:
     def read(self, num_bytes: int) -> bytes:
         """Read a chunk of demodulated audio from rtl_fm."""
 
-        if self._process is None or self._process.stdout is None:
-            raise AudioCaptureError("rtl_fm capture not started")
+        stdout = self._require_stdout()
         try:
-            chunk = self._process.stdout.read(num_bytes)
+            chunk = stdout.read(num_bytes)
         except OSError as exc:
             raise AudioCaptureError(f"Failed to read from rtl_fm: {exc}") from exc
 
-        if chunk:
-            return chunk
+        if not chunk:
+            self._raise_if_exited()
+        return chunk
 
-        return_code = self._process.poll()
-        if return_code is None:
-            return chunk
-        self._join_stderr_thread(clear_buffer=False)
-        stderr_tail = self._collect_stderr_tail()
-        detail = _format_exit_detail(return_code, stderr_tail)
-        self._stderr_buffer.clear()
-        raise AudioCaptureError(detail)
+    def read_into(self, buffer: bytearray | memoryview) -> int:
+        """Read demodulated audio into *buffer* and return the byte count.
+
+        Lets long-running callers reuse one preallocated buffer instead of
+        receiving a fresh ``bytes`` object per chunk.
+        """
+
+        stdout = self._require_stdout()
+        try:
+            count = stdout.readinto(buffer)
+        except OSError as exc:
+            raise AudioCaptureError(f"Failed to read from rtl_fm: {exc}") from exc
+
+        if not count:
+            self._raise_if_exited()
+            return 0
+        return count
 
     def stop(self) -> None:
         """Terminate the rtl_fm subprocess if it is running."""
@@ -128,9 +146,8 @@ class RtlFmAudioCapture:
             return
         try:
             self._process.terminate()
-            self._process.wait(timeout=2)
-        except subprocess.TimeoutExpired:
-            self._process.kill()
+            if not _wait_for_exit(self._process, STOP_TIMEOUT_S):
+                self._process.kill()
         finally:
             self._process = None
             self._join_stderr_thread()
@@ -144,19 +161,43 @@ class RtlFmAudioCapture:
         """Ensure rtl_fm terminates on context manager exit."""
         self.stop()
 
+    def _require_stdout(self) -> IO[bytes]:
+        if self._process is None or self._process.stdout is None:
+            raise AudioCaptureError("rtl_fm capture not started")
+        return self._process.stdout
+
+    def _raise_if_exited(self) -> None:
+        assert self._process is not None
+        return_code = self._process.poll()
+        if return_code is None:
+            return
+        self._join_stderr_thread(clear_buffer=False)
+        stderr_tail = self._collect_stderr_tail()
+        detail = _format_exit_detail(return_code, stderr_tail)
+        self._stderr_buffer.clear()
+        raise AudioCaptureError(detail)
+
     def _start_stderr_drain(self) -> None:
         if self._process is None or self._process.stderr is None:
             return
 
         def _worker(stream: IO[bytes]) -> None:
+            try:
+                read = functools.partial(os.read, stream.fileno())
+            except (OSError, ValueError):
+                read = stream.read1  # type: ignore[attr-defined]
+            buffer = self._stderr_buffer
             try:
                 while True:
-                    chunk = stream.readline()
+                    chunk = read(_STDERR_READ_BYTES)
                     if not chunk:
                         break
-                    text = chunk.decode("utf-8", errors="replace").strip()
-                    if text:
-                        self._stderr_buffer.append(text)
+                    buffer += chunk
+                    overflow = len(buffer) - STDERR_TAIL_BYTES
+                    if overflow > 0:
+                        del buffer[:overflow]
+            except OSError:
+                pass
             finally:
                 try:
                     stream.close()
@@ -174,7 +215,13 @@ class RtlFmAudioCapture:
     def _collect_stderr_tail(self) -> str:
         if not self._stderr_buffer:
             return ""
-        return " | ".join(self._stderr_buffer)
+        data = bytes(self._stderr_buffer)
+        if len(data) >= STDERR_TAIL_BYTES:
+            # The ring was trimmed, so the first line is likely partial.
+            data = data.partition(b"\n")[2]
+        text = data.decode("utf-8", errors="replace")
+        lines = [line.strip() for line in text.splitlines()]
+        return " | ".join([line for line in lines if line][-STDERR_TAIL_LINES:])
 
     def _join_stderr_thread(self, *, clear_buffer: bool = True) -> None:
         thread = self._stderr_thread
@@ -186,6 +233,20 @@ class RtlFmAudioCapture:
             self._stderr_buffer.clear()
 
 
+def _wait_for_exit(process: subprocess.Popen[bytes], timeout: float) -> bool:
+    """Wait up to *timeout* seconds for *process* to exit.
+
+    ``Popen.wait(timeout=...)`` sleeps in a polling loop, whereas an
+    untimed ``wait()`` blocks in ``waitpid`` and returns as soon as the
+    child is reaped. Run the latter on a helper thread and bound the join.
+    """
+
+    waiter = threading.Thread(target=process.wait, name="rtl_fm-wait", daemon=True)
+    waiter.start()
+    waiter.join(timeout)
+    return not waiter.is_alive()
+
+
 _STDERR_HINTS: tuple[tuple[str, str], ...] = (
     (
         "usb_claim_interface",
@@ -8,6 +8,7 @@ from __future__ import annotations
 import os
 import sys
 import threading
+from collections.abc import Callable
 from queue import Queue, Empty
 from typing import Literal
 
@@ -28,25 +29,52 @@ def supports_color() -> bool:
     return sys.stdout.isatty()
 
 
+def _make_wrapper(code: str) -> Callable[[str], str]:
+    start, end = _ANSI[code], _ANSI["reset"]
+    return lambda text: f"{start}{text}{end}"
+
+
+def _no_wrap(text: str) -> str:
+    return text
+
+
+# One pre-bound wrapper per colour so wrapping is a single call.
+_WRAPPERS: dict[str, Callable[[str], str]] = {
+    code: _make_wrapper(code) for code in _ANSI
+}
+
+
 def _color_wrap(text: str, code: str, enabled: bool) -> str:
-    if not enabled or code not in _ANSI:
+    if not enabled:
         return text
-    return f"{_ANSI[code]}{text}{_ANSI['reset']}"
+    return _WRAPPERS.get(code, _no_wrap)(text)
+
+
+_LEVEL_STYLES = {
+    "ok": ("[OK     ]", "green"),
+    "warning": ("[WARNING]", "yellow"),
+    "error": ("[ERROR  ]", "red"),
+    "info": ("[INFO   ]", "blue"),
+}
+
+# Every label/colour combination is fixed, so render them once up front.
+_LABELS = {
+    (level, enabled): _color_wrap(text, code, enabled)
+    for level, (text, code) in _LEVEL_STYLES.items()
+    for enabled in (True, False)
+}
 
 
 def status_label(level: ColorLevel, *, enabled: bool = True) -> str:
-    normalized = level.lower()
-    if normalized == "ok":
-        return _color_wrap("[OK     ]", "green", enabled)
-    if normalized == "warning":
-        return _color_wrap("[WARNING]", "yellow", enabled)
-    if normalized == "error":
-        return _color_wrap("[ERROR  ]", "red", enabled)
-    return _color_wrap("[INFO   ]", "blue", enabled)
+    enabled = bool(enabled)
+    label = _LABELS.get((level, enabled))
+    if label is None:  # unusual casing or unknown level
+        label = _LABELS.get((level.lower(), enabled), _LABELS["info", enabled])
+    return label
 
 
 def color_text(text: str, *, color: str = "blue", enabled: bool = True) -> str:
-    return _color_wrap(text, color, enabled)
+    return (_WRAPPERS.get(color, _no_wrap) if enabled else _no_wrap)(text)
 
 
 def start_keyboard_listener(
@@ -150,6 +178,7 @@ def process_commands(
     handlers: dict[str, "callable"],
     *,
     default: "callable" | None = None,
+    timeout: float | None = None,
 ) -> None:
     """Drain queue and dispatch to handlers by single-character key.
 
@@ -157,12 +186,19 @@ def process_commands(
         queue: Source of keypress strings.
         handlers: Mapping of lowercased keys to no-arg callables.
         default: Optional callable invoked when no handler exists for a key.
+        timeout: If given, block up to this many seconds for the first
+            command instead of returning immediately on an empty queue.
     """
+    wait = timeout
     while True:
         try:
-            cmd = queue.get_nowait()
+            if wait is None:
+                cmd = queue.get_nowait()
+            else:
+                cmd = queue.get(timeout=wait)
         except Empty:
             break
+        wait = None
         key = cmd.lower()
         fn = handlers.get(key)
         if fn is not None:
@@ -5,26 +5,19 @@ within the package can consistently report the package version at
 runtime without duplicating fallback logic.
 """
 
+import os as _os
+
 # Suppress pkg_resources deprecation warning
 import warnings
 
-from pathlib import Path as _Path
-
-try:
-    # Python 3.8+ exposes importlib.metadata in the stdlib; fall back to
-    # the backport package if necessary. We keep this minimal and avoid
-    # importing package submodules before __version__ is set to prevent
-    # circular import issues.
-    from importlib import metadata as _importlib_metadata
-except Exception:  # pragma: no cover - defensive for very old runtimes
-    import importlib_metadata as _importlib_metadata  # type: ignore
-
 warnings.filterwarnings(
     "ignore", message="pkg_resources is deprecated", category=UserWarning
 )
 
-_pkg_path = _Path(__file__).resolve()
-_in_site = ("site-packages" in str(_pkg_path)) or ("dist-packages" in str(_pkg_path))
+# Plain string path ops: resolving through pathlib costs extra syscalls at
+# import time for a check that only needs substring tests.
+_pkg_path_str = _os.path.abspath(__file__)
+_in_site = ("site-packages" in _pkg_path_str) or ("dist-packages" in _pkg_path_str)
 
 
 def _version_from_pyproject() -> str:
@@ -35,10 +28,10 @@ def _version_from_pyproject() -> str:
             import tomllib as _toml
         else:  # pragma: no cover
             import tomli as _toml  # type: ignore
-        _root = _pkg_path.parents[2]
-        _pyproj = _root / "pyproject.toml"
-        if _pyproj.exists():
-            with _pyproj.open("rb") as _f:
+        _root = _os.path.dirname(_os.path.dirname(_os.path.dirname(_pkg_path_str)))
+        _pyproj = _os.path.join(_root, "pyproject.toml")
+        if _os.path.exists(_pyproj):
+            with open(_pyproj, "rb") as _f:
                 _data = _toml.load(_f)
             return _data.get("project", {}).get("version", "0.0.0")
     except Exception:
@@ -46,14 +39,40 @@ def _version_from_pyproject() -> str:
     return "0.0.0"
 
 
-if not _in_site:
-    __version__ = _version_from_pyproject()
-else:
+def _resolve_version() -> str:
+    if not _in_site:
+        return _version_from_pyproject()
     try:
-        __version__ = _importlib_metadata.version("neo-rx")
+        # importlib.metadata is costly to import, so it is only loaded here
+        from importlib import metadata as _importlib_metadata
+
+        return _importlib_metadata.version("neo-rx")
     except Exception:
-        __version__ = _version_from_pyproject()
+        return _version_from_pyproject()
 
-from . import cli, config, diagnostics_helpers, term  # noqa: E402
 
 __all__ = ["cli", "config", "diagnostics_helpers", "term", "__version__"]
+
+# Submodules load on first attribute access (PEP 562) so that importing the
+# package for ``__version__`` does not pay for the CLI and its dependencies.
+# ``__version__`` itself is resolved on first access and then cached, so
+# importing the package (e.g. for ``neo_rx.cli``) does no metadata lookup.
+_LAZY_SUBMODULES = frozenset({"cli", "config", "diagnostics_helpers", "term"})
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        version = _resolve_version()
+        globals()["__version__"] = version
+        return version
+    if name in _LAZY_SUBMODULES:
+        import importlib
+
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES | {"__version__"})
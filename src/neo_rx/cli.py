@@ -3,110 +3,392 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import importlib
+import importlib.util
 import logging
-import os
+import logging.handlers
 import sys
+import threading
 import time
+import weakref
 from argparse import Namespace
-from typing import Callable, Dict
+from typing import Any, Callable
 
-from neo_rx import __version__
+import neo_rx
+from neo_core.loglevel import resolve_log_level as _resolve_log_level
 from neo_rx import config as config_module
 
-from neo_rx.commands import (  # type: ignore[import]
-    run_diagnostics,
-    run_listen,
-    run_setup,
-)
 
-# Import subpackage commands for namespaced CLI
-try:
-    from neo_aprs.commands import (
-        run_listen as aprs_listen,
-        run_setup as aprs_setup,
-        run_diagnostics as aprs_diagnostics,
-    )
-except ImportError:
-    aprs_listen = None  # type: ignore
-    aprs_setup = None  # type: ignore
-    aprs_diagnostics = None  # type: ignore
-
-try:
-    from neo_wspr.commands import (
-        run_listen as wspr_listen,
-        run_scan as wspr_scan,
-        run_calibrate as wspr_calibrate,
-        run_upload as wspr_upload,
-        run_diagnostics as wspr_diagnostics,
-    )
-except ImportError:
-    wspr_listen = None  # type: ignore
-    wspr_scan = None  # type: ignore
-    wspr_calibrate = None  # type: ignore
-    wspr_upload = None  # type: ignore
-    wspr_diagnostics = None  # type: ignore
+# Command modules (and their SDR/numpy dependency graphs) are imported only
+# when their command is dispatched; build_parser() just checks that each
+# namespaced subpackage is installed, which does not execute it.
+def _has_commands(module: str) -> bool:
+    try:
+        return importlib.util.find_spec(module) is not None
+    except ImportError:
+        return False
+
+
+_HAS_APRS_COMMANDS = _has_commands("neo_aprs.commands")
+_HAS_WSPR_COMMANDS = _has_commands("neo_wspr.commands")
 
 CommandHandler = Callable[[Namespace], int]
 
-_LOG_LEVEL_ALIASES: dict[str, int] = {
-    "critical": logging.CRITICAL,
-    "error": logging.ERROR,
-    "warning": logging.WARNING,
-    "info": logging.INFO,
-    "debug": logging.DEBUG,
+# (command, subcommand) -> (module, handler); the module is imported only when
+# its command is dispatched. Top-level commands are the legacy aliases.
+_COMMAND_HANDLERS: dict[tuple[str, str | None], tuple[str, str]] = {
+    ("listen", None): ("neo_rx.commands", "run_listen"),
+    ("setup", None): ("neo_rx.commands", "run_setup"),
+    ("diagnostics", None): ("neo_rx.commands", "run_diagnostics"),
+    ("aprs", "listen"): ("neo_aprs.commands", "run_listen"),
+    ("aprs", "setup"): ("neo_aprs.commands", "run_setup"),
+    ("aprs", "diagnostics"): ("neo_aprs.commands", "run_diagnostics"),
+    ("wspr", "listen"): ("neo_wspr.commands", "run_listen"),
+    ("wspr", "scan"): ("neo_wspr.commands", "run_scan"),
+    ("wspr", "calibrate"): ("neo_wspr.commands", "run_calibrate"),
+    ("wspr", "upload"): ("neo_wspr.commands", "run_upload"),
+    ("wspr", "diagnostics"): ("neo_wspr.commands", "run_diagnostics"),
 }
+SubparserBuilder = Callable[[Any, dict[str, argparse.ArgumentParser]], None]
 
 
 def _package_version() -> str:
     # Use the package-level canonical version value. This avoids
     # repeated importlib.metadata lookups and keeps a single source of
-    # truth for runtime reporting (see ``neo_rx.__version__``).
-    return __version__
+    # truth for runtime reporting (see ``neo_rx.__version__``, which is
+    # resolved on first access and cached, so only --version pays for it).
+    return neo_rx.__version__
+
+
+# File-log records are batched in memory and written LOG_BUFFER_CAPACITY at a
+# time (immediately for WARNING and above, and at least every
+# LOG_FLUSH_INTERVAL_S), so a hard kill loses at most a few seconds of INFO.
+LOG_BUFFER_CAPACITY = 32
+LOG_FLUSH_INTERVAL_S = 5.0
+
+# Live buffered handlers, flushed by one process-wide daemon thread.
+_buffered_handlers: weakref.WeakSet[logging.Handler] = weakref.WeakSet()
+_log_flusher: threading.Thread | None = None
+_log_flusher_lock = threading.Lock()
+
+
+def _flush_buffered_logs() -> None:
+    # Event.wait rather than time.sleep, so patched sleeps never spin it.
+    idle = threading.Event()
+    while not idle.wait(LOG_FLUSH_INTERVAL_S):
+        for handler in list(_buffered_handlers):
+            handler.flush()
+
+
+class _BufferedFileHandler(logging.handlers.MemoryHandler):
+    """Memory buffer in front of the log file handler.
+
+    The shared ``neo-rx-log-flush`` thread flushes it periodically so a quiet
+    long-running ``listen`` still reaches disk; closing it (``logging.shutdown``
+    at exit, or a reconfigure) flushes and closes the file handler as well.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        global _log_flusher
+        super().__init__(
+            LOG_BUFFER_CAPACITY,
+            flushLevel=logging.WARNING,
+            target=target,
+            flushOnClose=True,
+        )
+        _buffered_handlers.add(self)
+        with _log_flusher_lock:
+            if _log_flusher is None:
+                _log_flusher = threading.Thread(
+                    target=_flush_buffered_logs, name="neo-rx-log-flush", daemon=True
+                )
+                _log_flusher.start()
+
+    def close(self) -> None:
+        _buffered_handlers.discard(self)
+        target = self.target
+        super().close()
+        if target is not None:
+            target.close()
+
+
+# Log directories already created by this process; keyed by path so a data
+# dir that changes between calls (tests, embedders) is still created.
+_log_dirs_ready: set[str] = set()
+
+
+# What the last _configure_logging installed: ((level, log file, stdout),
+# handlers). A repeat call with the same settings keeps those handlers rather
+# than tearing down and rebuilding the root logger.
+# Formatters are stateless, so every configure call shares the same pair.
+_STREAM_FORMATTER = logging.Formatter("%(message)s")
+_FILE_FORMATTER = logging.Formatter(
+    "%(asctime)sZ %(message)s", datefmt="%Y-%m-%dT%H:%M:%S"
+)
+_FILE_FORMATTER.converter = time.gmtime
 
+_LoggingKey = tuple[int, str | None, object]
+_last_logging_cfg: tuple[_LoggingKey, list[logging.Handler]] | None = None
 
-def _resolve_log_level(candidate: str | None) -> int:
-    for value in (candidate, os.getenv("NEO_RX_LOG_LEVEL")):
-        if not value:
-            continue
-        stripped = value.strip()
-        if not stripped:
-            continue
-        lower = stripped.lower()
-        if lower in _LOG_LEVEL_ALIASES:
-            return _LOG_LEVEL_ALIASES[lower]
-        if stripped.isdigit():
-            return int(stripped)
-    return logging.INFO
+
+def reset_logging() -> None:
+    """Forget the cached logging setup so the next configure call rebuilds it."""
+    global _last_logging_cfg
+    _last_logging_cfg = None
 
 
 def _configure_logging(level_name: str | None) -> None:
-    stream_handler = logging.StreamHandler(sys.stdout)
-    stream_handler.setFormatter(logging.Formatter("%(message)s"))
-    handlers: list[logging.Handler] = [stream_handler]
+    global _last_logging_cfg
+    level = _resolve_log_level(level_name)
 
+    log_file = None
     try:
         # Legacy CLI primarily serves APRS flow; build logs path relative to
         # get_data_dir so monkeypatching in tests affects behavior.
         base = config_module.get_data_dir()
         log_dir = base / "logs" / "aprs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        if str(log_dir) not in _log_dirs_ready:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _log_dirs_ready.add(str(log_dir))
         log_file = log_dir / "neo-rx.log"
-        file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_formatter = logging.Formatter(
-            "%(asctime)sZ %(message)s", datefmt="%Y-%m-%dT%H:%M:%S"
-        )
-        file_formatter.converter = time.gmtime
-        file_handler.setFormatter(file_formatter)
-        handlers.append(file_handler)
     except OSError:
         # If we can't create the log directory or file, continue without file logging.
         pass
 
-    logging.basicConfig(
-        level=_resolve_log_level(level_name),
-        handlers=handlers,
-        force=True,
-    )
+    key = (level, None if log_file is None else str(log_file), sys.stdout)
+    if _last_logging_cfg is not None:
+        last_key, installed = _last_logging_cfg
+        root_handlers = logging.getLogger().handlers
+        if last_key == key and all(h in root_handlers for h in installed):
+            return
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(_STREAM_FORMATTER)
+    handlers: list[logging.Handler] = [stream_handler]
+    if log_file is not None:
+        try:
+            # delay=True: the log file is only created once something is logged
+            file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
+        except OSError:
+            pass
+        else:
+            file_handler.setFormatter(_FILE_FORMATTER)
+            handlers.append(_BufferedFileHandler(file_handler))
+
+    # force=True closes the previous root handlers (and their log files)
+    logging.basicConfig(level=level, handlers=handlers, force=True)
+    _last_logging_cfg = (key, handlers)
+
+
+# Subcommand arguments as data: each entry is (flag, add_argument kwargs).
+_ArgSpec = tuple[str, dict[str, Any]]
+
+_CONFIG_ARG: _ArgSpec = (
+    "--config",
+    {"help": "Path to configuration file (overrides default location)"},
+)
+_INSTANCE_ID_ARG: _ArgSpec = (
+    "--instance-id",
+    {"help": "Instance identifier for isolated data/log directories"},
+)
+_DEVICE_ID_ARG: _ArgSpec = (
+    "--device-id",
+    {"help": "RTL-SDR device serial number or index"},
+)
+_JSON_DIAGNOSTICS_ARG: _ArgSpec = (
+    "--json",
+    {"action": "store_true", "help": "Emit diagnostics in JSON format"},
+)
+_PRETTY_ARG: _ArgSpec = (
+    "--pretty",
+    {"action": "store_true", "help": "Indent JSON output for reading"},
+)
+_VERBOSE_ARG: _ArgSpec = (
+    "--verbose",
+    {"action": "store_true", "help": "Show extended diagnostic information"},
+)
+_APRS_LISTEN_ARGS: list[_ArgSpec] = [
+    _CONFIG_ARG,
+    (
+        "--once",
+        {
+            "action": "store_true",
+            "help": "Process a single batch of samples and exit (debug/testing)",
+        },
+    ),
+    (
+        "--no-aprsis",
+        {"action": "store_true", "help": "Disable APRS-IS uplink (receive-only mode)"},
+    ),
+]
+_SETUP_ARGS: list[_ArgSpec] = [
+    (
+        "--reset",
+        {
+            "action": "store_true",
+            "help": "Delete existing configuration before starting",
+        },
+    ),
+    (
+        "--non-interactive",
+        {
+            "action": "store_true",
+            "help": "Load answers from a config file instead of prompting",
+        },
+    ),
+    ("--config", {"help": "Path to onboarding configuration template"}),
+    (
+        "--dry-run",
+        {"action": "store_true", "help": "Run validation without writing any files"},
+    ),
+]
+_DIAGNOSTICS_ARGS: list[_ArgSpec] = [_CONFIG_ARG, _JSON_DIAGNOSTICS_ARG, _VERBOSE_ARG]
+
+# Subcommand tree in help order. Leaf commands carry "args"; namespaced ones
+# carry the "dest" for their nested subcommand and the nested "commands".
+_SUBPARSER_SPEC: dict[str, dict[str, Any]] = {
+    # Legacy top-level commands (for backward compatibility)
+    "listen": {
+        "help": "Run the SDR capture and APRS iGate pipeline",
+        "args": _APRS_LISTEN_ARGS,
+    },
+    "setup": {"help": "Run the onboarding wizard", "args": _SETUP_ARGS},
+    "diagnostics": {
+        "help": "Display system and radio health checks",
+        "args": _DIAGNOSTICS_ARGS,
+    },
+    "aprs": {
+        "help": "APRS iGate commands",
+        "dest": "aprs_command",
+        "commands": {
+            "listen": {
+                "help": "Run the SDR capture and APRS iGate pipeline",
+                "args": [*_APRS_LISTEN_ARGS, _INSTANCE_ID_ARG, _DEVICE_ID_ARG],
+            },
+            "setup": {"help": "Run the APRS onboarding wizard", "args": _SETUP_ARGS},
+            "diagnostics": {
+                "help": "Display APRS system and radio health checks",
+                "args": _DIAGNOSTICS_ARGS,
+            },
+        },
+    },
+    "wspr": {
+        "help": "WSPR monitoring commands",
+        "dest": "wspr_command",
+        "commands": {
+            "listen": {
+                "help": "Run WSPR monitoring listener",
+                "args": [
+                    _CONFIG_ARG,
+                    (
+                        "--band",
+                        {
+                            "help": "Monitor a single band "
+                            "(80m, 40m, 30m, 20m, 10m, 6m, 2m, 70cm)"
+                        },
+                    ),
+                    (
+                        "--realtime",
+                        {
+                            "action": "store_true",
+                            "help": "Run the capture thread with SCHED_FIFO "
+                            "priority (needs CAP_SYS_NICE)",
+                        },
+                    ),
+                    _INSTANCE_ID_ARG,
+                    _DEVICE_ID_ARG,
+                ],
+            },
+            "scan": {
+                "help": "Multi-band WSPR scan",
+                "args": [_CONFIG_ARG, _INSTANCE_ID_ARG, _DEVICE_ID_ARG],
+            },
+            "calibrate": {
+                "help": "Calibrate frequency correction",
+                "args": [
+                    _CONFIG_ARG,
+                    ("--samples", {"help": "Path to IQ sample file for calibration"}),
+                    (
+                        "--tail",
+                        {
+                            "type": int,
+                            "help": "Only use the most recent N spots from the file",
+                        },
+                    ),
+                    _DEVICE_ID_ARG,
+                ],
+            },
+            "upload": {
+                "help": "Upload queued WSPR spots to WSPRnet",
+                "args": [
+                    _CONFIG_ARG,
+                    (
+                        "--heartbeat",
+                        {
+                            "action": "store_true",
+                            "help": "Send heartbeat ping when queue is empty",
+                        },
+                    ),
+                    (
+                        "--json",
+                        {
+                            "action": "store_true",
+                            "help": "Output upload results in JSON format",
+                        },
+                    ),
+                    _PRETTY_ARG,
+                    _INSTANCE_ID_ARG,
+                ],
+            },
+            "diagnostics": {
+                "help": "Display WSPR system and radio health checks",
+                "args": [
+                    _CONFIG_ARG,
+                    _JSON_DIAGNOSTICS_ARG,
+                    _PRETTY_ARG,
+                    _VERBOSE_ARG,
+                    (
+                        "--band",
+                        {
+                            "help": "Test specific band "
+                            "(80m, 40m, 30m, 20m, 10m, 6m, 2m, 70cm)"
+                        },
+                    ),
+                ],
+            },
+        },
+    },
+}
+
+
+def _register(
+    subparsers: Any,
+    subparser_map: dict[str, argparse.ArgumentParser],
+    name: str,
+    spec: dict[str, Any],
+    prefix: str = "",
+) -> None:
+    """Add the ``name`` subcommand described by ``spec`` (recursively)."""
+    sub = subparsers.add_parser(name, help=spec["help"])
+    for flag, kwargs in spec.get("args", ()):
+        sub.add_argument(flag, **kwargs)
+    commands = spec.get("commands")
+    if commands is None:
+        subparser_map[prefix + name] = sub
+        return
+    nested = sub.add_subparsers(dest=spec["dest"], required=True)
+    for child, child_spec in commands.items():
+        _register(nested, subparser_map, child, child_spec, f"{name}:")
+
+
+# Subcommand builders in help order; aprs/wspr only when installed.
+_SUBCOMMAND_AVAILABLE = {"aprs": _HAS_APRS_COMMANDS, "wspr": _HAS_WSPR_COMMANDS}
+_SUBCOMMAND_BUILDERS: dict[str, SubparserBuilder] = {
+    name: functools.partial(_register, name=name, spec=spec)
+    for name, spec in _SUBPARSER_SPEC.items()
+    if _SUBCOMMAND_AVAILABLE.get(name, True)
+}
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -139,335 +421,73 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"neo-rx {_package_version()}",
+        action="store_true",
         help="Show package version and exit",
     )
     subparsers = parser.add_subparsers(dest="command", required=False)
-    subparser_map: Dict[str, argparse.ArgumentParser] = {}
-
-    # Legacy top-level commands (for backward compatibility)
-    listen_parser = subparsers.add_parser(
-        "listen", help="Run the SDR capture and APRS iGate pipeline"
-    )
-    listen_parser.add_argument(
-        "--config",
-        help="Path to configuration file (overrides default location)",
-    )
-    listen_parser.add_argument(
-        "--once",
-        action="store_true",
-        help="Process a single batch of samples and exit (debug/testing)",
-    )
-    listen_parser.add_argument(
-        "--no-aprsis",
-        action="store_true",
-        help="Disable APRS-IS uplink (receive-only mode)",
-    )
-    subparser_map["listen"] = listen_parser
-
-    setup_parser = subparsers.add_parser("setup", help="Run the onboarding wizard")
-    setup_parser.add_argument(
-        "--reset",
-        action="store_true",
-        help="Delete existing configuration before starting",
-    )
-    setup_parser.add_argument(
-        "--non-interactive",
-        action="store_true",
-        help="Load answers from a config file instead of prompting",
-    )
-    setup_parser.add_argument(
-        "--config",
-        help="Path to onboarding configuration template",
-    )
-    setup_parser.add_argument(
-        "--dry-run",
-        action="store_true",
-        help="Run validation without writing any files",
-    )
-    subparser_map["setup"] = setup_parser
-
-    diagnostics_parser = subparsers.add_parser(
-        "diagnostics", help="Display system and radio health checks"
-    )
-    diagnostics_parser.add_argument(
-        "--config",
-        help="Path to configuration file (overrides default location)",
-    )
-    diagnostics_parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Emit diagnostics in JSON format",
-    )
-    diagnostics_parser.add_argument(
-        "--verbose",
-        action="store_true",
-        help="Show extended diagnostic information",
-    )
-    subparser_map["diagnostics"] = diagnostics_parser
-
-    # APRS namespaced commands
-    if aprs_listen is not None:
-        aprs_parser = subparsers.add_parser("aprs", help="APRS iGate commands")
-        aprs_subparsers = aprs_parser.add_subparsers(dest="aprs_command", required=True)
-
-        aprs_listen_parser = aprs_subparsers.add_parser(
-            "listen", help="Run the SDR capture and APRS iGate pipeline"
-        )
-        aprs_listen_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        aprs_listen_parser.add_argument(
-            "--once",
-            action="store_true",
-            help="Process a single batch of samples and exit (debug/testing)",
-        )
-        aprs_listen_parser.add_argument(
-            "--no-aprsis",
-            action="store_true",
-            help="Disable APRS-IS uplink (receive-only mode)",
-        )
-        aprs_listen_parser.add_argument(
-            "--instance-id",
-            help="Instance identifier for isolated data/log directories",
-        )
-        aprs_listen_parser.add_argument(
-            "--device-id",
-            help="RTL-SDR device serial number or index",
-        )
-        subparser_map["aprs:listen"] = aprs_listen_parser
+    subparser_map: dict[str, argparse.ArgumentParser] = {}
+    for builder in _SUBCOMMAND_BUILDERS.values():
+        builder(subparsers, subparser_map)
 
-        aprs_setup_parser = aprs_subparsers.add_parser(
-            "setup", help="Run the APRS onboarding wizard"
-        )
-        aprs_setup_parser.add_argument(
-            "--reset",
-            action="store_true",
-            help="Delete existing configuration before starting",
-        )
-        aprs_setup_parser.add_argument(
-            "--non-interactive",
-            action="store_true",
-            help="Load answers from a config file instead of prompting",
-        )
-        aprs_setup_parser.add_argument(
-            "--config",
-            help="Path to onboarding configuration template",
-        )
-        aprs_setup_parser.add_argument(
-            "--dry-run",
-            action="store_true",
-            help="Run validation without writing any files",
-        )
-        subparser_map["aprs:setup"] = aprs_setup_parser
-
-        aprs_diagnostics_parser = aprs_subparsers.add_parser(
-            "diagnostics", help="Display APRS system and radio health checks"
-        )
-        aprs_diagnostics_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        aprs_diagnostics_parser.add_argument(
-            "--json",
-            action="store_true",
-            help="Emit diagnostics in JSON format",
-        )
-        aprs_diagnostics_parser.add_argument(
-            "--verbose",
-            action="store_true",
-            help="Show extended diagnostic information",
-        )
-        subparser_map["aprs:diagnostics"] = aprs_diagnostics_parser
-
-    # WSPR namespaced commands
-    if wspr_listen is not None:
-        wspr_parser = subparsers.add_parser("wspr", help="WSPR monitoring commands")
-        wspr_subparsers = wspr_parser.add_subparsers(dest="wspr_command", required=True)
+    setattr(parser, "_nesdr_subparser_map", subparser_map)
 
-        wspr_listen_parser = wspr_subparsers.add_parser(
-            "listen", help="Run WSPR monitoring listener"
-        )
-        wspr_listen_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        wspr_listen_parser.add_argument(
-            "--band",
-            help="Monitor a single band (80m, 40m, 30m, 20m, 10m, 6m, 2m, 70cm)",
-        )
-        wspr_listen_parser.add_argument(
-            "--instance-id",
-            help="Instance identifier for isolated data/log directories",
-        )
-        wspr_listen_parser.add_argument(
-            "--device-id",
-            help="RTL-SDR device serial number or index",
-        )
-        subparser_map["wspr:listen"] = wspr_listen_parser
+    return parser
 
-        wspr_scan_parser = wspr_subparsers.add_parser(
-            "scan", help="Multi-band WSPR scan"
-        )
-        wspr_scan_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        wspr_scan_parser.add_argument(
-            "--instance-id",
-            help="Instance identifier for isolated data/log directories",
-        )
-        wspr_scan_parser.add_argument(
-            "--device-id",
-            help="RTL-SDR device serial number or index",
-        )
-        subparser_map["wspr:scan"] = wspr_scan_parser
 
-        wspr_calibrate_parser = wspr_subparsers.add_parser(
-            "calibrate", help="Calibrate frequency correction"
-        )
-        wspr_calibrate_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        wspr_calibrate_parser.add_argument(
-            "--samples",
-            help="Path to IQ sample file for calibration",
-        )
-        wspr_calibrate_parser.add_argument(
-            "--device-id",
-            help="RTL-SDR device serial number or index",
-        )
-        subparser_map["wspr:calibrate"] = wspr_calibrate_parser
+# One parser per process: argparse keeps no per-parse state on the parser, so
+# repeated in-process main() calls reuse it.
+_PARSER: argparse.ArgumentParser | None = None
 
-        wspr_upload_parser = wspr_subparsers.add_parser(
-            "upload", help="Upload queued WSPR spots to WSPRnet"
-        )
-        wspr_upload_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        wspr_upload_parser.add_argument(
-            "--heartbeat",
-            action="store_true",
-            help="Send heartbeat ping when queue is empty",
-        )
-        wspr_upload_parser.add_argument(
-            "--json",
-            action="store_true",
-            help="Output upload results in JSON format",
-        )
-        wspr_upload_parser.add_argument(
-            "--instance-id",
-            help="Instance identifier for isolated data/log directories",
-        )
-        subparser_map["wspr:upload"] = wspr_upload_parser
 
-        wspr_diagnostics_parser = wspr_subparsers.add_parser(
-            "diagnostics", help="Display WSPR system and radio health checks"
-        )
-        wspr_diagnostics_parser.add_argument(
-            "--config",
-            help="Path to configuration file (overrides default location)",
-        )
-        wspr_diagnostics_parser.add_argument(
-            "--json",
-            action="store_true",
-            help="Emit diagnostics in JSON format",
-        )
-        wspr_diagnostics_parser.add_argument(
-            "--verbose",
-            action="store_true",
-            help="Show extended diagnostic information",
-        )
-        wspr_diagnostics_parser.add_argument(
-            "--band",
-            help="Test specific band (80m, 40m, 30m, 20m, 10m, 6m, 2m, 70cm)",
-        )
-        subparser_map["wspr:diagnostics"] = wspr_diagnostics_parser
+def _get_parser() -> argparse.ArgumentParser:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = build_parser()
+    return _PARSER
 
-    setattr(parser, "_nesdr_subparser_map", subparser_map)
 
-    return parser
+def _reset_parser_cache() -> None:
+    """Drop the cached parser so the next main() call builds a fresh one."""
+    global _PARSER
+    _PARSER = None
 
 
 def main(argv: list[str] | None = None) -> int:
     """Process CLI arguments and dispatch to the requested command."""
-    parser = build_parser()
-    args, remainder = parser.parse_known_args(argv)
-
-    if getattr(args, "version", False):
-        print(f"{parser.prog} {_package_version()}")
-        return 0
-
-    _configure_logging(getattr(args, "log_level", None))
-
-    # Legacy top-level handlers (backward compatibility)
-    handlers: dict[str, CommandHandler] = {
-        "listen": run_listen,
-        "setup": run_setup,
-        "diagnostics": run_diagnostics,
-    }
-
-    # Namespaced APRS handlers
-    aprs_handlers: dict[str, CommandHandler] = {}
-    if aprs_listen is not None:
-        aprs_handlers = {
-            "listen": aprs_listen,
-            "setup": aprs_setup,
-            "diagnostics": aprs_diagnostics,
-        }
-
-    # Namespaced WSPR handlers
-    wspr_handlers: dict[str, CommandHandler] = {}
-    if wspr_listen is not None:
-        wspr_handlers = {
-            "listen": wspr_listen,
-            "scan": wspr_scan,
-            "calibrate": wspr_calibrate,
-            "upload": wspr_upload,
-            "diagnostics": wspr_diagnostics,
-        }
-
-    # Handle namespaced aprs commands
-    if args.command == "aprs":
-        aprs_command = getattr(args, "aprs_command", None)
-        if aprs_command is None:
-            parser.error("aprs: command required")
-        # Detect leftover unknown arguments from initial parse
-        if remainder:
-            parser.error("unrecognized arguments: " + " ".join(remainder))
-        handler = aprs_handlers.get(aprs_command)
-        if handler is None:
-            parser.error(f"aprs: unknown command: {aprs_command}")
-        return handler(args)
-
-    # Handle namespaced wspr commands
-    if args.command == "wspr":
-        wspr_command = getattr(args, "wspr_command", None)
-        if wspr_command is None:
-            parser.error("wspr: command required")
-        if remainder:
-            parser.error("unrecognized arguments: " + " ".join(remainder))
-        handler = wspr_handlers.get(wspr_command)
-        if handler is None:
-            parser.error(f"wspr: unknown command: {wspr_command}")
-        return handler(args)
-
-    # Require an explicit command; no silent default behavior
+    if argv is None:
+        argv = sys.argv[1:]
+    parser = _get_parser()
+    # parse_args rejects leftover arguments itself ("unrecognized arguments")
+    args = parser.parse_args(argv)
+
+    if args.version:
+        # Handled here rather than by argparse's version action so building
+        # the parser never resolves or formats the version.
+        print(f"neo-rx {_package_version()}")
+        parser.exit()
+
+    # Require an explicit command; no silent default behavior. Checked before
+    # logging is configured so usage errors never touch the data directory.
     if args.command is None:
         parser.error("command required")
 
-    if remainder:
-        parser.error(f"Unknown arguments: {' '.join(remainder)}")
+    _configure_logging(args.log_level)
 
-    # Handle legacy top-level commands
-    handler = handlers.get(args.command)
-    if handler is None:  # pragma: no cover - future safeguard
-        parser.error(f"Unknown command: {args.command}")
+    command = args.command
+    if command == "aprs":
+        subcommand = args.aprs_command
+    elif command == "wspr":
+        subcommand = args.wspr_command
+    else:
+        subcommand = None
 
+    try:
+        module_name, handler_name = _COMMAND_HANDLERS[command, subcommand]
+    except KeyError:  # pragma: no cover - argparse rejects unknown commands
+        parser.error(f"Unknown command: {command}")
+    handler: CommandHandler = getattr(
+        importlib.import_module(module_name), handler_name
+    )
     return handler(args)
 
 
@@ -1,8 +1,39 @@
 """CLI command handlers."""
 
-from .diagnostics import run_diagnostics
-from .listen import run_listen
-from .setup import run_setup
-from . import setup_io  # re-export helper module for lint visibility
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import setup_io
+    from .diagnostics import run_diagnostics
+    from .listen import run_listen
+    from .setup import run_setup
 
 __all__ = ["run_setup", "run_listen", "run_diagnostics", "setup_io"]
+
+# Handlers and helper modules load on first attribute access (PEP 562); each
+# handler shim in turn defers importing its neo_aprs implementation.
+_LAZY_EXPORTS = {
+    "run_setup": "setup",
+    "run_listen": "listen",
+    "run_diagnostics": "diagnostics",
+    "setup_io": None,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        submodule = _LAZY_EXPORTS[name]
+        if submodule is None:
+            value = importlib.import_module(f".{name}", __name__)
+        else:
+            module = importlib.import_module(f".{submodule}", __name__)
+            value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,6 +3,20 @@
 This module re-exports from neo_aprs.commands to maintain backward compatibility.
 """
 
-from neo_aprs.commands.setup import run_setup
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from neo_aprs.commands.setup import run_setup
 
 __all__ = ["run_setup"]
+
+
+def __getattr__(name: str):
+    # Resolved on first access (PEP 562) so the shim does not load neo_aprs
+    if name in __all__:
+        import importlib
+
+        value = getattr(importlib.import_module("neo_aprs.commands.setup"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,27 +4,30 @@ This module re-exports the configuration implementation from neo_core.config
 to maintain backward compatibility during the multi-package migration.
 """
 
-from neo_core.config import (
-    StationConfig,
-    load_config,
-    save_config,
-    resolve_config_path,
-    get_config_dir,
-    get_data_dir,
-    get_mode_data_dir,
-    get_logs_dir,
-    get_wspr_runs_dir,
-    config_summary,
-    keyring_supported,
-    store_passcode_in_keyring,
-    delete_passcode_from_keyring,
-    CONFIG_VERSION,
-    CONFIG_ENV_VAR,
-    CONFIG_DIR_NAME,
-    CONFIG_FILENAME,
-    KEYRING_SERVICE,
-    KEYRING_SENTINEL,
-)
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # static view of the lazily resolved names below
+    from neo_core.config import (
+        StationConfig,
+        load_config,
+        save_config,
+        resolve_config_path,
+        get_config_dir,
+        get_data_dir,
+        get_mode_data_dir,
+        get_logs_dir,
+        get_wspr_runs_dir,
+        config_summary,
+        keyring_supported,
+        store_passcode_in_keyring,
+        delete_passcode_from_keyring,
+        CONFIG_VERSION,
+        CONFIG_ENV_VAR,
+        CONFIG_DIR_NAME,
+        CONFIG_FILENAME,
+        KEYRING_SERVICE,
+        KEYRING_SENTINEL,
+    )
 
 __all__ = [
     "StationConfig",
@@ -47,3 +50,20 @@ __all__ = [
     "KEYRING_SERVICE",
     "KEYRING_SENTINEL",
 ]
+
+# Names resolve from neo_core.config on first access (PEP 562), so importing
+# this shim (e.g. via the CLI) does not load the config stack up front.
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        import importlib
+
+        value = getattr(importlib.import_module("neo_core.config"), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
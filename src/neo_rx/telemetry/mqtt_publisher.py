@@ -11,11 +11,9 @@ from neo_telemetry.mqtt_publisher import MqttPublisher  # re-export
 # Expose time so tests can monkeypatch sleep
 import time  # noqa: F401
 
-# Expose mqtt client namespace to allow monkeypatching Client in tests
-try:  # pragma: no cover - optional dependency
-    import paho.mqtt.client as mqtt  # type: ignore[import]
-except Exception:
-    mqtt = None  # type: ignore[assignment]
+# Expose mqtt client namespace to allow monkeypatching Client in tests. Left
+# unset by default; the implementation imports paho lazily when needed.
+mqtt = None
 
 # Ensure underlying implementation sees our exposed monkeypatch targets
 _impl.time = time  # type: ignore[assignment]
@@ -6,6 +6,7 @@ from neo_wspr.wspr.decoder import *  # noqa: F401,F403
 import io
 import logging
 import os
+import re
 import shutil
 import subprocess
 import tempfile
@@ -14,8 +15,21 @@ from typing import Iterator, List
 
 LOG = logging.getLogger(__name__)
 
+# One wsprd output line; compiled once rather than per parsed line.
+_LINE_RE = re.compile(
+    r"(?P<date>\d{4}-\d{2}-\d{2})\s+"
+    r"(?P<time>\d{2}:\d{2}:\d{2})\s+"
+    r"(?P<freq>\d+)\s+"
+    r"(?P<call>\S+)\s+"
+    r"(?P<grid>\S+)\s+"
+    r"(?P<snr>-?\d+)(?:\s+(?P<drift>[-+]?\d+(?:\.\d+)?))?"
+)
+
 
 class WsprDecoder:
+    # Shared by every instance and subclass; override with one assignment.
+    _LINE_RE = _LINE_RE
+
     def __init__(self, options: dict | None = None) -> None:
         self.options = options or {}
         self.wsprd_path = self._find_wsprd()
@@ -42,39 +56,25 @@ class WsprDecoder:
         differences in upstream decoder output while providing a stable
         structure for tests.
         """
-        import re
-
         line = line.strip()
-        if not line:
+        # Spot lines start with the date; reject anything else before the regex
+        if not line or not line[0].isdigit():
             return None
 
-        pattern = re.compile(
-            r"(?P<date>\d{4}-\d{2}-\d{2})\s+"
-            r"(?P<time>\d{2}:\d{2}:\d{2})\s+"
-            r"(?P<freq>\d+)\s+"
-            r"(?P<call>\S+)\s+"
-            r"(?P<grid>\S+)\s+"
-            r"(?P<snr>-?\d+)(?:\s+(?P<drift>[-+]?\d+(?:\.\d+)?))?"
-        )
-        m = pattern.match(line)
+        m = self._LINE_RE.match(line)
         if not m:
             LOG.debug("Unrecognized wsprd line: %s", line)
             return None
 
-        gd = m.groupdict()
-        ts = f"{gd['date']}T{gd['time']}Z"
-        try:
-            freq_hz = int(gd["freq"])
-        except (TypeError, ValueError):
-            freq_hz = 0
-
+        # Unpack positionally; the pattern guarantees freq/snr are digit runs
+        date, clock, freq, call, grid, snr, drift = m.groups()
         spot = {
-            "timestamp": ts,
-            "freq_hz": freq_hz,
-            "call": gd.get("call"),
-            "grid": gd.get("grid"),
-            "snr_db": int(gd["snr"]),
-            "drift": float(gd["drift"]) if gd.get("drift") else None,
+            "timestamp": f"{date}T{clock}Z",
+            "freq_hz": int(freq),
+            "call": call,
+            "grid": grid,
+            "snr_db": int(snr),
+            "drift": float(drift) if drift else None,
         }
         return spot
 
@@ -7,6 +7,8 @@ import logging
 from typing import Dict, Iterable
 from statistics import median
 
+from neo_wspr.wspr.diagnostics import NOMINAL_CENTERS_HZ
+
 LOG = logging.getLogger(__name__)
 
 
@@ -26,18 +28,6 @@ def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, ob
     """
     LOG.debug("Running upconverter detection heuristic")
 
-    # Common nominal WSPR frequencies (Hz) for heuristic matching
-    nominal_centers = [
-        3_572_000,  # 80m
-        5_290_000,  # 60m
-        7_040_000,  # 40m
-        10_140_000,  # 30m
-        14_080_000,  # 20m
-        18_110_000,  # 17m
-        21_080_000,  # 15m
-        28_080_000,  # 10m
-    ]
-
     if not spots:
         return {"confidence": 0.0, "recommended_lo_offset_hz": None}
 
@@ -61,7 +51,7 @@ def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, ob
 
     med_freq = median(freqs)
     # Find nearest nominal center
-    nearest = min(nominal_centers, key=lambda c: abs(c - med_freq))
+    nearest = min(NOMINAL_CENTERS_HZ, key=lambda c: abs(c - med_freq))
     freq_offset = med_freq - nearest
 
     # Heuristic thresholds: if offset > 50 kHz, this may indicate an upconverter
@@ -2,26 +2,29 @@
 
 This module provides a concrete Publisher suitable for lightweight
 dashboarding and message-bus publication. The import of `paho.mqtt.client`
-is optional; the module will raise ImportError at construction time if the
-dependency is missing. This keeps the core project free of hard dependency
-unless MQTT is used.
+is optional and deferred until a publisher is constructed; the module will
+raise ImportError at construction time if the dependency is missing. This
+keeps the core project free of hard dependency unless MQTT is used.
 """
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import queue
+import threading
 from typing import Any, Optional
 from pathlib import Path
 import random
 import time as _time
 
+from neo_core import jsonio
+
 from .ondisk_queue import OnDiskQueue
 
-try:
-    import paho.mqtt.client as mqtt  # type: ignore[import]
-except Exception:  # pragma: no cover - optional dependency
-    mqtt = None  # type: ignore[assignment]
+# paho-mqtt is imported on first use (see _lazy_mqtt) so CLI paths that
+# never construct a publisher do not pay for loading it.
+mqtt: Any = None
 
 # Allow tests to monkeypatch via neo_rx.telemetry.mqtt_publisher
 try:  # pragma: no cover - shim may not be present
@@ -33,6 +36,40 @@ except Exception:
 LOG = logging.getLogger(__name__)
 
 
+def _lazy_mqtt() -> Any:
+    """Import ``paho.mqtt.client`` on first call; ``None`` if unavailable."""
+    global mqtt
+    if mqtt is None:
+        try:
+            import paho.mqtt.client as mqtt_mod  # type: ignore[import]
+        except Exception:  # pragma: no cover - optional dependency
+            return None
+        mqtt = mqtt_mod
+    return mqtt
+
+
+# Pending messages handed from publish() to the buffer writer thread, and the
+# most the writer persists per wake-up.
+WRITE_QUEUE_SIZE = 4096
+WRITE_BATCH_SIZE = 256
+
+_STOP_WRITER = object()
+# Wakes the writer after on_connect asked it to drain the on-disk queue.
+_DRAIN = object()
+
+# Default on-disk buffer location (XDG_STATE_HOME or ~/.local/state), resolved
+# once at import rather than per publisher.
+DEFAULT_BUFFER_DIR = (
+    Path(os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state")
+    / "neo_rx"
+    / "mqtt"
+)
+
+# paho's MQTT_ERR_SUCCESS; publish() reports queue-full/no-connection via the
+# returned MQTTMessageInfo.rc rather than raising.
+_MQTT_ERR_SUCCESS = 0
+
+
 class MqttPublisher:
     def __init__(
         self,
@@ -41,7 +78,7 @@ class MqttPublisher:
         buffer_dir: Optional[Path] = None,
         max_buffer_size: int = 10000,
     ) -> None:
-        client_ns = getattr(shim, "mqtt", None) or mqtt
+        client_ns = getattr(shim, "mqtt", None) or _lazy_mqtt()
         time_ns = getattr(shim, "time", None) or _time
         if client_ns is None:
             raise ImportError("paho-mqtt is required for MqttPublisher")
@@ -61,32 +98,76 @@ class MqttPublisher:
         self._max_backoff = 30.0  # seconds
 
         # on-disk FIFO queue (durable)
-        self._buffer_dir = buffer_dir or self._default_buffer_dir()
+        self._buffer_dir = buffer_dir or DEFAULT_BUFFER_DIR
         self._queue_dir = self._buffer_dir / "queue"
         self._max_buffer_size = max_buffer_size
         self._queue = OnDiskQueue(self._queue_dir)
         # ensure on-disk queue directory exists
         self._ensure_buffer_dir()
+        # Track the queue depth in memory so enqueueing does not rescan the
+        # queue directory for every message; counted once here and resynced
+        # after each drain. Guarded by _count_lock.
+        self._queued_count = self._queue.size()
+        self._count_lock = threading.Lock()
+        # Set by on_connect; the writer thread drains the queue after landing
+        # whatever writes are pending, keeping disk I/O off paho's thread.
+        self._drain_requested = threading.Event()
+        # Disk writes for buffered messages happen on a writer thread so a
+        # disconnected broker never stalls the publishing (capture) thread on
+        # filesystem latency. The thread starts on first use.
+        self._write_q: queue.Queue[Any] = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        # Set by on_connect, cleared by on_disconnect; lets callers block on
+        # the (otherwise asynchronous) connection when they need to.
+        self._connected_event = threading.Event()
 
     def connect(self) -> None:
+        """Start connecting to the broker.
+
+        With paho's ``connect_async`` the TCP/CONNACK handshake and any
+        reconnects run on the network thread, so this returns immediately
+        even when the broker is unreachable; messages published meanwhile
+        are buffered to disk and drained from ``on_connect``. Clients without
+        ``connect_async`` fall back to a blocking connect with backoff.
+        """
         LOG.debug("Connecting to MQTT broker %s:%s", self._host, self._port)
-        # Start network loop first so on_connect can fire during connect
+        connect_async = getattr(self._client, "connect_async", None)
+        if connect_async is not None:
+            reconnect_delay_set = getattr(self._client, "reconnect_delay_set", None)
+            if reconnect_delay_set is not None:
+                reconnect_delay_set(
+                    min_delay=max(1, int(self._initial_backoff)),
+                    max_delay=max(1, int(self._max_backoff)),
+                )
+            # Queue the connection before starting the network thread so the
+            # thread picks it up (and retries it) on its first pass.
+            connect_async(self._host, self._port)
+        # on_connect fires from the network loop, so start it before any
+        # blocking connect below
         try:
             self._client.loop_start()
         except Exception:
             LOG.exception("Failed to start MQTT network loop")
-        # Attempt connect with backoff, relying on on_connect to set state
-        self._attempt_connect()
+        if connect_async is None:
+            # Attempt connect with backoff, relying on on_connect to set state
+            self._attempt_connect()
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        """Block until the broker connection is up; return False on timeout."""
+        return self._connected_event.wait(timeout)
 
     def publish(self, topic: str, payload: dict) -> None:
-        body = json.dumps(payload, default=str)
-        LOG.debug("Publishing to %s: %s", topic, body)
+        # Encode straight to bytes (orjson when available); paho sends bytes
+        # as-is, so there is no str -> utf-8 round trip on the hot path.
+        body = jsonio.dumps(payload)
+        LOG.debug("Publishing to %s: %s", topic, payload)
         # ensure we are connected (attempt reconnect with backoff if needed)
         if not self._connected:
             LOG.warning(
                 "MQTT client not connected; enqueueing message to on-disk queue"
             )
-            self._enqueue_message(topic, body)
+            self._buffer_message(topic, body)
             return
 
         try:
@@ -99,9 +180,14 @@ class MqttPublisher:
             except Exception:
                 LOG.exception("Publish retry failed; buffering message")
                 # enqueue to durable queue on failure
-                self._enqueue_message(topic, body)
+                self._buffer_message(topic, body)
+
+    def flush(self) -> None:
+        """Block until messages handed to the buffer writer are on disk."""
+        self._write_q.join()
 
     def close(self) -> None:
+        self._stop_writer()
         try:
             try:
                 self._client.loop_stop()
@@ -117,8 +203,8 @@ class MqttPublisher:
         if rc == 0:
             LOG.info("MQTT connected to %s:%s", self._host, self._port)
             self._connected = True
-            # drain buffer on successful connection
-            self._drain_buffer()
+            self._connected_event.set()
+            self._request_drain()
         else:
             LOG.warning("MQTT connect returned rc=%s", rc)
 
@@ -127,6 +213,7 @@ class MqttPublisher:
     ) -> None:  # pragma: no cover - callback
         LOG.info("MQTT disconnected (rc=%s)", rc)
         self._connected = False
+        self._connected_event.clear()
 
     def _attempt_connect(self) -> None:
         """Attempt to connect using exponential backoff. Raises on failure."""
@@ -155,16 +242,6 @@ class MqttPublisher:
                 self._time.sleep(sleep_for)
                 backoff = min(self._max_backoff, backoff * 2)
 
-    def _default_buffer_dir(self) -> Path:
-        """Return default buffer directory using XDG_STATE_HOME or fallback."""
-        import os
-
-        xdg_state = os.environ.get("XDG_STATE_HOME")
-        if xdg_state:
-            return Path(xdg_state) / "neo_rx" / "mqtt"
-        home = Path.home()
-        return home / ".local" / "state" / "neo_rx" / "mqtt"
-
     def _ensure_buffer_dir(self) -> None:
         """Ensure buffer directory exists."""
         try:
@@ -173,24 +250,120 @@ class MqttPublisher:
         except Exception:
             LOG.exception("Failed to create buffer directory %s", self._buffer_dir)
 
-    def _enqueue_message(self, topic: str, body: str) -> None:
+    def _buffer_message(self, topic: str, body: bytes | str) -> None:
+        """Hand a message to the writer thread without touching the disk."""
+        self._ensure_writer()
+        item = (topic, body, self._time.time())
         try:
-            if self._queue.size() >= self._max_buffer_size:
-                LOG.warning(
-                    "MQTT queue at capacity (%d messages); dropping oldest",
-                    self._max_buffer_size,
+            self._write_q.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        # Writer is behind; drop the oldest pending message to make room.
+        try:
+            self._write_q.get_nowait()
+            self._write_q.task_done()
+            LOG.warning("MQTT buffer writer backlog full; dropping oldest message")
+        except queue.Empty:
+            pass
+        try:
+            self._write_q.put_nowait(item)
+        except queue.Full:
+            LOG.warning("MQTT buffer writer backlog full; dropping message")
+
+    def _request_drain(self) -> None:
+        """Ask the writer thread to drain the on-disk queue; never blocks."""
+        self._drain_requested.set()
+        self._ensure_writer()
+        try:
+            self._write_q.put_nowait(_DRAIN)
+        except queue.Full:
+            # The writer has a backlog and checks the flag after each batch.
+            pass
+
+    def _ensure_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="mqtt-buffer-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _stop_writer(self) -> None:
+        with self._writer_lock:
+            writer = self._writer
+            self._writer = None
+        if writer is None or not writer.is_alive():
+            return
+        try:
+            self._write_q.put(_STOP_WRITER, timeout=1.0)
+        except queue.Full:
+            LOG.warning("MQTT buffer writer backlog full at close")
+            return
+        writer.join(timeout=5.0)
+        if writer.is_alive():
+            LOG.warning("MQTT buffer writer did not stop cleanly")
+
+    def _writer_loop(self) -> None:
+        while True:
+            batch = [self._write_q.get()]
+            while len(batch) < WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._write_q.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP_WRITER in batch
+            try:
+                self._enqueue_messages(
+                    [
+                        item
+                        for item in batch
+                        if item is not _STOP_WRITER and item is not _DRAIN
+                    ]
                 )
-                # remove oldest file to make room
-                files = self._queue.list()
-                if files:
-                    try:
-                        self._queue.remove(files[0])
-                    except Exception:
-                        LOG.exception("Failed to drop oldest queued message")
-            record = {"topic": topic, "body": body, "ts": self._time.time()}
-            self._queue.enqueue(record)
+                # Pending writes are on disk now, so they drain with the rest.
+                if self._drain_requested.is_set() and self._connected:
+                    self._drain_requested.clear()
+                    self._drain_buffer()
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+            if stop:
+                return
+
+    def _enqueue_messages(
+        self, items: list[tuple[str, bytes | str, float | None]]
+    ) -> None:
+        if not items:
+            return
+        records = []
+        for topic, body, ts in items[-self._max_buffer_size :]:
+            if isinstance(body, bytes):
+                body = body.decode("utf-8")
+            if ts is None:
+                ts = self._time.time()
+            records.append({"topic": topic, "body": body, "ts": ts})
+        try:
+            with self._count_lock:
+                if self._queued_count + len(records) > self._max_buffer_size:
+                    LOG.warning(
+                        "MQTT queue at capacity (%d messages); dropping oldest",
+                        self._max_buffer_size,
+                    )
+                    # remove oldest files to make room
+                    files = self._queue.list()
+                    self._queued_count = len(files)
+                    excess = self._queued_count + len(records) - self._max_buffer_size
+                    for path in files[: max(excess, 0)]:
+                        try:
+                            self._queue.remove(path)
+                            self._queued_count -= 1
+                        except Exception:
+                            LOG.exception("Failed to drop oldest queued message")
+                self._queued_count += self._queue.enqueue_batch(records)
         except Exception:
-            LOG.exception("Failed to enqueue message to on-disk queue")
+            LOG.exception("Failed to enqueue messages to on-disk queue")
 
     def _drain_buffer(self) -> None:
         """Attempt to send all buffered messages."""
@@ -200,26 +373,52 @@ class MqttPublisher:
         try:
             LOG.info("Draining %d queued MQTT messages", len(files))
             failed = []
+            sent = 0
+            missing = 0
             for p in files:
                 try:
-                    text = p.read_text(encoding="utf-8")
-                    record = json.loads(text)
+                    # One record in memory at a time; parsed from raw bytes.
+                    try:
+                        record = self._queue.read(p)
+                    except FileNotFoundError:
+                        # Drained elsewhere; the queue already forgot it.
+                        missing += 1
+                        continue
                     topic = record.get("topic")
                     body = record.get("body")
-                    self._client.publish(topic, body)
+                    info = self._client.publish(topic, body)
+                    rc = getattr(info, "rc", _MQTT_ERR_SUCCESS)
+                    if rc != _MQTT_ERR_SUCCESS:
+                        # Broker is likely gone; later messages would fail the
+                        # same way, so stop and retry on the next connect.
+                        LOG.warning(
+                            "Publish of queued message %s returned rc=%s; "
+                            "stopping drain",
+                            p,
+                            rc,
+                        )
+                        failed.append(p)
+                        break
                     # remove on success
                     self._queue.remove(p)
+                    sent += 1
                 except Exception:
                     LOG.exception(
                         "Failed to publish queued message %s; leaving in queue", p
                     )
                     failed.append(p)
             if failed:
-                LOG.info("Left %d messages in queue after drain", len(failed))
+                LOG.info(
+                    "Left %d messages in queue after drain",
+                    len(files) - sent - missing,
+                )
             else:
                 LOG.info("Queue drained successfully")
         except Exception:
             LOG.exception("Failed to drain on-disk queue")
+        finally:
+            with self._count_lock:
+                self._queued_count = self._queue.size()
 
 
 __all__ = ["MqttPublisher"]
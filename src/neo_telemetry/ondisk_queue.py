@@ -4,41 +4,105 @@ Design goals:
 - Durable across process restarts (files persisted in a queue directory).
 - Atomic enqueue via write+rename.
 - Dequeue by consuming the oldest file (lexicographic by name).
+- Files queued under the older ``YYYYmmddTHHMMSSffffffZ-<uuid>.json`` naming
+  are renamed into the current scheme at startup so they keep their place.
+- The directory is scanned once at startup; afterwards an in-memory index
+  tracks enqueues and removals. Files dropped in by other processes are
+  only picked up by a new instance; files removed elsewhere are forgotten
+  the first time ``read`` or ``remove`` finds them gone.
 """
 
 from __future__ import annotations
 
-import json
+import bisect
+import calendar
+import itertools
 import logging
 import os
-import uuid
-from datetime import datetime, timezone
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Iterable
+
+from neo_core import jsonio
 
 LOG = logging.getLogger(__name__)
 
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+# fdatasync skips the metadata flush fsync does; not every platform has it.
+_datasync = getattr(os, "fdatasync", os.fsync)
+
+
+_COUNTER = itertools.count()
+
+
+def _new_name(ns: int | None = None) -> str:
+    # Zero-padded nanoseconds sort lexicographically in enqueue order; the
+    # counter breaks ties within one clock tick and the pid keeps names
+    # from concurrent processes apart.
+    if ns is None:
+        ns = time.time_ns()
+    return f"{ns:020d}-{next(_COUNTER):08x}-{os.getpid()}.json"
+
 
-def _utc_ts() -> str:
-    # include microseconds to ensure filenames generated within the same
-    # second sort in enqueue order
-    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+_LEGACY_NAME_RE = re.compile(r"^(\d{8}T\d{6})(\d{6})Z-.*\.json$")
+
+
+def _legacy_ns(name: str) -> int | None:
+    """Return the enqueue time of a legacy queue filename in nanoseconds."""
+    m = _LEGACY_NAME_RE.match(name)
+    if m is None:
+        return None
+    try:
+        stamp = time.strptime(m.group(1), "%Y%m%dT%H%M%S")
+    except ValueError:
+        return None
+    return (calendar.timegm(stamp) * 1_000_000 + int(m.group(2))) * 1000
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view) :]
 
 
 class OnDiskQueue:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path, *, sync: bool = True) -> None:
         self.path = Path(path)
         self.path.mkdir(parents=True, exist_ok=True)
+        # Flush each record to disk before it is renamed into place.
+        self.sync = sync
+        self._lock = threading.Lock()
+        self._index = self._scan()
+
+    def _scan(self) -> list[str]:
+        names = sorted(
+            p.name for p in self.path.iterdir() if p.is_file() and p.suffix == ".json"
+        )
+        index = []
+        for name in names:
+            ns = _legacy_ns(name)
+            if ns is not None:
+                new_name = _new_name(ns)
+                try:
+                    os.replace(self.path / name, self.path / new_name)
+                    name = new_name
+                except OSError:
+                    LOG.warning("Could not rename legacy queue file %s", name)
+            index.append(name)
+        return sorted(index)
 
     def enqueue(self, record: dict) -> None:
         """Persist a record atomically to the queue directory."""
         # Write to a temp file then rename
-        fname = f"{_utc_ts()}-{uuid.uuid4().hex}.json"
+        fname = _new_name()
         tmp = self.path / (fname + ".tmp")
         final = self.path / fname
         try:
-            tmp.write_text(json.dumps(record, default=str), encoding="utf-8")
+            self._write_file(tmp, jsonio.dumps(record))
             os.replace(tmp, final)
+            self._add_names([fname])
             LOG.debug("Enqueued message to %s", final)
         except Exception:
             LOG.exception("Failed to enqueue message to %s", self.path)
@@ -48,21 +112,97 @@ class OnDiskQueue:
             except Exception:
                 pass
 
+    def enqueue_batch(self, records: Iterable[dict]) -> int:
+        """Persist several records atomically, returning how many landed.
+
+        Every temp file is written before any is synced, so a backlog costs
+        one pass of syncs rather than a write/sync/rename round per record.
+        Records are renamed into place in order once all are on disk.
+        """
+        tmps: list[Path] = []
+        committed = 0
+        try:
+            fds: list[int] = []
+            try:
+                for record in records:
+                    tmps.append(self.path / (_new_name() + ".tmp"))
+                    fds.append(os.open(tmps[-1], _OPEN_FLAGS, 0o644))
+                    _write_all(fds[-1], jsonio.dumps(record))
+                if self.sync:
+                    for fd in fds:
+                        _datasync(fd)
+            finally:
+                for fd in fds:
+                    os.close(fd)
+            try:
+                for tmp in tmps:
+                    os.replace(tmp, tmp.with_suffix(""))
+                    committed += 1
+            finally:
+                self._add_names([tmp.stem for tmp in tmps[:committed]])
+            LOG.debug("Enqueued %d messages to %s", committed, self.path)
+        except Exception:
+            LOG.exception("Failed to enqueue messages to %s", self.path)
+            for tmp in tmps[committed:]:
+                try:
+                    tmp.unlink(missing_ok=True)
+                except OSError:
+                    LOG.debug("Could not remove temp file %s", tmp)
+        return committed
+
+    def _write_file(self, path: Path, payload: bytes) -> None:
+        fd = os.open(path, _OPEN_FLAGS, 0o644)
+        try:
+            _write_all(fd, payload)
+            if self.sync:
+                _datasync(fd)
+        finally:
+            os.close(fd)
+
+    def _add_names(self, names: list[str]) -> None:
+        with self._lock:
+            for name in names:
+                # New names sort last, so this is normally an append.
+                if not self._index or name > self._index[-1]:
+                    self._index.append(name)
+                else:
+                    bisect.insort(self._index, name)
+
     def list(self) -> list[Path]:
-        files = [p for p in self.path.iterdir() if p.is_file() and p.suffix == ".json"]
-        return sorted(files)
+        return self.dequeue_batch()
 
-    def dequeue_batch(self, limit: int | None = None) -> Iterable[Path]:
-        files = self.list()
-        if limit is not None:
-            files = files[:limit]
-        return files
+    def dequeue_batch(self, limit: int | None = None) -> list[Path]:
+        with self._lock:
+            names = self._index[:limit]
+        return [self.path / name for name in names]
+
+    def read(self, p: Path) -> dict[str, Any]:
+        """Load a single queued record, parsing the file bytes directly."""
+        try:
+            with p.open("rb") as fh:
+                return jsonio.loads(fh.read())
+        except FileNotFoundError:
+            # Removed behind our back (another process, or by hand).
+            LOG.debug("Queued file %s vanished; dropping from index", p)
+            self._discard(p.name)
+            raise
 
     def remove(self, p: Path) -> None:
         try:
             p.unlink()
+        except FileNotFoundError:
+            LOG.debug("Queued file %s already removed", p)
         except Exception:
             LOG.exception("Failed to remove queued file %s", p)
+            return
+        self._discard(p.name)
+
+    def _discard(self, name: str) -> None:
+        with self._lock:
+            i = bisect.bisect_left(self._index, name)
+            if i < len(self._index) and self._index[i] == name:
+                del self._index[i]
 
     def size(self) -> int:
-        return len(self.list())
+        with self._lock:
+            return len(self._index)
@@ -41,7 +41,12 @@ def run_calibrate(args: Namespace) -> int:
     else:
         spots_path = data_dir / "wspr_spots.jsonl"
 
-    spots = load_spots_from_jsonl(spots_path)
+    tail_n = getattr(args, "tail", None)
+    if tail_n is not None and tail_n <= 0:
+        LOG.error("--tail must be a positive number of spots")
+        return 1
+
+    spots = load_spots_from_jsonl(spots_path, tail_n=tail_n)
     if not spots:
         LOG.warning("No spots found in %s; cannot calibrate", spots_path)
         return 1
@@ -61,8 +66,10 @@ def run_calibrate(args: Namespace) -> int:
             "70cm": 432_500_000,
         }
         expected_freq = band_mapping.get(band_str)
-    elif cfg and getattr(cfg, "wspr_bands_hz", None):
-        expected_freq = cfg.wspr_bands_hz[0]
+    else:
+        cfg_bands = getattr(cfg, "wspr_bands_hz", None)
+        if cfg_bands:
+            expected_freq = cfg_bands[0]
 
     try:
         result = estimate_offset_from_spots(spots, expected_freq)
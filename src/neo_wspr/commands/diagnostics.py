@@ -9,6 +9,7 @@ import logging
 from argparse import Namespace
 
 from neo_core import config as config_module
+from neo_core import jsonio
 
 LOG = logging.getLogger(__name__)
 
@@ -43,12 +44,10 @@ def run_diagnostics(args: Namespace) -> int:
 
     # Emit JSON if requested
     if getattr(args, "json", False):
-        import json
-
         result = {
             "upconverter_hint": hint,
             "spots_analyzed": len(spots),
         }
-        print(json.dumps(result, indent=2))
+        jsonio.write_json(result, indent=getattr(args, "pretty", False))
 
     return 0
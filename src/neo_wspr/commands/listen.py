@@ -6,7 +6,6 @@ Runs the WSPR capture/decode/upload pipeline continuously.
 from __future__ import annotations
 
 import logging
-import time
 from argparse import Namespace
 import threading
 from queue import Queue
@@ -17,6 +16,19 @@ from datetime import datetime, timezone
 
 LOG = logging.getLogger(__name__)
 
+# Longest the main loop blocks waiting for a keypress before re-checking
+# whether capture is still running.
+COMMAND_WAIT_S = 1.0
+
+
+def _emit_version() -> None:
+    """Print the running neo-rx version (``v`` keyboard command)."""
+    version = getattr(__import__("neo_rx"), "__version__", None)
+    if version:
+        print(f"\nneo-rx {version}\n", flush=True)
+    else:
+        print("\nneo-rx\n", flush=True)
+
 
 def run_listen(args: Namespace) -> int:
     """Start WSPR monitoring loop: capture → decode → upload."""
@@ -30,6 +42,15 @@ def run_listen(args: Namespace) -> int:
     except Exception:
         LOG.warning("Failed to load configuration; using defaults")
 
+    # Resolve config-derived settings once up front; getattr on a missing
+    # config (None) simply yields the defaults.
+    mqtt_enabled = bool(getattr(cfg, "mqtt_enabled", False))
+    mqtt_topic = getattr(cfg, "mqtt_topic", None) or "neo_rx/wspr/spots"
+    uploader_enabled = bool(getattr(cfg, "wspr_uploader_enabled", False))
+    duration = getattr(cfg, "wspr_capture_duration_s", None) or 119
+    upconverter_enabled = bool(getattr(cfg, "upconverter_enabled", False))
+    upconverter_offset = getattr(cfg, "upconverter_lo_offset_hz", None)
+
     data_dir = config_module.get_mode_data_dir("wspr")
     data_dir.mkdir(parents=True, exist_ok=True)
 
@@ -45,20 +66,20 @@ def run_listen(args: Namespace) -> int:
 
     # Set up publisher if MQTT is enabled
     publisher = None
-    if cfg and getattr(cfg, "mqtt_enabled", False):
+    if mqtt_enabled:
         try:
             from neo_wspr.wspr.publisher import make_publisher_from_config
 
             publisher = make_publisher_from_config(cfg)
             if publisher:
-                publisher.topic = getattr(cfg, "mqtt_topic", "neo_rx/wspr/spots")
+                publisher.topic = mqtt_topic
                 publisher.connect()
         except Exception:
             LOG.exception("Failed to create/connect publisher; continuing without")
 
     # Set up uploader if enabled
     uploader = None
-    if cfg and getattr(cfg, "wspr_uploader_enabled", False):
+    if uploader_enabled:
         from neo_wspr.wspr.uploader import WsprUploader
 
         queue_path = run_dir / "wspr_upload_queue.jsonl"
@@ -82,11 +103,7 @@ def run_listen(args: Namespace) -> int:
         bands = [band_mapping.get(selected_band, 14_095_600)]
         LOG.info("Monitoring only %s band (%s Hz)", selected_band, bands[0])
     else:
-        bands = getattr(cfg, "wspr_bands_hz", None) if cfg else None
-
-    duration = getattr(cfg, "wspr_capture_duration_s", 119) if cfg else 119
-    upconverter_enabled = getattr(cfg, "upconverter_enabled", False) if cfg else False
-    upconverter_offset = getattr(cfg, "upconverter_lo_offset_hz", None) if cfg else None
+        bands = getattr(cfg, "wspr_bands_hz", None) or None
 
     from neo_wspr.wspr.capture import WsprCapture
 
@@ -99,6 +116,7 @@ def run_listen(args: Namespace) -> int:
         upconverter_offset_hz=upconverter_offset,
         station_config=cfg,
         uploader=uploader,
+        realtime=bool(getattr(args, "realtime", False)),
     )
 
     # Minimal keyboard listener for interactive commands
@@ -135,28 +153,27 @@ def run_listen(args: Namespace) -> int:
         except Exception:
             pass
 
+    def _exit_monitor() -> None:
+        print("\nExiting WSPR monitor...\n", flush=True)
+        stop_event.set()
+        capture.stop()
+
+    # Built once; the loop below only drains the queue against it.
+    command_handlers = {
+        "q": _exit_monitor,
+        "v": _emit_version,
+        "s": _emit_wspr_summary,
+    }
+
     capture.start()
     try:
         while capture.is_running() and not stop_event.is_set():
-            time.sleep(1)
-            process_commands(
-                command_queue,
-                {
-                    "q": lambda: (
-                        print("\nExiting WSPR monitor...\n", flush=True),
-                        stop_event.set(),
-                        capture.stop(),
-                    ),
-                    "v": lambda: (
-                        print(
-                            f"\nneo-rx {__import__('neo_rx').__version__}\n", flush=True
-                        )
-                        if hasattr(__import__("neo_rx"), "__version__")
-                        else print("\nneo-rx\n", flush=True)
-                    ),
-                    "s": _emit_wspr_summary,
-                },
-            )
+            if kb_thread is None:
+                # No interactive commands to service; sleep until capture ends.
+                capture.wait()
+                break
+            # Wakes as soon as a key arrives rather than on a fixed tick.
+            process_commands(command_queue, command_handlers, timeout=COMMAND_WAIT_S)
     except KeyboardInterrupt:
         LOG.info("WSPR monitoring interrupted by user")
     finally:
@@ -5,16 +5,76 @@ Runs a quick multi-band scan to detect WSPR activity.
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import selectors
+import signal
 import subprocess
 import time
 from argparse import Namespace
+from typing import IO
 
 from neo_core import config as config_module
+from neo_core import jsonio
 
 LOG = logging.getLogger(__name__)
 
+_READ_SIZE = 65536
+# Grace period for wsprd to exit after SIGTERM before it is killed.
+_TERMINATE_TIMEOUT_S = 2.0
+
+
+def _collect_output(stream: IO[bytes], duration_s: float) -> list[bytes]:
+    """Collect complete output lines from ``stream`` for up to ``duration_s``.
+
+    Waits on the pipe with a selector whose timeout is the time left, so
+    the duration is honoured even when the child prints nothing, and
+    returns early on EOF. Data is read straight from the file descriptor
+    and split into lines here; a trailing partial line is kept.
+    """
+    lines: list[bytes] = []
+    pending = b""
+    fd = stream.fileno()
+    deadline = time.monotonic() + duration_s
+    with selectors.DefaultSelector() as sel:
+        sel.register(fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not sel.select(timeout=remaining):
+                break
+            chunk = os.read(fd, _READ_SIZE)
+            if not chunk:
+                break
+            pending += chunk
+            *complete, pending = pending.split(b"\n")
+            lines.extend(complete)
+    if pending:
+        lines.append(pending)
+    return lines
+
+
+def _stop_process_group(proc: subprocess.Popen) -> None:
+    """Terminate ``proc`` and anything it spawned, then reap it.
+
+    ``proc`` must have been started with ``start_new_session=True`` so its
+    pid is also its process group id.
+    """
+    if proc.poll() is None:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+            proc.wait(timeout=_TERMINATE_TIMEOUT_S)
+        except ProcessLookupError:
+            pass
+        except subprocess.TimeoutExpired:
+            LOG.warning("wsprd did not exit after SIGTERM; killing")
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+    if proc.stdout is not None:
+        proc.stdout.close()
+
 
 def run_scan(args: Namespace) -> int:
     """Run multi-band WSPR scan and report activity."""
@@ -31,47 +91,48 @@ def run_scan(args: Namespace) -> int:
     LOG.info("Running WSPR band-scan")
 
     # Determine bands to scan
-    if cfg and getattr(cfg, "wspr_bands_hz", None):
-        bands = cfg.wspr_bands_hz
-    else:
-        bands = [14_080_000, 7_080_000, 3_572_000, 50_294_800, 144_489_000, 432_500_000]
-
-    duration = getattr(cfg, "wspr_capture_duration_s", 120) if cfg else 120
+    bands = getattr(cfg, "wspr_bands_hz", None) or [
+        14_080_000,
+        7_080_000,
+        3_572_000,
+        50_294_800,
+        144_489_000,
+        432_500_000,
+    ]
+    duration = getattr(cfg, "wspr_capture_duration_s", None) or 120
+
+    from neo_wspr.wspr.decoder import WsprDecoder
+
+    # Resolve the wsprd binary once for the whole scan rather than per band.
+    wsprd_path = WsprDecoder().wsprd_path
+    cmd = [wsprd_path] if wsprd_path is not None else None
 
     def _capture_fn(band_hz: int, dur: int):
         """Capture function for scanning: runs wsprd and collects output."""
-        from neo_wspr.wspr.decoder import WsprDecoder
-
-        decoder = WsprDecoder()
-        wsprd_path = decoder.wsprd_path
-        if wsprd_path is None:
+        if cmd is None:
             LOG.warning("wsprd not found; skipping live capture for band %s", band_hz)
             return []
-        cmd = [wsprd_path]
         try:
+            # Own session/process group so the whole tree can be signalled;
+            # stderr is discarded so a chatty wsprd cannot fill an unread pipe.
             proc = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
             )
         except Exception:
             LOG.exception("Failed to start wsprd for band %s", band_hz)
             return []
 
-        lines = []
-        start = time.time()
         try:
             assert proc.stdout is not None
-            while time.time() - start < dur:
-                line = proc.stdout.readline()
-                if not line:
-                    if proc.poll() is not None:
-                        break
-                    continue
-                lines.append(line)
+            lines = _collect_output(proc.stdout, dur)
         finally:
             try:
-                proc.terminate()
+                _stop_process_group(proc)
             except Exception:
-                pass
+                LOG.debug("Failed to stop wsprd for band %s", band_hz, exc_info=True)
         return lines
 
     from neo_wspr.wspr import scan as wspr_scan
@@ -80,7 +141,7 @@ def run_scan(args: Namespace) -> int:
 
     # Emit JSON if requested, otherwise human-readable logs
     if getattr(args, "json", False):
-        print(json.dumps(reports, indent=2, default=str))
+        jsonio.write_json(reports, indent=getattr(args, "pretty", False))
         return 0
 
     # Print ranked report
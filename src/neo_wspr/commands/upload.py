@@ -5,11 +5,11 @@ Drains the queued spots to WSPRNet.
 
 from __future__ import annotations
 
-import json
 import logging
 from argparse import Namespace
 
 from neo_core import config as config_module
+from neo_core import jsonio
 
 LOG = logging.getLogger(__name__)
 
@@ -72,7 +72,7 @@ def run_upload(args: Namespace) -> int:
                 except Exception:
                     pass
             result.setdefault("last_error", None)
-            print(json.dumps(result, indent=2))
+            jsonio.write_json(result, indent=getattr(args, "pretty", False))
 
         return 0
     except Exception:
@@ -9,10 +9,14 @@ post-processing captured spot files.
 from __future__ import annotations
 
 import logging
-from typing import Optional, Iterable
-from statistics import median
+import math
+from collections import deque
+from typing import Iterable
 from pathlib import Path
-import json
+
+import numpy as np
+
+from neo_core import jsonio
 
 LOG = logging.getLogger(__name__)
 
@@ -127,8 +131,26 @@ def persist_ppm_to_config(ppm: float, config_path: str | None = None) -> None:
         raise
 
 
+def _float_or_nan(value: object) -> float:
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def as_float_array(values: list) -> np.ndarray:
+    """Convert raw field values to float64, mapping missing/invalid to NaN."""
+    try:
+        # Fast path: numeric values (and None -> NaN) convert in one C call.
+        return np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return np.fromiter(
+            (_float_or_nan(v) for v in values), dtype=np.float64, count=len(values)
+        )
+
+
 def estimate_offset_from_spots(
-    spots: Iterable[dict], expected_freq_hz: Optional[float] = None
+    spots: Iterable[dict], expected_freq_hz: float | None = None
 ) -> dict:
     """Estimate frequency offset (Hz) and derived ppm from an iterable of spot dicts.
 
@@ -137,29 +159,18 @@ def estimate_offset_from_spots(
     the median observed frequency and return an offset of 0 (caller may prefer
     to provide an expected frequency explicitly).
     """
-    freqs: list[float] = []
-    snrs: list[float] = []
-    for s in spots:
-        try:
-            freq_val = s.get("freq_hz")
-            if freq_val is not None:
-                f = float(freq_val)
-                freqs.append(f)
-        except (TypeError, ValueError):
-            continue
-        try:
-            snr_val = s.get("snr_db")
-            if snr_val is not None:
-                snrs.append(float(snr_val))
-        except (TypeError, ValueError):
-            pass
+    spots = list(spots)
+    freqs = as_float_array([s.get("freq_hz") for s in spots])
+    freqs = freqs[~np.isnan(freqs)]
+    snrs = as_float_array([s.get("snr_db") for s in spots])
+    snrs = snrs[~np.isnan(snrs)]
 
-    if not freqs:
+    if not freqs.size:
         raise ValueError("No frequency observations in spots")
 
-    median_freq = median(freqs)
-    count = len(freqs)
-    median_snr = median(snrs) if snrs else None
+    median_freq = float(np.median(freqs))
+    count = int(freqs.size)
+    median_snr = float(np.median(snrs)) if snrs.size else None
 
     if expected_freq_hz is None:
         offset_hz = 0.0
@@ -177,19 +188,39 @@ def estimate_offset_from_spots(
     }
 
 
-def load_spots_from_jsonl(path: Path) -> list[dict]:
-    """Load JSON-lines file containing spot dicts and return as a list."""
+def _parse_lines(lines: Iterable[bytes], source: object) -> list[dict]:
     spots: list[dict] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            spots.append(jsonio.loads(line))
+        except Exception:
+            LOG.exception("Skipping malformed JSON line in %s", source)
+    return spots
+
+
+def load_spots_from_jsonl(path: Path, tail_n: int | None = None) -> list[dict]:
+    """Load JSON-lines file containing spot dicts and return as a list.
+
+    The file is read in one call and split on newlines as bytes so each
+    line can be handed straight to the JSON parser without a text decode.
+    When ``tail_n`` is given only the last ``tail_n`` lines are kept while
+    the file is iterated, so memory and parse time scale with the window
+    rather than the whole file.
+    """
+    if tail_n is not None and tail_n < 0:
+        raise ValueError("tail_n must be non-negative")
+
     try:
-        with Path(path).open("r", encoding="utf-8") as fh:
-            for line in fh:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    spots.append(json.loads(line))
-                except Exception:
-                    LOG.exception("Skipping malformed JSON line in %s", path)
+        with Path(path).open("rb") as fh:
+            if tail_n is None:
+                lines: Iterable[bytes] = fh.read().split(b"\n")
+            else:
+                lines = deque(fh, maxlen=tail_n)
     except FileNotFoundError:
         LOG.debug("Spots file not found: %s", path)
-    return spots
+        return []
+
+    return _parse_lines(lines, path)
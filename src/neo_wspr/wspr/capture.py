@@ -6,15 +6,21 @@ decoder. It provides real-time multi-band WSPR capture using RTL-SDR.
 
 from __future__ import annotations
 
-import json
 import logging
+import math
+import os
+import queue
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, Optional, TYPE_CHECKING
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
+
+from neo_core import jsonio
 
 if TYPE_CHECKING:  # pragma: no cover - type-checking only
+    from neo_wspr.wspr.decoder import IqStagingFile, WsprDecoder
     from neo_wspr.wspr.uploader import WsprUploader
 
 LOG = logging.getLogger(__name__)
@@ -22,6 +28,154 @@ LOG = logging.getLogger(__name__)
 
 CaptureFunc = Callable[[int, int], Iterable[bytes | str]]
 
+DEFAULT_SPOT_TOPIC = "neo_rx/wspr/spots"
+
+# RTL-SDR sample rate used for WSPR captures.
+SAMPLE_RATE_HZ = 1_200_000
+
+# WSPR transmissions start on even UTC minutes; the pre-capture wait logs its
+# countdown at this interval.
+WSPR_SLOT_S = 120
+SYNC_LOG_INTERVAL_S = 10.0
+
+# Sync captures log progress each time this many more samples arrive (~5 s).
+PROGRESS_EVERY_SAMPLES = 5 * SAMPLE_RATE_HZ
+
+# Complex samples requested per SDR read (~218 ms at 1.2 MS/s). Large reads
+# keep libusb transfers and Python-level calls per second low; the size is a
+# multiple of the 16 KiB USB transfer granularity librtlsdr expects.
+READ_CHUNK_SAMPLES = 256 * 1024
+
+# Scheduling requested for the capture thread (see _tune_capture_thread).
+CAPTURE_FIFO_PRIORITY = 10
+CAPTURE_NICE = -5
+
+# Write buffer for the spots JSON-lines file; flushed after every band.
+SPOTS_BUFFER_SIZE = 64 * 1024
+
+# Spots waiting for the publisher thread, and the most it hands the
+# publisher per wake-up.
+PUBLISH_QUEUE_SIZE = 1024
+PUBLISH_BATCH_SIZE = 64
+
+_STOP_PUBLISHER = object()
+
+
+def _tune_capture_thread(realtime: bool = False) -> None:
+    """Best-effort scheduling boost for the calling (capture) thread.
+
+    Pins the thread to the highest-numbered CPU it may run on (core 0 usually
+    services USB interrupts on SBCs), then lowers its nice value. With
+    ``realtime`` it first asks for low ``SCHED_FIFO`` priority instead; that
+    is opt-in because a realtime thread contending for the GIL can starve
+    the decode and publisher threads (and, on one core, the whole system).
+    Each step needs privileges or Linux support and is skipped quietly when
+    unavailable.
+    """
+    tid = threading.get_native_id()
+    try:
+        cpus = os.sched_getaffinity(tid)
+        if len(cpus) > 1:
+            os.sched_setaffinity(tid, {max(cpus)})
+            LOG.debug("WSPR capture thread pinned to CPU %d", max(cpus))
+    except (AttributeError, OSError):
+        LOG.debug("Could not set WSPR capture thread CPU affinity")
+    if realtime:
+        try:
+            os.sched_setscheduler(
+                tid, os.SCHED_FIFO, os.sched_param(CAPTURE_FIFO_PRIORITY)
+            )
+            LOG.debug("WSPR capture thread running SCHED_FIFO")
+            return
+        except (AttributeError, OSError):
+            LOG.debug("Could not switch WSPR capture thread to SCHED_FIFO")
+    try:
+        os.setpriority(os.PRIO_PROCESS, tid, CAPTURE_NICE)
+        LOG.debug("WSPR capture thread nice set to %d", CAPTURE_NICE)
+    except (AttributeError, OSError):
+        LOG.debug("Could not raise WSPR capture thread priority")
+
+
+def _thread_scheduling() -> tuple[Any, ...] | None:
+    """Return the calling thread's affinity, policy, param and nice value."""
+    tid = threading.get_native_id()
+    try:
+        return (
+            os.sched_getaffinity(tid),
+            os.sched_getscheduler(tid),
+            os.sched_getparam(tid),
+            os.getpriority(os.PRIO_PROCESS, tid),
+        )
+    except (AttributeError, OSError):
+        return None
+
+
+def _restore_thread_scheduling(saved: tuple[Any, ...] | None) -> None:
+    """Undo :func:`_tune_capture_thread` for the calling thread.
+
+    Threads (and wsprd children) started from the capture thread inherit its
+    pinning, nice value and policy; helpers call this first so only the
+    capture thread itself runs boosted.
+    """
+    if saved is None:
+        return
+    cpus, policy, param, nice = saved
+    tid = threading.get_native_id()
+    try:
+        os.sched_setscheduler(tid, policy, param)
+    except (AttributeError, OSError):
+        LOG.debug(
+            "Could not restore scheduling policy for %s",
+            threading.current_thread().name,
+        )
+    try:
+        os.setpriority(os.PRIO_PROCESS, tid, nice)
+    except (AttributeError, OSError):
+        LOG.debug(
+            "Could not restore nice value for %s", threading.current_thread().name
+        )
+    try:
+        os.sched_setaffinity(tid, cpus)
+    except (AttributeError, OSError):
+        LOG.debug(
+            "Could not restore CPU affinity for %s", threading.current_thread().name
+        )
+
+
+def _discard_spot(topic: str, payload: dict) -> None:
+    return None
+
+
+class _SpotSink:
+    """Publish target resolved once from the capture's publisher.
+
+    Binds ``publisher.publish`` (and ``publish_batch`` when the publisher
+    offers one) and its topic at construction so the per-spot path is a
+    single call; without a publisher ``send`` is a no-op.
+    """
+
+    __slots__ = ("publish", "publish_batch", "topic")
+
+    def __init__(self, publisher: object | None) -> None:
+        self.publish_batch: Callable[[str, list[dict]], None] | None = None
+        if publisher is None:
+            self.publish: Callable[[str, dict], None] = _discard_spot
+            self.topic = DEFAULT_SPOT_TOPIC
+        else:
+            self.publish = publisher.publish  # type: ignore[attr-defined]
+            self.publish_batch = getattr(publisher, "publish_batch", None)
+            self.topic = getattr(publisher, "topic", None) or DEFAULT_SPOT_TOPIC
+
+    def send(self, spot: dict) -> None:
+        self.publish(self.topic, spot)
+
+    def send_batch(self, spots: list[dict]) -> None:
+        if self.publish_batch is not None:
+            self.publish_batch(self.topic, spots)
+            return
+        for spot in spots:
+            self.publish(self.topic, spot)
+
 
 class WsprCapture:
     """Orchestrate WSPR captures across bands using RTL-SDR.
@@ -46,6 +200,7 @@ class WsprCapture:
         keep_temp: bool = False,
         station_config: Optional[object] = None,
         uploader: "WsprUploader | None" = None,
+        realtime: bool = False,
     ) -> None:
         # Default to primary WSPR bands (Hz)
         self.bands_hz = bands_hz or [
@@ -62,10 +217,28 @@ class WsprCapture:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
+        # Set whenever no capture loop is active, so callers can block on
+        # completion instead of polling is_running().
+        self._finished = threading.Event()
+        self._finished.set()
         self._data_dir = Path(data_dir) if data_dir is not None else Path("./data")
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._spots_file = self._data_dir / "wspr_spots.jsonl"
+        # Spot lines collect in memory and are appended with one os.write()
+        # per flush on an O_APPEND descriptor (opened on first flush, closed
+        # when capture ends). Each write holds only whole lines, so other
+        # writers appending to the same file never split a record.
+        self._spots_fd: int | None = None
+        self._spots_buf = bytearray()
+        self._spots_lock = threading.Lock()
         self._publisher = publisher
+        self._sink = _SpotSink(publisher)
+        # Spots are handed to a publisher thread so a slow (network-backed)
+        # publisher never stalls decoding; the thread starts on first use.
+        self._pub_q: queue.Queue[Any] = queue.Queue(maxsize=PUBLISH_QUEUE_SIZE)
+        self._pub_thread: threading.Thread | None = None
+        self._pub_lock = threading.Lock()
+        self._dropped_spots = 0
         self._upconverter_enabled = upconverter_enabled
         self._upconverter_offset_hz = (
             upconverter_offset_hz or 125_000_000
@@ -74,6 +247,12 @@ class WsprCapture:
         self._keep_temp = bool(keep_temp)
         self._station_config = station_config
         self._uploader = uploader
+        # One decoder (and one wsprd lookup) for the life of the capture.
+        self._decoder: WsprDecoder | None = None
+        # Request SCHED_FIFO for the capture thread (see _tune_capture_thread).
+        self._realtime = bool(realtime)
+        # Capture thread scheduling from before tuning, restored by helpers.
+        self._base_sched: tuple[Any, ...] | None = None
 
     def start(self) -> None:
         if self._running:
@@ -82,6 +261,7 @@ class WsprCapture:
         LOG.info("Starting WSPR capture with bands: %s", self.bands_hz)
         self._running = True
         self._stop_event.clear()
+        self._finished.clear()
         self._thread = threading.Thread(
             target=self._capture_loop, name="wspr_capture", daemon=True
         )
@@ -102,11 +282,36 @@ class WsprCapture:
     def is_running(self) -> bool:
         return self._running
 
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the capture loop exits; return False on timeout."""
+        return self._finished.wait(timeout)
+
+    def _get_decoder(self) -> WsprDecoder:
+        if self._decoder is None:
+            from .decoder import WsprDecoder
+
+            self._decoder = WsprDecoder()
+        return self._decoder
+
+    def _new_decode_pool(self) -> ThreadPoolExecutor:
+        # wsprd runs as its own process, so one worker thread is enough to
+        # overlap a band's decode with the next band's capture. The worker
+        # drops the capture thread's tuning so wsprd is not pinned to its core.
+        return ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="wspr-decode",
+            initializer=_restore_thread_scheduling,
+            initargs=(self._base_sched,),
+        )
+
     def _capture_loop(self) -> None:
         """Background capture loop: cycle through bands, capture, decode, publish."""
-        from .decoder import WsprDecoder
+        from .decoder import IqStagingFile
         from neo_core._compat.rtlsdr import prepare_rtlsdr
 
+        self._base_sched = _thread_scheduling()
+        _tune_capture_thread(self._realtime)
+
         # Prepare RTL-SDR with compatibility patches
         prepare_rtlsdr()
 
@@ -121,6 +326,8 @@ class WsprCapture:
                 return
 
         sdr = None
+        decode_pool = self._new_decode_pool()
+        pending_decode: Future[None] | None = None
         try:
             # Check for devices
             try:
@@ -153,99 +360,53 @@ class WsprCapture:
                     "System time appears reasonable. For optimal WSPR reception, ensure NTP synchronization: 'timedatectl status' should show 'NTP synchronized: yes'"
                 )
 
-            decoder = WsprDecoder()
+            decoder = self._get_decoder()
 
-            # Wait for next even minute to synchronize with WSPR schedule
-            now = time.time()
-            seconds_since_epoch = int(now)
-            current_minute = (seconds_since_epoch // 60) % 60
-            seconds_into_minute = seconds_since_epoch % 60
-
-            if current_minute % 2 == 0:
-                # Already at even minute, wait until next even minute
-                wait_seconds = 120 - seconds_into_minute
-            else:
-                # At odd minute, wait until next even minute
-                wait_seconds = (120 - seconds_into_minute) % 120
+            tunings = self._band_tunings()
 
-            if wait_seconds > 0:
-                LOG.info(
-                    "Waiting %d seconds to synchronize with WSPR schedule (next even minute)",
-                    wait_seconds,
-                )
-                # Countdown with updates every second
-                for remaining in range(wait_seconds, 0, -1):
-                    if self._stop_event.wait(1.0):  # Wait 1 second, check for stop
-                        return
-                    if (
-                        remaining <= 10 or remaining % 10 == 0
-                    ):  # Log every 10 seconds, or last 10
-                        LOG.info("WSPR sync: %d seconds remaining", remaining)
-                LOG.info("WSPR synchronization complete - starting capture")
+            # Wait for next even minute to synchronize with WSPR schedule
+            if not self._wait_for_wspr_slot():
+                return
 
             while not self._stop_event.is_set():
-                for band_hz in self.bands_hz:
+                for band_hz, actual_freq, tuning_msg in tunings:
                     if self._stop_event.is_set():
                         break
 
+                    stage: IqStagingFile | None = None
                     LOG.info(
                         "Tuning to band %s Hz for %s s",
                         band_hz,
                         self.capture_duration_s,
                     )
                     try:
-                        # Apply upconverter offset if enabled
-                        if self._upconverter_enabled and self._upconverter_offset_hz:
-                            actual_freq = band_hz + self._upconverter_offset_hz
-                            LOG.info(
-                                "RTL-SDR tuning to %.3f MHz (HF: %.3f MHz + %d MHz upconverter offset)",
-                                actual_freq / 1e6,
-                                band_hz / 1e6,
-                                self._upconverter_offset_hz // 1_000_000,
-                            )
-                        else:
-                            actual_freq = band_hz
-                            LOG.info(
-                                "RTL-SDR tuning to %.3f MHz (no upconverter)",
-                                actual_freq / 1e6,
-                            )
+                        LOG.info(tuning_msg)
                         sdr.set_center_freq(actual_freq)  # type: ignore[attr-defined]
                         # Allow PLL to settle after frequency change
                         time.sleep(0.1)  # 100ms delay for tuner stabilization
-                        sdr.set_sample_rate(1_200_000)  # Standard for WSPR
+                        sdr.set_sample_rate(SAMPLE_RATE_HZ)  # Standard for WSPR
                         sdr.set_gain(
                             35
                         )  # Set gain to 35dB (matches SDR++ settings of 20-35dB range)
                         LOG.info("RTL-SDR configured: sample rate 1.2 MHz, gain 35dB")
-                        # Capture IQ samples
-                        iq_data = b""
+                        # Capture IQ samples straight into a memory-mapped
+                        # wsprd input file sized for the whole window.
+                        stage = IqStagingFile(
+                            int(self.capture_duration_s * SAMPLE_RATE_HZ),
+                            keep=self._keep_temp,
+                        )
                         start_time = time.time()
-                        last_progress = start_time
-                        iterations = 0
-                        # Increase chunk size to improve throughput; some rtlsdr bindings
-                        # are more efficient with larger read sizes.
-                        chunk_size = 16384
+                        chunk_size = READ_CHUNK_SAMPLES
 
                         # Prefer async/callback-based capture if supported by the binding.
                         use_async = hasattr(sdr, "read_samples_async")
                         if use_async:
                             LOG.info("Using async capture via read_samples_async")
-                            buf = bytearray()
 
-                            def _async_cb(samples, rtlsdr_obj=None):
+                            def _async_cb(samples, rtlsdr_obj=None, stage=stage):
                                 # samples is typically a numpy array of complex64
                                 try:
-                                    for sample in samples:
-                                        buf.extend(
-                                            int(sample.real * 32767).to_bytes(
-                                                2, "little", signed=True
-                                            )
-                                        )
-                                        buf.extend(
-                                            int(sample.imag * 32767).to_bytes(
-                                                2, "little", signed=True
-                                            )
-                                        )
+                                    stage.append(samples)
                                     # Do not call cancel_read_async() from the callback; the
                                     # main thread will stop the async read when the duration
                                     # has elapsed. Calling cancel from the callback can race
@@ -263,12 +424,15 @@ class WsprCapture:
                             )
                             reader_thread.start()
 
-                            # Wait until duration elapsed or stop requested
-                            while (
-                                time.time() - start_time < self.capture_duration_s
-                                and not self._stop_event.is_set()
-                            ):
-                                time.sleep(0.1)
+                            # Sleep until the duration has elapsed; a stop request
+                            # wakes the wait immediately.
+                            self._stop_event.wait(
+                                max(
+                                    0.0,
+                                    self.capture_duration_s
+                                    - (time.time() - start_time),
+                                )
+                            )
 
                             # Ensure async read stopped. Call cancel_read_async from the
                             # main thread and wait (up to a few seconds) for the reader
@@ -284,59 +448,45 @@ class WsprCapture:
 
                             # Wait for the reader thread to exit (give it up to 5s).
                             timeout = 5.0
-                            waited = 0.0
-                            interval = 0.05
-                            while reader_thread.is_alive() and waited < timeout:
-                                time.sleep(interval)
-                                waited += interval
+                            reader_thread.join(timeout)
 
                             if reader_thread.is_alive():
                                 LOG.warning(
                                     "Async reader thread did not exit within %.1fs",
                                     timeout,
                                 )
-
-                            iq_data = bytes(buf)
                         else:
-                            # Fallback synchronous capture (existing approach)
+                            # Fallback synchronous capture: read until the staged
+                            # file holds the full window, so the sample count (not
+                            # the wall clock) sets the capture length.
+                            next_progress = PROGRESS_EVERY_SAMPLES
                             while (
-                                time.time() - start_time < self.capture_duration_s
+                                stage.samples < stage.capacity
                                 and not self._stop_event.is_set()
                             ):
                                 samples = sdr.read_samples(
-                                    chunk_size
-                                )  # Read in larger chunks
-                                # Convert complex samples to bytes (IQ as int16)
-                                iq_bytes = b"".join(
-                                    int(sample.real * 32767).to_bytes(
-                                        2, "little", signed=True
-                                    )
-                                    + int(sample.imag * 32767).to_bytes(
-                                        2, "little", signed=True
-                                    )
-                                    for sample in samples
+                                    min(chunk_size, stage.capacity - stage.samples)
                                 )
-                                iq_data += iq_bytes
-
-                                iterations += 1
-                                # Periodically log progress (every ~5 seconds)
-                                now = time.time()
-                                if now - last_progress >= 5.0:
-                                    try:
-                                        total_samples = len(iq_data) // 4
-                                        elapsed = now - start_time
-                                        LOG.info(
-                                            "WSPR capture progress: %d complex samples in %.1fs (%.1f sps)",
-                                            total_samples,
-                                            elapsed,
-                                            total_samples / max(1.0, elapsed),
-                                        )
-                                    except Exception:
-                                        LOG.debug("Failed to compute capture progress")
-                                    last_progress = now
-
-                        # Decode using wsprd
-                        if iq_data:
+                                # Convert complex samples into the staged file (IQ as int16)
+                                if not stage.append(samples):
+                                    LOG.warning("RTL-SDR read returned no samples")
+                                    break
+
+                                # Log progress about every 5 s worth of samples
+                                if stage.samples >= next_progress:
+                                    next_progress += PROGRESS_EVERY_SAMPLES
+                                    elapsed = time.time() - start_time
+                                    LOG.info(
+                                        "WSPR capture progress: %d complex samples in %.1fs (%.1f sps)",
+                                        stage.samples,
+                                        elapsed,
+                                        stage.samples / max(1.0, elapsed),
+                                    )
+
+                        # Unmap (which also fences off a stuck async reader)
+                        # and decode the staged file in place.
+                        stage.close()
+                        if stage.samples:
                             # Log capture diagnostics: sample rate reported by driver and written data size
                             try:
                                 actual_sr = getattr(sdr, "get_sample_rate", None)
@@ -352,8 +502,10 @@ class WsprCapture:
                             except Exception:
                                 LOG.debug("Could not read sample rate from SDR object")
                             try:
-                                total_samples = len(iq_data) // 4
-                                inferred_duration = total_samples / float(1_200_000)
+                                total_samples = stage.samples
+                                inferred_duration = total_samples / float(
+                                    SAMPLE_RATE_HZ
+                                )
                                 LOG.info(
                                     "Captured %d complex samples (%.2f seconds at 1.2e6 sps assumed)",
                                     total_samples,
@@ -363,14 +515,22 @@ class WsprCapture:
                                 LOG.debug(
                                     "Failed to compute captured sample count/duration"
                                 )
-                            for spot in decoder.run_wsprd_subprocess(
-                                iq_data, band_hz, keep_temp=self._keep_temp
-                            ):
-                                self._handle_spot(spot, band_hz)
+                            # Decode in the background while the next band is
+                            # captured; keep at most one decode in flight.
+                            if pending_decode is not None:
+                                pending_decode.result()
+                            pending_decode = decode_pool.submit(
+                                self._decode_stage, decoder, stage, band_hz
+                            )
+                            stage = None  # owned by the decode job now
 
                     except Exception as exc:
                         LOG.error("Error capturing band %s: %s", band_hz, exc)
                         continue
+                    finally:
+                        if stage is not None:
+                            stage.cleanup()
+                            stage = None
 
         except Exception as exc:
             LOG.error("WSPR capture loop failed: %s", exc)
@@ -380,10 +540,80 @@ class WsprCapture:
                     sdr.close()
                 except Exception:
                     pass
+            # Let an in-flight decode finish so its spots are not lost.
+            decode_pool.shutdown(wait=True)
+            self._close_spots()
+            self._stop_publisher()
             self._running = False
+            self._finished.set()
+
+    def _decode_stage(
+        self, decoder: WsprDecoder, stage: IqStagingFile, band_hz: int
+    ) -> None:
+        """Decode one staged capture, handle its spots, then remove the stage."""
+        try:
+            for spot in decoder.run_wsprd_staged(stage, band_hz):
+                self._handle_spot(spot, band_hz)
+            self._flush_spots()
+        except Exception:
+            LOG.exception("wsprd decode failed for band %s", band_hz)
+        finally:
+            stage.cleanup()
+
+    def _band_tunings(self) -> list[tuple[int, int, str]]:
+        """Return ``(band_hz, tuner_freq_hz, log_message)`` for each band.
+
+        Built once per capture run so band hops only look the values up.
+        """
+        offset = (
+            self._upconverter_offset_hz
+            if self._upconverter_enabled and self._upconverter_offset_hz
+            else 0
+        )
+        tunings = []
+        for band_hz in self.bands_hz:
+            actual_freq = band_hz + offset
+            if offset:
+                msg = (
+                    f"RTL-SDR tuning to {actual_freq / 1e6:.3f} MHz "
+                    f"(HF: {band_hz / 1e6:.3f} MHz + {offset // 1_000_000} MHz "
+                    "upconverter offset)"
+                )
+            else:
+                msg = f"RTL-SDR tuning to {actual_freq / 1e6:.3f} MHz (no upconverter)"
+            tunings.append((band_hz, actual_freq, msg))
+        return tunings
+
+    def _wait_for_wspr_slot(self) -> bool:
+        """Sleep until the next even UTC minute; return False if stopped first.
+
+        The wait targets the absolute slot boundary and only wakes at
+        ``SYNC_LOG_INTERVAL_S`` marks to log the countdown.
+        """
+        deadline = (time.time() // WSPR_SLOT_S + 1) * WSPR_SLOT_S
+        remaining = deadline - time.time()
+        LOG.info(
+            "Waiting %d seconds to synchronize with WSPR schedule (next even minute)",
+            math.ceil(remaining),
+        )
+        while remaining > 0:
+            step = remaining % SYNC_LOG_INTERVAL_S or SYNC_LOG_INTERVAL_S
+            if self._stop_event.wait(step):
+                return False
+            remaining = deadline - time.time()
+            if remaining >= 1:
+                LOG.info("WSPR sync: %d seconds remaining", round(remaining))
+        LOG.info("WSPR synchronization complete - starting capture")
+        return True
 
     def _handle_spot(self, spot: dict, band_hz: int) -> dict:
-        """Handle a decoded spot: enrich, persist, publish, and enqueue if enabled."""
+        """Handle a decoded spot: enrich, persist, publish, and enqueue if enabled.
+
+        Takes ownership of ``spot``: the enrichment fields are added to it in
+        place and the same dict is returned, then shared with the publisher
+        thread and uploader queue. Callers pass the decoder's freshly built
+        dicts; anyone holding on to a spot of their own must pass a copy.
+        """
         enriched, missing_for_queue = self._enrich_spot(spot, band_hz)
         self._persist_spot(enriched)
         self._publish_spot(enriched)
@@ -399,9 +629,7 @@ class WsprCapture:
 
         Returns the list of parsed spot dicts from this cycle.
         """
-        from .decoder import WsprDecoder
-
-        decoder = WsprDecoder()
+        decoder = self._get_decoder()
         all_spots: list[dict] = []
 
         for band in self.bands_hz:
@@ -415,24 +643,114 @@ class WsprCapture:
             for spot in decoder.decode_stream(lines):
                 enriched = self._handle_spot(spot, band)
                 all_spots.append(enriched)
+            self._flush_spots()
 
+        self._close_spots()
+        self._stop_publisher()
         return all_spots
 
     def _persist_spot(self, spot: dict) -> None:
+        # Encoded straight to UTF-8 bytes (orjson when installed).
+        line = jsonio.dumps(spot) + b"\n"
+        with self._spots_lock:
+            self._spots_buf += line
+            if len(self._spots_buf) >= SPOTS_BUFFER_SIZE:
+                self._write_spots_locked()
+
+    def _write_spots_locked(self) -> None:
+        """Append pending spot lines to the file; caller holds the lock.
+
+        Only bytes the kernel accepted leave the buffer, so lines from a
+        failed append are retried on the next flush.
+        """
+        if not self._spots_buf:
+            return
         try:
-            with self._spots_file.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(spot, default=str) + "\n")
-        except Exception:
-            LOG.exception("Failed to write spot to file: %s", self._spots_file)
+            if self._spots_fd is None:
+                self._spots_fd = os.open(
+                    self._spots_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                )
+            while self._spots_buf:
+                del self._spots_buf[: os.write(self._spots_fd, self._spots_buf)]
+        except OSError:
+            LOG.exception("Failed to write spots to file: %s", self._spots_file)
+
+    def _flush_spots(self) -> None:
+        """Push buffered spot lines to the spots file."""
+        with self._spots_lock:
+            self._write_spots_locked()
+
+    def _close_spots(self) -> None:
+        """Flush and close the spots file descriptor, if open."""
+        with self._spots_lock:
+            self._write_spots_locked()
+            fd, self._spots_fd = self._spots_fd, None
+            if fd is None:
+                return
+            try:
+                os.close(fd)
+            except OSError:
+                LOG.exception("Failed to close spots file: %s", self._spots_file)
 
     def _publish_spot(self, spot: dict) -> None:
+        """Hand a spot to the publisher thread without waiting on the network."""
         if self._publisher is None:
             return
+        self._ensure_publisher()
         try:
-            topic = getattr(self._publisher, "topic", "neo_rx/wspr/spots")
-            self._publisher.publish(topic, spot)  # type: ignore[attr-defined]
-        except Exception:
-            LOG.exception("Publisher failed to publish spot; continuing")
+            self._pub_q.put_nowait(spot)
+        except queue.Full:
+            self._dropped_spots += 1
+            LOG.warning(
+                "Spot publish backlog full; dropped %d spot(s) so far",
+                self._dropped_spots,
+            )
+
+    def _ensure_publisher(self) -> None:
+        with self._pub_lock:
+            if self._pub_thread is not None and self._pub_thread.is_alive():
+                return
+            self._pub_thread = threading.Thread(
+                target=self._publisher_loop, name="wspr-publisher", daemon=True
+            )
+            self._pub_thread.start()
+
+    def _stop_publisher(self) -> None:
+        """Publish everything queued so far, then stop the publisher thread."""
+        with self._pub_lock:
+            thread = self._pub_thread
+            self._pub_thread = None
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._pub_q.put(_STOP_PUBLISHER, timeout=1.0)
+        except queue.Full:
+            LOG.warning("Spot publish backlog full at stop")
+            return
+        thread.join(timeout=5.0)
+        if thread.is_alive():
+            LOG.warning("WSPR publisher thread did not stop cleanly")
+
+    def _publisher_loop(self) -> None:
+        _restore_thread_scheduling(self._base_sched)
+        while True:
+            items = [self._pub_q.get()]
+            while len(items) < PUBLISH_BATCH_SIZE:
+                try:
+                    items.append(self._pub_q.get_nowait())
+                except queue.Empty:
+                    break
+            batch = [item for item in items if item is not _STOP_PUBLISHER]
+            try:
+                if batch:
+                    self._sink.send_batch(batch)
+            except Exception:
+                LOG.exception("Publisher failed to publish spots; continuing")
+            finally:
+                for _ in items:
+                    self._pub_q.task_done()
+            if len(batch) != len(items):
+                return
 
     def _maybe_enqueue_spot(self, spot: dict, missing_fields: list[str]) -> None:
         if self._uploader is None:
@@ -450,7 +768,8 @@ class WsprCapture:
             LOG.exception("Failed to enqueue spot for WSPR uploader; queue unchanged")
 
     def _enrich_spot(self, spot: dict, band_hz: int) -> tuple[dict, list[str]]:
-        enriched = dict(spot)
+        # _handle_spot owns the spot (see its docstring), so no copy is made
+        enriched = spot
         missing: list[str] = []
 
         enriched["dial_freq_hz"] = band_hz
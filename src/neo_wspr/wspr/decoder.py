@@ -9,34 +9,259 @@ extended for streaming input or native bindings in the future.
 
 from __future__ import annotations
 
-import io
+import errno
 import logging
+import mmap
 import os
+import re
 import shutil
 import subprocess
 import tempfile
-from typing import Iterable
+import threading
+from typing import Any, Iterable
 from typing import Iterator, List
 
+import numpy as np
+
 LOG = logging.getLogger(__name__)
 
+# One wsprd output line; compiled once rather than per parsed line.
+_LINE_RE = re.compile(
+    r"(?P<date>\d{4}-\d{2}-\d{2})\s+"
+    r"(?P<time>\d{2}:\d{2}:\d{2})\s+"
+    r"(?P<freq>\d+)\s+"
+    r"(?P<call>\S+)\s+"
+    r"(?P<grid>\S+)\s+"
+    r"(?P<snr>-?\d+)(?:\s+(?P<drift>[-+]?\d+(?:\.\d+)?))?"
+)
+
+# RAM-backed scratch location for wsprd input. wsprd only reads from a named
+# file (no stdin/FIFO input), so a tmpfs is the cheapest place to stage it.
+SHM_DIR = "/dev/shm"
+# Free space to leave on the tmpfs beyond the capture itself.
+SHM_HEADROOM_BYTES = 64 << 20
+# Staging files that can exist at once: one band capturing while the
+# previous one decodes. tmpfs pages are RAM, so a stage only goes there when
+# the tmpfs could hold this many.
+SHM_STAGES = 2
+
+# Buffer size for the wsprd stdout/stderr pipes; lets readline() pull whole
+# blocks from the pipe instead of a syscall per byte.
+WSPRD_PIPE_BUFSIZE = 64 * 1024
+
+# Largest single os.write() used when staging IQ bytes for wsprd.
+IQ_WRITE_CHUNK = 1 << 20
+
+# How long wsprd may keep running after closing stdout before it is killed.
+WSPRD_EXIT_TIMEOUT_S = 10.0
+
+
+def _scratch_dir(nbytes: int) -> str | None:
+    """Return a tmpfs directory with room for ``nbytes``, else ``None``.
+
+    ``None`` means "use the default temp directory".
+    """
+    if not os.path.isdir(SHM_DIR) or not os.access(SHM_DIR, os.W_OK | os.X_OK):
+        return None
+    try:
+        free = shutil.disk_usage(SHM_DIR).free
+    except OSError:
+        return None
+    if free < nbytes + SHM_HEADROOM_BYTES:
+        LOG.debug("Not enough space in %s for %d-byte capture", SHM_DIR, nbytes)
+        return None
+    return SHM_DIR
+
+
+def _reserve(fd: int, nbytes: int) -> None:
+    """Allocate ``nbytes`` for ``fd`` before it is memory-mapped.
+
+    A store to an unbacked page of a sparse mapping on a full tmpfs or disk
+    raises SIGBUS instead of an exception, so the blocks are reserved up
+    front; ``ENOSPC`` surfaces here as an ``OSError``. Falls back to a sparse
+    ``ftruncate`` where ``posix_fallocate`` is unsupported.
+    """
+    try:
+        os.posix_fallocate(fd, 0, nbytes)
+        return
+    except AttributeError:
+        pass
+    except OSError as exc:
+        if exc.errno not in (errno.EOPNOTSUPP, errno.EINVAL, errno.ENOSYS):
+            raise
+    os.ftruncate(fd, nbytes)
+
+
+# Written staging pages are released from RSS in steps of this size.
+STAGE_RELEASE_BYTES = 16 << 20
+_MADV_DONTNEED = getattr(mmap, "MADV_DONTNEED", None)
+
+
+def _lines_from_bytes(chunk: bytes) -> Iterator[str]:
+    # Split before decoding so only short lines are decoded, via the ASCII
+    # fast path for wsprd's (ASCII) output.
+    for raw in chunk.splitlines():
+        yield (
+            raw.decode("ascii")
+            if raw.isascii()
+            else raw.decode("utf-8", errors="replace")
+        )
+
+
+def _lines_from_text(chunk: object) -> list[str]:
+    return (chunk if isinstance(chunk, str) else str(chunk)).splitlines()
+
+
+class IqStagingFile:
+    """Fixed-capacity wsprd input file that samples are converted straight into.
+
+    The file is sized for ``max_samples`` complex samples up front and
+    memory-mapped, so each chunk from the SDR is scaled into the mapping as
+    interleaved little-endian int16 ``I, Q`` pairs (saturating, truncated
+    toward zero) with no intermediate ``bytes`` and no separate file write.
+    It lives on tmpfs when there is room, like
+    :meth:`WsprDecoder.run_wsprd_subprocess` input. Samples beyond the
+    capacity are dropped.
+
+    Call :meth:`close` before handing the file to wsprd (it trims the file to
+    the samples written) and :meth:`cleanup` once decoding is done.
+    """
+
+    def __init__(self, max_samples: int, keep: bool = False) -> None:
+        nbytes = max(1, max_samples) * 4
+        self.capacity = max(1, max_samples)
+        self.samples = 0
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._mm: mmap.mmap | None = None
+        scratch = None if keep else _scratch_dir(nbytes * SHM_STAGES)
+        try:
+            self._map(scratch, nbytes)
+        except OSError as exc:
+            if scratch is None or exc.errno != errno.ENOSPC:
+                raise
+            LOG.warning(
+                "No room for wsprd staging file in %s; using the default temp dir",
+                scratch,
+            )
+            self._map(None, nbytes)
+        self._iq: Any = np.frombuffer(self._mm, dtype="<i2")
+        self._scratch = np.empty(0, dtype=np.float32)
+        self._released = 0
+
+    def _map(self, parent: str | None, nbytes: int) -> None:
+        """Create, reserve and map the staging file in a new temp directory."""
+        self.dir = tempfile.mkdtemp(dir=parent)
+        self.path = os.path.join(self.dir, "capture.c2")
+        try:
+            fd = os.open(self.path, os.O_CREAT | os.O_RDWR | os.O_TRUNC, 0o600)
+            try:
+                _reserve(fd, nbytes)
+                self._mm = mmap.mmap(fd, nbytes)
+            finally:
+                os.close(fd)
+        except OSError:
+            shutil.rmtree(self.dir, ignore_errors=True)
+            raise
+
+    def append(self, samples: Any) -> int:
+        """Convert complex ``samples`` into the file; return how many fit."""
+        pairs = np.ascontiguousarray(samples, dtype=np.complex64).view(np.float32)
+        with self._lock:
+            if self._iq is None:
+                return 0
+            n = min(pairs.size // 2, self.capacity - self.samples)
+            if n <= 0:
+                return 0
+            # Scale and clip in a scratch buffer reused across chunks, then
+            # cast directly into the mapping.
+            if self._scratch.size < 2 * n:
+                self._scratch = np.empty(2 * n, dtype=np.float32)
+            scaled = self._scratch[: 2 * n]
+            np.multiply(pairs[: 2 * n], np.float32(32767), out=scaled)
+            np.clip(scaled, -32768, 32767, out=scaled)
+            start = 2 * self.samples
+            np.copyto(self._iq[start : start + 2 * n], scaled, casting="unsafe")
+            self.samples += n
+            self._release_written()
+            return n
+
+    def _release_written(self) -> None:
+        """Drop already-written pages from this process's resident set.
+
+        Pages of a shared file mapping stay in the file after
+        ``MADV_DONTNEED``, so only the process RSS stays bounded by
+        ``STAGE_RELEASE_BYTES``. System memory use is unchanged: on tmpfs the
+        pages remain in RAM until the file is removed.
+        """
+        if _MADV_DONTNEED is None or self._mm is None:
+            return
+        written = self.samples * 4
+        if written - self._released < STAGE_RELEASE_BYTES:
+            return
+        end = written - written % mmap.PAGESIZE
+        try:
+            self._mm.madvise(_MADV_DONTNEED, self._released, end - self._released)
+        except OSError:
+            LOG.debug("madvise failed on wsprd staging file; keeping pages mapped")
+            self._released = self.capacity * 4  # stop trying
+            return
+        self._released = end
+
+    def close(self) -> None:
+        """Unmap the file and trim it to the samples actually written."""
+        with self._lock:
+            if self._mm is None:
+                return
+            self._iq = None
+            self._mm.close()
+            self._mm = None
+        os.truncate(self.path, self.samples * 4)
+
+    def cleanup(self) -> None:
+        """Close and remove the staging directory unless it is being kept."""
+        self.close()
+        if self.keep:
+            LOG.info("Preserved wsprd temp dir for debugging: %s", self.dir)
+            return
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+# wsprd path found by _locate_wsprd; a miss is not cached.
+_wsprd_path: str | None = None
+
+
+def _locate_wsprd() -> str | None:
+    """Return the wsprd path, probing until a binary is found.
+
+    A successful lookup is reused for the rest of the process; a miss is
+    retried on the next call so a wsprd installed while ``listen`` runs is
+    picked up without a restart.
+    """
+    global _wsprd_path
+    if _wsprd_path is not None:
+        return _wsprd_path
+    # Check bundled
+    bundled = os.path.join(os.path.dirname(__file__), "bin", "wsprd")
+    if os.path.exists(bundled):
+        _wsprd_path = bundled
+    else:
+        # Check system
+        _wsprd_path = shutil.which("wsprd")
+    return _wsprd_path
+
 
 class WsprDecoder:
+    # Shared by every instance and subclass; override with one assignment.
+    _LINE_RE = _LINE_RE
+
     def __init__(self, options: dict | None = None) -> None:
         self.options = options or {}
         self.wsprd_path = self._find_wsprd()
 
     def _find_wsprd(self) -> str | None:
         """Find the wsprd binary, preferring bundled over system."""
-        # Check bundled
-        bundled = os.path.join(os.path.dirname(__file__), "bin", "wsprd")
-        if os.path.exists(bundled):
-            return bundled
-        # Check system
-        system = shutil.which("wsprd")
-        if system:
-            return system
-        return None
+        return _locate_wsprd()
 
     def _parse_line(self, line: str) -> dict | None:
         """Parse a single line of (simulated) wsprd output into a spot dict.
@@ -48,39 +273,35 @@ class WsprDecoder:
         differences in upstream decoder output while providing a stable
         structure for tests.
         """
-        import re
-
         line = line.strip()
         if not line:
             return None
 
-        pattern = re.compile(
-            r"(?P<date>\d{4}-\d{2}-\d{2})\s+"
-            r"(?P<time>\d{2}:\d{2}:\d{2})\s+"
-            r"(?P<freq>\d+)\s+"
-            r"(?P<call>\S+)\s+"
-            r"(?P<grid>\S+)\s+"
-            r"(?P<snr>-?\d+)(?:\s+(?P<drift>[-+]?\d+(?:\.\d+)?))?"
+        # Cheap shape check on the "YYYY-MM-DD " prefix (leading digit first)
+        # so log chatter and "#" comment lines never reach the regex; the
+        # regex still decides for candidate lines.
+        m = (
+            self._LINE_RE.match(line)
+            if len(line) >= 19
+            and line[0].isdigit()
+            and line[4] == "-"
+            and line[7] == "-"
+            and line[10].isspace()
+            else None
         )
-        m = pattern.match(line)
         if not m:
             LOG.debug("Unrecognized wsprd line: %s", line)
             return None
 
-        gd = m.groupdict()
-        ts = f"{gd['date']}T{gd['time']}Z"
-        try:
-            freq_hz = int(gd["freq"])
-        except (TypeError, ValueError):
-            freq_hz = 0
-
+        # Unpack positionally; _LINE_RE guarantees freq/snr are digit runs
+        date, clock, freq, call, grid, snr, drift = m.groups()
         spot = {
-            "timestamp": ts,
-            "freq_hz": freq_hz,
-            "call": gd.get("call"),
-            "grid": gd.get("grid"),
-            "snr_db": int(gd["snr"]),
-            "drift": float(gd["drift"]) if gd.get("drift") else None,
+            "timestamp": f"{date}T{clock}Z",
+            "freq_hz": int(freq),
+            "call": call,
+            "grid": grid,
+            "snr_db": int(snr),
+            "drift": float(drift) if drift else None,
         }
         return spot
 
@@ -91,31 +312,34 @@ class WsprDecoder:
         stdout lines into this method; for unit tests we accept fixture
         lines.
         """
+        parse = self._parse_line  # bound once for the per-line loop
+        # Streams are homogeneous in practice (wsprd stdout is bytes, fixtures
+        # are str), so the line splitter is chosen from the first chunk and
+        # only re-chosen if the chunk type ever changes.
+        kind: type | None = None
+        to_lines = _lines_from_text
         for chunk in line_iter:
-            if isinstance(chunk, bytes):
-                try:
-                    text = chunk.decode("utf-8", errors="replace")
-                except Exception:
-                    text = str(chunk)
-            else:
-                text = str(chunk)
-
-            for raw_line in text.splitlines():
-                parsed = self._parse_line(raw_line)
+            if type(chunk) is not kind:
+                kind = type(chunk)
+                to_lines = _lines_from_bytes if kind is bytes else _lines_from_text
+            for raw_line in to_lines(chunk):
+                parsed = parse(raw_line)
                 if parsed is not None:
                     yield parsed
 
     def run_wsprd_subprocess(
         self,
-        iq_data: bytes,
+        iq_data: bytes | bytearray,
         band_hz: int,
         cmd: List[str] | None = None,
         keep_temp: bool = False,
+        capture_stderr: bool = False,
     ) -> Iterator[dict]:
         """Run `wsprd` as a subprocess, feed IQ data via temp file, and yield parsed spots.
 
-        This function writes the provided IQ data to a temporary file, runs `wsprd`
-        on it, and parses stdout for spots.
+        This function writes the provided IQ data to a temporary file (on
+        ``/dev/shm`` when available), runs `wsprd` on it, and parses stdout
+        for spots.
 
         If the command is not found or the subprocess cannot be started, it logs
         and returns without raising.
@@ -124,114 +348,173 @@ class WsprDecoder:
             iq_data: IQ samples as bytes (int16 little-endian).
             band_hz: The band frequency in Hz.
             cmd: Optional command list; defaults to [wsprd_path, '-f', str(band_hz / 1e6), temp_file].
+            capture_stderr: Log wsprd's stderr at INFO. By default it is logged
+                at DEBUG, and sent to ``/dev/null`` when DEBUG is disabled.
         """
+        if self.wsprd_path is None:
+            self.wsprd_path = self._find_wsprd()
         if self.wsprd_path is None:
             LOG.warning("wsprd binary not found")
             return
 
         # Create temp directory for wsprd output files. Optionally preserve it for debugging.
+        # Throwaway runs are staged on tmpfs when it has room so the capture
+        # never touches the disk; preserved runs stay in the default temp dir.
         temp_dir_ctx = None
         if keep_temp:
             temp_dir = tempfile.mkdtemp()
         else:
-            temp_dir_ctx = tempfile.TemporaryDirectory()
+            temp_dir_ctx = tempfile.TemporaryDirectory(dir=_scratch_dir(len(iq_data)))
             temp_dir = temp_dir_ctx.name
 
-        # Create temp file for IQ data
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=".c2", dir=temp_dir
-        ) as temp_file:
-            temp_file.write(iq_data)
-            temp_file_path = temp_file.name
+        # Create temp file for IQ data, written straight to the descriptor
+        # from a memoryview (no buffered-writer layer, no slice copies).
+        fd, temp_file_path = tempfile.mkstemp(suffix=".c2", dir=temp_dir)
+        try:
+            view = memoryview(iq_data)
+            while view:
+                view = view[os.write(fd, view[:IQ_WRITE_CHUNK]) :]
+        finally:
+            os.close(fd)
 
         try:
-            if cmd is None:
-                cmd = [
-                    self.wsprd_path,
-                    "-a",
-                    temp_dir,
-                    "-f",
-                    str(band_hz / 1e6),
-                    temp_file_path,
-                ]
-
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                bufsize=0,  # Unbuffered
+            yield from self._run_wsprd(
+                temp_file_path, temp_dir, band_hz, cmd, capture_stderr
             )
+        finally:
+            # Clean up temp directory unless user requested to keep it for debugging
+            if keep_temp:
+                LOG.info("Preserved wsprd temp dir for debugging: %s", temp_dir)
+            else:
+                try:
+                    if temp_dir_ctx is not None:
+                        temp_dir_ctx.cleanup()
+                    else:
+                        # fallback: remove dir if exists
+                        shutil.rmtree(temp_dir, ignore_errors=True)
+                except Exception:
+                    LOG.exception("Failed to cleanup wsprd temp dir: %s", temp_dir)
 
-            LOG.debug("Started wsprd: %s", cmd)
-            LOG.debug("wsprd temp file: %s", temp_file_path)
-            try:
-                file_size = os.path.getsize(temp_file_path)
-                samples = file_size // 4
-                inferred_secs = samples / 1_200_000.0
-                LOG.info(
-                    "wsprd input file %s size=%d bytes -> %d complex samples (%.2f s @1.2e6)",
-                    temp_file_path,
-                    file_size,
-                    samples,
+    def run_wsprd_staged(
+        self,
+        stage: IqStagingFile,
+        band_hz: int,
+        cmd: list[str] | None = None,
+        capture_stderr: bool = False,
+    ) -> Iterator[dict]:
+        """Run `wsprd` on a capture already written to an :class:`IqStagingFile`.
+
+        The stage must be closed first; wsprd reads it in place and writes its
+        own output files next to it. Removing the stage is the caller's job.
+        """
+        if self.wsprd_path is None:
+            self.wsprd_path = self._find_wsprd()
+        if self.wsprd_path is None:
+            LOG.warning("wsprd binary not found")
+            return
+        yield from self._run_wsprd(stage.path, stage.dir, band_hz, cmd, capture_stderr)
+
+    def _run_wsprd(
+        self,
+        input_path: str,
+        out_dir: str,
+        band_hz: int,
+        cmd: list[str] | None,
+        capture_stderr: bool = False,
+    ) -> Iterator[dict]:
+        if cmd is None:
+            cmd = [
+                self.wsprd_path,
+                "-a",
+                out_dir,
+                "-f",
+                str(band_hz / 1e6),
+                input_path,
+            ]
+
+        # Unless asked for, stderr is only logged at DEBUG; when that is off
+        # let the kernel drop it instead of piping it to a reader thread.
+        stderr_level = logging.INFO if capture_stderr else logging.DEBUG
+        pipe_stderr = LOG.isEnabledFor(stderr_level)
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE if pipe_stderr else subprocess.DEVNULL,
+            bufsize=WSPRD_PIPE_BUFSIZE,
+        )
+
+        LOG.debug("Started wsprd: %s", cmd)
+        LOG.debug("wsprd temp file: %s", input_path)
+        try:
+            file_size = os.path.getsize(input_path)
+            samples = file_size // 4
+            inferred_secs = samples / 1_200_000.0
+            LOG.info(
+                "wsprd input file %s size=%d bytes -> %d complex samples (%.2f s @1.2e6)",
+                input_path,
+                file_size,
+                samples,
+                inferred_secs,
+            )
+            if inferred_secs < 100:
+                LOG.warning(
+                    "wsprd input duration seems short (%.2fs). wsprd expects ~119s input for WSPR; this may explain missing decodes.",
                     inferred_secs,
                 )
-                if inferred_secs < 100:
-                    LOG.warning(
-                        "wsprd input duration seems short (%.2fs). wsprd expects ~119s input for WSPR; this may explain missing decodes.",
-                        inferred_secs,
-                    )
-            except Exception:
-                LOG.debug("Could not stat wsprd temp file for diagnostics")
-
-            # Start a background thread to capture and log stderr from wsprd
-            import threading
+        except Exception:
+            LOG.debug("Could not stat wsprd temp file for diagnostics")
 
-            def _log_stderr(pipe):
-                try:
-                    if pipe is None:
-                        return
-                    for sline in io.TextIOWrapper(
-                        pipe, encoding="utf-8", errors="replace"
-                    ):
-                        sline = sline.rstrip("\n")
-                        if sline:
-                            LOG.debug("wsprd[stderr]: %s", sline)
-                except Exception:
-                    LOG.exception("Error reading wsprd stderr")
+        # Start a background thread to capture and log stderr from wsprd
+        def _log_stderr(pipe):
+            try:
+                if pipe is None:
+                    return
+                # Same buffered binary readline as stdout; decode only what is logged
+                for raw in iter(pipe.readline, b""):
+                    sline = raw.rstrip(b"\r\n")
+                    if sline:
+                        LOG.log(
+                            stderr_level,
+                            "wsprd[stderr]: %s",
+                            sline.decode("utf-8", "replace"),
+                        )
+            except Exception:
+                LOG.exception("Error reading wsprd stderr")
 
+        stderr_thread = None
+        if proc.stderr is not None:
             stderr_thread = threading.Thread(
                 target=_log_stderr, args=(proc.stderr,), daemon=True
             )
             stderr_thread.start()
 
-            assert proc.stdout is not None
+        assert proc.stdout is not None
+        try:
+            # Read raw lines from the buffered pipe; each is decoded once
+            parse = self._parse_line
+            for raw in iter(proc.stdout.readline, b""):
+                parsed = parse(raw.decode("utf-8", "replace"))
+                if parsed is not None:
+                    yield parsed
+            # stdout hit EOF, so wsprd is exiting on its own; reap it
             try:
-                # Read stdout as text and parse lines for spots
-                for line in io.TextIOWrapper(
-                    proc.stdout, encoding="utf-8", errors="replace"
-                ):
-                    parsed = self._parse_line(line)
-                    if parsed is not None:
-                        yield parsed
-            finally:
+                proc.wait(timeout=WSPRD_EXIT_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                LOG.warning(
+                    "wsprd did not exit within %.0fs of closing stdout; killing it",
+                    WSPRD_EXIT_TIMEOUT_S,
+                )
+        finally:
+            # Only a run that was abandoned early (or hung) is still alive here
+            if proc.poll() is None:
                 try:
-                    proc.terminate()
-                except Exception:
+                    proc.kill()
+                    proc.wait()
+                except OSError:
                     pass
+            proc.stdout.close()
+            if stderr_thread is not None:
                 try:
                     stderr_thread.join(timeout=0.2)
                 except Exception:
                     pass
-        finally:
-            # Clean up temp directory unless user requested to keep it for debugging
-            if keep_temp:
-                LOG.info("Preserved wsprd temp dir for debugging: %s", temp_dir)
-            else:
-                try:
-                    if temp_dir_ctx is not None:
-                        temp_dir_ctx.cleanup()
-                    else:
-                        # fallback: remove dir if exists
-                        shutil.rmtree(temp_dir, ignore_errors=True)
-                except Exception:
-                    LOG.exception("Failed to cleanup wsprd temp dir: %s", temp_dir)
@@ -9,10 +9,26 @@ from __future__ import annotations
 
 import logging
 from typing import Dict, Iterable
-from statistics import median
+
+import numpy as np
+
+from .calibrate import as_float_array
 
 LOG = logging.getLogger(__name__)
 
+# Common nominal WSPR frequencies (Hz) for heuristic matching
+NOMINAL_CENTERS_HZ = (
+    3_572_000,  # 80m
+    5_290_000,  # 60m
+    7_040_000,  # 40m
+    10_140_000,  # 30m
+    14_080_000,  # 20m
+    18_110_000,  # 17m
+    21_080_000,  # 15m
+    28_080_000,  # 10m
+)
+_NOMINAL_CENTERS = np.array(NOMINAL_CENTERS_HZ, dtype=np.float64)
+
 
 def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, object]:
     """Return a heuristic result for upconverter detection.
@@ -28,44 +44,42 @@ def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, ob
     The returned dict includes a `confidence` 0..1 and optional
     `recommended_lo_offset_hz` when a likely offset is detected.
     """
-    LOG.debug("Running upconverter detection heuristic")
-
-    # Common nominal WSPR frequencies (Hz) for heuristic matching
-    nominal_centers = [
-        3_572_000,  # 80m
-        5_290_000,  # 60m
-        7_040_000,  # 40m
-        10_140_000,  # 30m
-        14_080_000,  # 20m
-        18_110_000,  # 17m
-        21_080_000,  # 15m
-        28_080_000,  # 10m
-    ]
-
     if not spots:
         return {"confidence": 0.0, "recommended_lo_offset_hz": None}
 
     spots_list = list(spots)  # Consume iterable once
-    freqs = []
-    snrs = []
-    for s in spots_list:
-        try:
-            f = float(s.get("freq_hz"))
-            freqs.append(f)
-        except Exception:
-            continue
-        try:
-            snr = float(s.get("snr_db"))
-            snrs.append(snr)
-        except Exception:
-            pass
-
-    if not freqs:
+    return detect_upconverter_hint_from_arrays(
+        as_float_array([s.get("freq_hz") for s in spots_list]),
+        as_float_array([s.get("snr_db") for s in spots_list]),
+    )
+
+
+def detect_upconverter_hint_from_arrays(
+    freqs: np.ndarray, snrs: np.ndarray | None = None
+) -> dict[str, object]:
+    """Columnar form of :func:`detect_upconverter_hint`.
+
+    ``freqs`` and ``snrs`` are parallel float arrays (one entry per spot);
+    NaN marks a missing value. SNRs only count for spots with a frequency.
+    """
+    LOG.debug("Running upconverter detection heuristic")
+
+    freqs = np.asarray(freqs, dtype=np.float64)
+    has_freq = ~np.isnan(freqs)
+    if snrs is None:
+        snrs = np.empty(0, dtype=np.float64)
+    else:
+        snrs = np.asarray(snrs, dtype=np.float64)
+        snrs = snrs[has_freq & ~np.isnan(snrs)]
+    freqs = freqs[has_freq]
+
+    if not freqs.size:
         return {"confidence": 0.0, "recommended_lo_offset_hz": None}
 
-    med_freq = median(freqs)
-    # Find nearest nominal center
-    nearest = min(nominal_centers, key=lambda c: abs(c - med_freq))
+    # Median via introselect in C rather than a Python-level sort
+    med_freq = float(np.median(freqs))
+    # Find nearest nominal center (first one wins on a tie)
+    nearest = NOMINAL_CENTERS_HZ[int(np.argmin(np.abs(_NOMINAL_CENTERS - med_freq)))]
     freq_offset = med_freq - nearest
 
     # Heuristic thresholds: if offset > 50 kHz, this may indicate an upconverter
@@ -75,8 +89,8 @@ def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, ob
     # SNR-based heuristic: if distribution is unusual (e.g., consistently degraded),
     # this may indicate a converter impacting noise floor
     snr_confidence = 0.0
-    if snrs:
-        mean_snr = sum(snrs) / len(snrs)
+    mean_snr = float(np.mean(snrs)) if snrs.size else None
+    if mean_snr is not None:
         # Typical SNR for WSPR is -20 to -5 dB; if consistently lower, may indicate
         # upconverter reducing signal (or external LNA boosting).
         # This is a soft indicator (confidence 0.2 max) since many factors affect SNR.
@@ -96,7 +110,7 @@ def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, ob
             "freq_offset_hz": int(freq_offset),
             "median_freq_hz": int(med_freq),
             "nominal_center_hz": nearest,
-            "mean_snr_db": round(sum(snrs) / len(snrs), 2) if snrs else None,
+            "mean_snr_db": round(mean_snr, 2) if mean_snr is not None else None,
         }
     return {
         "confidence": 0.0,
@@ -104,5 +118,5 @@ def detect_upconverter_hint(spots: Iterable[dict] | None = None) -> Dict[str, ob
         "freq_offset_hz": int(freq_offset) if freq_offset else None,
         "median_freq_hz": int(med_freq),
         "nominal_center_hz": nearest,
-        "mean_snr_db": round(sum(snrs) / len(snrs), 2) if snrs else None,
+        "mean_snr_db": round(mean_snr, 2) if mean_snr is not None else None,
     }
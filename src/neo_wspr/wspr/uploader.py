@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 import tempfile
@@ -11,6 +10,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict, Iterable, List, Optional, cast
 
+from neo_core import jsonio
+
 # Import version from neo_rx package to maintain compatibility during migration
 try:
     from neo_rx import __version__
@@ -72,8 +73,8 @@ class WsprUploader:
     def enqueue_spot(self, spot: Dict) -> None:
         """Append a spot to the on-disk queue (JSON-lines)."""
         try:
-            with self.queue_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(spot, default=str) + "\n")
+            with self.queue_path.open("ab") as fh:
+                fh.write(jsonio.dumps(spot) + b"\n")
         except Exception:
             LOG.exception("Failed to enqueue spot to %s", self.queue_path)
 
@@ -82,13 +83,13 @@ class WsprUploader:
             return []
         items: List[Dict] = []
         try:
-            with self.queue_path.open("r", encoding="utf-8") as fh:
+            with self.queue_path.open("rb") as fh:
                 for line in fh:
                     line = line.strip()
                     if not line:
                         continue
                     try:
-                        items.append(json.loads(line))
+                        items.append(jsonio.loads(line))
                     except Exception:
                         LOG.exception("Skipping malformed queue line")
         except FileNotFoundError:
@@ -103,9 +104,8 @@ class WsprUploader:
         os.close(tmp_fd)
         tmp_file = Path(tmp_path)
         try:
-            with tmp_file.open("w", encoding="utf-8") as fh:
-                for item in remaining:
-                    fh.write(json.dumps(item, default=str) + "\n")
+            with tmp_file.open("wb") as fh:
+                fh.writelines(jsonio.dumps(item) + b"\n" for item in remaining)
             tmp_file.replace(self.queue_path)
         finally:
             try:
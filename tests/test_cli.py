@@ -106,6 +106,28 @@ def test_cli_aprs_setup_help(capsys) -> None:
     assert "--non-interactive" in captured.out
 
 
+def test_build_parser_lists_subcommands_in_order() -> None:
+    parser = cli.build_parser()
+    subparser_map = parser._nesdr_subparser_map
+    assert {"listen", "setup", "diagnostics"} <= set(subparser_map)
+    help_text = parser.format_help()
+    positions = [help_text.index(f"    {name}") for name in ("listen", "setup")]
+    assert positions == sorted(positions)
+
+
+def test_main_reuses_one_parser_across_calls(capsys) -> None:
+    cli._reset_parser_cache()
+    for argv in (["wspr", "scan", "--help"], ["aprs", "setup", "--help"]):
+        with pytest.raises(SystemExit):
+            cli.main(argv)
+        if argv[0] == "wspr":
+            parser = cli._PARSER
+    assert cli._PARSER is parser
+    assert "neo-rx aprs setup" in capsys.readouterr().out
+    cli._reset_parser_cache()
+    assert cli._PARSER is None
+
+
 def test_resolve_log_level_prefers_argument(monkeypatch) -> None:
     monkeypatch.delenv("NEO_RX_LOG_LEVEL", raising=False)
     assert cli._resolve_log_level(" 42 ") == 42
@@ -116,6 +138,13 @@ def test_resolve_log_level_falls_back_to_env(monkeypatch) -> None:
     assert cli._resolve_log_level(None) == logging.DEBUG
 
 
+def test_resolve_log_level_sees_env_changes_and_skips_invalid(monkeypatch) -> None:
+    monkeypatch.setenv("NEO_RX_LOG_LEVEL", "warning")
+    assert cli._resolve_log_level("bogus") == logging.WARNING
+    monkeypatch.setenv("NEO_RX_LOG_LEVEL", "error")
+    assert cli._resolve_log_level(None) == logging.ERROR
+
+
 def test_configure_logging_handles_oserror(monkeypatch) -> None:
     monkeypatch.delenv("NEO_RX_LOG_LEVEL", raising=False)
 
@@ -160,6 +189,108 @@ def test_main_defaults_to_listen_when_no_command() -> None:
     assert excinfo.value.code == 2  # argparse error code
 
 
+def test_usage_errors_and_version_skip_logging_setup(monkeypatch, capsys) -> None:
+    def fail(_level):  # pragma: no cover - only runs on regression
+        raise AssertionError("logging configured")
+
+    monkeypatch.setattr(cli, "_configure_logging", fail)
+    for argv in ([], ["--no-color"], ["--version"]):
+        with pytest.raises(SystemExit):
+            cli.main(argv)
+
+
+def test_configure_logging_buffers_and_defers_log_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("NEO_RX_LOG_LEVEL", raising=False)
+    monkeypatch.setattr(cli.config_module, "get_data_dir", lambda: tmp_path)
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    try:
+        cli._configure_logging(None)
+        log_file = tmp_path / "logs" / "aprs" / "neo-rx.log"
+        assert not log_file.exists()
+        logging.getLogger("neo_rx.test").info("hello")
+        assert not log_file.exists()  # still buffered in memory
+        logging.getLogger("neo_rx.test").warning("careful")
+        assert "hello" in log_file.read_text(encoding="utf-8")
+    finally:
+        for handler in root.handlers:
+            handler.close()
+        root.handlers[:] = saved
+
+
+def test_buffered_file_handlers_share_one_flusher(tmp_path, monkeypatch) -> None:
+    started: list[str] = []
+    real_thread = cli.threading.Thread
+
+    def counting_thread(*args, **kwargs):
+        started.append(kwargs.get("name", ""))
+        return real_thread(*args, **kwargs)
+
+    monkeypatch.setattr(cli, "_log_flusher", None)
+    monkeypatch.setattr(cli.threading, "Thread", counting_thread)
+    handlers = [
+        cli._BufferedFileHandler(logging.FileHandler(tmp_path / f"{n}.log", delay=True))
+        for n in range(3)
+    ]
+    try:
+        assert started == ["neo-rx-log-flush"]
+        assert set(handlers) <= set(cli._buffered_handlers)
+    finally:
+        for handler in handlers:
+            handler.close()
+    assert not set(handlers) & set(cli._buffered_handlers)
+
+
+def test_configure_logging_creates_each_log_dir_once(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("NEO_RX_LOG_LEVEL", raising=False)
+    monkeypatch.setattr(cli, "_log_dirs_ready", set())
+    monkeypatch.setattr(cli.logging, "basicConfig", lambda **_: None)
+    calls: list[object] = []
+
+    class CountingPath(type(tmp_path)):
+        def mkdir(self, *args, **kwargs):
+            calls.append(self)
+            return super().mkdir(*args, **kwargs)
+
+    monkeypatch.setattr(
+        cli.config_module, "get_data_dir", lambda: CountingPath(tmp_path)
+    )
+    cli._configure_logging(None)
+    first = len(calls)
+    cli._configure_logging(None)
+    assert first >= 1 and len(calls) == first
+
+    other = tmp_path / "other"
+    monkeypatch.setattr(cli.config_module, "get_data_dir", lambda: CountingPath(other))
+    cli._configure_logging(None)
+    assert len(calls) > first and (other / "logs" / "aprs").is_dir()
+
+
+def test_configure_logging_reuses_matching_setup(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("NEO_RX_LOG_LEVEL", raising=False)
+    monkeypatch.setattr(cli.config_module, "get_data_dir", lambda: tmp_path)
+    root = logging.getLogger()
+    saved = root.handlers[:]
+    cli.reset_logging()
+    try:
+        cli._configure_logging("info")
+        installed = root.handlers[:]
+        cli._configure_logging("INFO")
+        assert root.handlers == installed
+
+        cli._configure_logging("debug")
+        assert root.handlers != installed
+        cli.reset_logging()
+        current = root.handlers[:]
+        cli._configure_logging("debug")
+        assert root.handlers != current
+    finally:
+        for handler in root.handlers:
+            handler.close()
+        root.handlers[:] = saved
+        cli.reset_logging()
+
+
 def test_main_injects_listen_for_flag_only_invocation() -> None:
     # New CLI requires mode - flags alone don't default to listen
     with pytest.raises(SystemExit) as excinfo:
@@ -296,8 +427,9 @@ def test_listen_command_once(tmp_path, monkeypatch, capsys) -> None:
         def start(self) -> None:
             self.started = True
 
-        def read(self, num_bytes: int) -> bytes:
-            return b"\x00" * num_bytes
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:] = bytes(len(buffer))
+            return len(buffer)
 
         def stop(self) -> None:
             self.started = False
@@ -421,8 +553,9 @@ def test_listen_reconnect_and_stats(tmp_path, monkeypatch, capsys) -> None:
         def start(self) -> None:
             self.started = True
 
-        def read(self, num_bytes: int) -> bytes:
-            return b"\x00" * num_bytes
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:] = bytes(len(buffer))
+            return len(buffer)
 
         def stop(self) -> None:
             self.started = False
@@ -62,3 +62,28 @@ def test_get_config_dir_prefers_existing_legacy(monkeypatch, tmp_path) -> None:
     resolved = config_module.get_config_dir()
 
     assert resolved == legacy_dir
+
+
+def test_get_data_dir_follows_environment_changes(monkeypatch, tmp_path):
+    monkeypatch.delenv("NEO_RX_DATA_DIR", raising=False)
+    monkeypatch.delenv("NEO_RX_INSTANCE_ID", raising=False)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "a"))
+
+    first = config_module.get_data_dir()
+    assert first == tmp_path / "a" / "neo-rx"
+    assert first.is_dir()
+
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "b"))
+    assert config_module.get_data_dir() == tmp_path / "b" / "neo-rx"
+
+
+def test_get_data_dir_recreates_removed_directory(monkeypatch, tmp_path):
+    monkeypatch.delenv("NEO_RX_DATA_DIR", raising=False)
+    monkeypatch.delenv("NEO_RX_INSTANCE_ID", raising=False)
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path))
+
+    first = config_module.get_data_dir()
+    first.rmdir()
+
+    assert config_module.get_data_dir() == first
+    assert first.is_dir()
@@ -0,0 +1,44 @@
+"""Tests for the shared JSON helpers."""
+
+import io
+import json
+
+import pytest
+
+from neo_core import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(jsonio, "_orjson", None)
+    elif jsonio._orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_dumps_is_compact_bytes(backend):
+    payload = jsonio.dumps({"call": "K1ABC", "snr_db": -12})
+    assert isinstance(payload, bytes)
+    assert payload == b'{"call":"K1ABC","snr_db":-12}'
+
+
+def test_dumps_stringifies_unknown_types(backend):
+    payload = jsonio.dumps({"value": object})
+    assert json.loads(payload)["value"] == str(object)
+
+
+def test_write_json_uses_binary_buffer(backend, capsys):
+    print("before", flush=False)
+    jsonio.write_json([{"band_hz": 14080000}], indent=True)
+
+    out = capsys.readouterr().out
+    head, _, body = out.partition("\n")
+    assert head == "before"
+    assert json.loads(body) == [{"band_hz": 14080000}]
+
+
+def test_write_json_falls_back_to_text_stream(backend):
+    stream = io.StringIO()
+    jsonio.write_json({"ok": True}, stream)
+    assert stream.getvalue() == '{"ok":true}\n'
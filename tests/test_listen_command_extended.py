@@ -273,8 +273,8 @@ def test_run_listen_kiss_unreachable(monkeypatch, tmp_path, caplog) -> None:
         def stop(self) -> None:
             self.stopped = True
 
-        def read(self, _size: int) -> bytes:
-            return b""
+        def read_into(self, _buffer: memoryview) -> int:
+            return 0
 
     class FakeThread:
         def __init__(self, *_args, **_kwargs):
@@ -357,8 +357,9 @@ def test_run_listen_receive_only_once(monkeypatch, tmp_path, caplog) -> None:
         def start(self) -> None:
             self.started = True
 
-        def read(self, num_bytes: int) -> bytes:
-            return b"\x00" * num_bytes
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:] = bytes(len(buffer))
+            return len(buffer)
 
         def stop(self) -> None:
             self.stopped = True
@@ -458,8 +459,9 @@ def test_apply_software_tocall_before_send(monkeypatch, tmp_path, caplog) -> Non
         def start(self) -> None:
             self.started = True
 
-        def read(self, num_bytes: int) -> bytes:
-            return b"\x00" * num_bytes
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:] = bytes(len(buffer))
+            return len(buffer)
 
         def stop(self) -> None:
             self.stopped = True
@@ -601,14 +603,15 @@ def test_run_listen_aprs_connect_failure(monkeypatch, tmp_path, caplog) -> None:
         def start(self) -> None:
             return None
 
-        def read(self, _num_bytes: int) -> bytes:
+        def read_into(self, buffer: memoryview) -> int:
             self.calls += 1
             if self.calls == 1:
-                return b""
+                return 0
             if self.calls == 2:
-                return b"audio"
+                buffer[:5] = b"audio"
+                return 5
             created_events[0].set()
-            return b""
+            return 0
 
         def stop(self) -> None:
             return None
@@ -686,8 +689,9 @@ def test_run_listen_timeout_triggers_polling(monkeypatch, tmp_path, caplog) -> N
         def start(self) -> None:
             return None
 
-        def read(self, _num_bytes: int) -> bytes:
-            return b"audio"
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:5] = b"audio"
+            return 5
 
         def stop(self) -> None:
             return None
@@ -770,8 +774,9 @@ def test_run_listen_kiss_client_error(monkeypatch, tmp_path, caplog) -> None:
         def start(self) -> None:
             return None
 
-        def read(self, _num_bytes: int) -> bytes:
-            return b"audio"
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:5] = b"audio"
+            return 5
 
         def stop(self) -> None:
             return None
@@ -855,8 +860,9 @@ def test_run_listen_skips_bad_frame(monkeypatch, tmp_path, caplog) -> None:
         def start(self) -> None:
             return None
 
-        def read(self, _num_bytes: int) -> bytes:
-            return b"audio"
+        def read_into(self, buffer: memoryview) -> int:
+            buffer[:5] = b"audio"
+            return 5
 
         def stop(self) -> None:
             return None
@@ -55,6 +55,8 @@ def test_buffer_message_when_not_connected(monkeypatch, tmp_path):
     # Don't call connect, so we're not connected
     # Publish should buffer the message
     pub.publish("neo_rx/wspr/spots", {"call": "K1ABC"})
+    # Disk writes happen on the buffer writer thread
+    pub.flush()
 
     queue_dir = tmp_path / "queue"
     files = list(queue_dir.glob("*.json"))
@@ -64,6 +66,86 @@ def test_buffer_message_when_not_connected(monkeypatch, tmp_path):
     assert "K1ABC" in record["body"]
 
 
+def test_publish_sends_encoded_bytes_when_connected(monkeypatch, tmp_path):
+    monkeypatch.setattr(mp.time, "sleep", lambda x: None)
+    mock = MockClient()
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: mock))
+
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    pub.connect()
+    pub.publish("neo_rx/wspr/spots", {"call": "K1ABC", "snr_db": -12})
+
+    topic, body = mock._publish_calls[-1]
+    assert topic == "neo_rx/wspr/spots"
+    assert isinstance(body, bytes)
+    assert json.loads(body) == {"call": "K1ABC", "snr_db": -12}
+    assert not list((tmp_path / "queue").glob("*.json"))
+
+
+def test_buffering_does_not_block_publisher(monkeypatch, tmp_path):
+    """Disk writes for buffered messages run on the writer thread."""
+    import threading
+
+    monkeypatch.setattr(mp.time, "sleep", lambda x: None)
+    mock = MockClient()
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: mock))
+
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    release = threading.Event()
+    real_enqueue = pub._enqueue_messages
+
+    def slow_enqueue(*args):
+        release.wait(timeout=5)
+        real_enqueue(*args)
+
+    monkeypatch.setattr(pub, "_enqueue_messages", slow_enqueue)
+
+    pub.publish("neo_rx/test", {"msg": 1})
+    assert not list((tmp_path / "queue").glob("*.json"))
+
+    release.set()
+    # Pending writes land and are drained by the writer once the broker connects
+    pub.connect()
+    pub.flush()
+    assert [topic for topic, _ in mock._publish_calls] == ["neo_rx/test"]
+    assert not list((tmp_path / "queue").glob("*.json"))
+
+
+def test_on_connect_hands_drain_to_writer(monkeypatch, tmp_path):
+    """on_connect returns while the writer is busy; the writer drains later."""
+    import threading
+
+    monkeypatch.setattr(mp.time, "sleep", lambda x: None)
+    mock = MockClient()
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: mock))
+
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    release = threading.Event()
+    real_enqueue = pub._enqueue_messages
+    drain_threads = []
+    real_drain = pub._drain_buffer
+
+    def slow_enqueue(*args):
+        release.wait(timeout=5)
+        real_enqueue(*args)
+
+    def record_drain():
+        drain_threads.append(threading.current_thread())
+        real_drain()
+
+    monkeypatch.setattr(pub, "_enqueue_messages", slow_enqueue)
+    monkeypatch.setattr(pub, "_drain_buffer", record_drain)
+
+    pub.publish("neo_rx/test", {"msg": 1})
+    pub.connect()
+    assert mock._publish_calls == []
+
+    release.set()
+    pub.flush()
+    assert drain_threads == [pub._writer]
+    assert [topic for topic, _ in mock._publish_calls] == ["neo_rx/test"]
+
+
 def test_drain_buffer_on_connect(monkeypatch, tmp_path):
     """When connection is established, buffered messages should be sent."""
     monkeypatch.setattr(mp.time, "sleep", lambda x: None)
@@ -83,6 +165,7 @@ def test_drain_buffer_on_connect(monkeypatch, tmp_path):
 
     pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
     pub.connect()
+    pub.flush()
 
     # Queue should be drained and file should be removed
     files = list(queue_dir.glob("*.json"))
@@ -108,6 +191,7 @@ def test_buffer_rotation_at_capacity(monkeypatch, tmp_path):
     # Publish 5 messages while disconnected
     for i in range(5):
         pub.publish("neo_rx/test", {"msg": i})
+    pub.flush()
 
     queue_dir = tmp_path / "queue"
     files = sorted(queue_dir.glob("*.json"))
@@ -121,6 +205,29 @@ def test_buffer_rotation_at_capacity(monkeypatch, tmp_path):
     assert msgs == [2, 3, 4]
 
 
+def test_enqueue_does_not_rescan_queue(monkeypatch, tmp_path):
+    """Queue depth is tracked in memory rather than recounted per message."""
+    monkeypatch.setattr(mp.time, "sleep", lambda x: None)
+    monkeypatch.setattr(
+        mp,
+        "mqtt",
+        types.SimpleNamespace(Client=lambda: MockClient({"connect_fail_times": 999})),
+    )
+
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    calls = []
+    real_size = pub._queue.size
+    monkeypatch.setattr(pub._queue, "size", lambda: calls.append(1) or real_size())
+
+    for i in range(5):
+        pub.publish("neo_rx/test", {"msg": i})
+    pub.flush()
+
+    assert calls == []
+    assert pub._queued_count == 5
+    assert len(list((tmp_path / "queue").glob("*.json"))) == 5
+
+
 def test_partial_drain_on_publish_failure(monkeypatch, tmp_path):
     """If some buffered messages fail to publish, they should remain in buffer."""
     monkeypatch.setattr(mp.time, "sleep", lambda x: None)
@@ -147,6 +254,7 @@ def test_partial_drain_on_publish_failure(monkeypatch, tmp_path):
 
     pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
     pub.connect()
+    pub.flush()
 
     # Queue should still contain the failed messages
     files = sorted((tmp_path / "queue").glob("*.json"))
@@ -165,3 +273,16 @@ def test_buffer_dir_creation(monkeypatch, tmp_path):
 
     assert buffer_dir.exists()
     assert buffer_dir.is_dir()
+
+
+def test_default_buffer_dir_used_when_unset(monkeypatch, tmp_path):
+    """Without buffer_dir the module-level default location is used."""
+    import neo_telemetry.mqtt_publisher as impl
+
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: MockClient()))
+    monkeypatch.setattr(impl, "DEFAULT_BUFFER_DIR", tmp_path / "state")
+
+    pub = mp.MqttPublisher(host="fake", port=1883)
+
+    assert pub._buffer_dir == tmp_path / "state"
+    assert (tmp_path / "state" / "queue").is_dir()
@@ -1,5 +1,7 @@
 """Durability tests: ensure OnDiskQueue persists across restarts and drains."""
 
+import json
+import logging
 import types
 
 
@@ -52,6 +54,7 @@ def test_queue_persists_across_restart(monkeypatch, tmp_path):
     pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
     pub.publish("neo_rx/wspr/spot", {"n": 1})
     pub.publish("neo_rx/wspr/spot", {"n": 2})
+    pub.close()
 
     queue_dir = tmp_path / "queue"
     files = list(queue_dir.glob("*.json"))
@@ -62,6 +65,7 @@ def test_queue_persists_across_restart(monkeypatch, tmp_path):
     monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: mock))
     new_pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
     new_pub.connect()
+    new_pub.flush()
 
     # both messages should have been published and queue emptied
     assert len(mock._publish_calls) == 2
@@ -77,6 +81,7 @@ def test_partial_delivery_on_restart_leaves_failed(monkeypatch, tmp_path):
     pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
     for i in range(3):
         pub.publish(f"neo_rx/test/{i}", {"msg": i})
+    pub.close()
 
     # Simulate restart with a client that will fail on the first publish only
     behavior = {"publish_fail_times": 1}
@@ -85,6 +90,7 @@ def test_partial_delivery_on_restart_leaves_failed(monkeypatch, tmp_path):
 
     new_pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
     new_pub.connect()
+    new_pub.flush()
 
     # One publish failed and should remain; the other two should have been sent
     # Since the failing message is processed in file order, one file should remain
@@ -92,3 +98,160 @@ def test_partial_delivery_on_restart_leaves_failed(monkeypatch, tmp_path):
     assert len(queue_files) == 1
     # Ensure total published calls equals 2 (the successful ones)
     assert len(mock._publish_calls) == 2
+
+
+def test_ondisk_queue_read_roundtrip(tmp_path):
+    """Queued records are read back from raw bytes, including non-ASCII text."""
+    from neo_telemetry.ondisk_queue import OnDiskQueue
+
+    queue = OnDiskQueue(tmp_path / "queue")
+    queue.enqueue({"topic": "neo_rx/test", "body": '{"call":"ÆØÅ"}', "ts": 1})
+
+    (path,) = queue.list()
+    assert queue.read(path) == {
+        "topic": "neo_rx/test",
+        "body": '{"call":"ÆØÅ"}',
+        "ts": 1,
+    }
+
+
+def test_ondisk_queue_enqueue_syncs_before_rename(monkeypatch, tmp_path):
+    """Each record is flushed to disk unless sync is disabled."""
+    from neo_telemetry import ondisk_queue
+
+    synced: list[int] = []
+    monkeypatch.setattr(ondisk_queue, "_datasync", synced.append)
+
+    ondisk_queue.OnDiskQueue(tmp_path / "durable").enqueue({"n": 1})
+    assert len(synced) == 1
+
+    fast = ondisk_queue.OnDiskQueue(tmp_path / "fast", sync=False)
+    fast.enqueue({"n": 2})
+    assert len(synced) == 1
+    (path,) = fast.list()
+    assert fast.read(path) == {"n": 2}
+    assert not list((tmp_path / "fast").glob("*.tmp"))
+
+
+def test_ondisk_queue_enqueue_batch_preserves_order(monkeypatch, tmp_path):
+    """A batch is written, synced once per file, then renamed in order."""
+    from neo_telemetry import ondisk_queue
+
+    synced: list[int] = []
+    monkeypatch.setattr(ondisk_queue, "_datasync", synced.append)
+
+    queue = ondisk_queue.OnDiskQueue(tmp_path / "queue")
+    assert queue.enqueue_batch({"n": n} for n in range(12)) == 12
+
+    assert len(synced) == 12
+    assert [queue.read(p)["n"] for p in queue.list()] == list(range(12))
+    assert not list((tmp_path / "queue").glob("*.tmp"))
+
+
+def test_ondisk_queue_tracks_files_without_rescanning(monkeypatch, tmp_path):
+    """The directory is scanned once; enqueue/remove keep the index current."""
+    from neo_telemetry.ondisk_queue import OnDiskQueue
+
+    queue_dir = tmp_path / "queue"
+    queue_dir.mkdir()
+    (queue_dir / "20260101T000000000000Z-0f1e2d3c.json").write_bytes(b'{"n": 0}')
+
+    queue = OnDiskQueue(queue_dir, sync=False)
+
+    def no_scan(self):
+        raise AssertionError("directory rescanned")
+
+    monkeypatch.setattr(type(queue_dir), "iterdir", no_scan)
+
+    queue.enqueue({"n": 1})
+    queue.enqueue_batch([{"n": 2}, {"n": 3}])
+    assert queue.size() == 4
+    assert [queue.read(p)["n"] for p in queue.dequeue_batch(2)] == [0, 1]
+
+    queue.remove(queue.list()[0])
+    assert queue.size() == 3
+    assert [queue.read(p)["n"] for p in queue.list()] == [1, 2, 3]
+
+
+def test_ondisk_queue_migrates_legacy_names(tmp_path):
+    """Files named by the old strftime scheme keep their place in the queue."""
+    from neo_telemetry.ondisk_queue import OnDiskQueue
+
+    queue_dir = tmp_path / "queue"
+    queue_dir.mkdir()
+    legacy = {
+        "20260315T120000000002Z-9b8c7d6e5f4a3b2c1d0e9f8a7b6c5d4e.json": 1,
+        "20260315T120000000001Z-0a1b2c3d4e5f60718293a4b5c6d7e8f9.json": 0,
+    }
+    for name, n in legacy.items():
+        (queue_dir / name).write_bytes(b'{"n": %d}' % n)
+
+    queue = OnDiskQueue(queue_dir, sync=False)
+    queue.enqueue({"n": 2})
+
+    assert [queue.read(p)["n"] for p in queue.list()] == [0, 1, 2]
+    assert not any((queue_dir / name).exists() for name in legacy)
+    # The drop-oldest path removes the legacy backlog first.
+    queue.remove(queue.dequeue_batch(1)[0])
+    assert [queue.read(p)["n"] for p in queue.list()] == [1, 2]
+    # A fresh instance sees the migrated names in the same order.
+    assert [p.name for p in OnDiskQueue(queue_dir).list()] == [
+        p.name for p in queue.list()
+    ]
+
+
+def test_drain_skips_files_removed_outside_queue(monkeypatch, tmp_path, caplog):
+    """A queued file deleted by someone else is dropped quietly, once."""
+    monkeypatch.setattr(mp.time, "sleep", lambda x: None)
+    behavior = {"connect_fail_times": 999}
+    monkeypatch.setattr(
+        mp, "mqtt", types.SimpleNamespace(Client=lambda: MockClient(behavior))
+    )
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    for n in range(3):
+        pub.publish("neo_rx/test", {"n": n})
+    pub.flush()
+
+    first = pub._queue.list()[0]
+    first.unlink()
+
+    mock = MockClient()
+    pub._client = mock
+    with caplog.at_level(logging.DEBUG):
+        pub._drain_buffer()
+
+    assert [json.loads(body)["n"] for _, body in mock._publish_calls] == [1, 2]
+    assert pub._queue.size() == 0
+    assert pub._queued_count == 0
+    assert not [r for r in caplog.records if r.exc_info]
+    pub.close()
+
+
+def test_drain_stops_at_first_publish_error_rc(monkeypatch, tmp_path):
+    """A non-zero publish rc leaves that message and the rest queued."""
+    monkeypatch.setattr(mp.time, "sleep", lambda x: None)
+
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: MockClient()))
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    for n in range(3):
+        pub.publish("neo_rx/wspr/spot", {"n": n})
+    pub.close()
+
+    class NoConnClient(MockClient):
+        def publish(self, topic, body):
+            self._attempts += 1
+            if self._attempts >= 2:
+                return types.SimpleNamespace(rc=4)  # MQTT_ERR_NO_CONN
+            self._publish_calls.append((topic, body))
+            return types.SimpleNamespace(rc=0)
+
+    mock = NoConnClient()
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: mock))
+    new_pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    new_pub.connect()
+    new_pub.flush()
+
+    assert len(mock._publish_calls) == 1
+    # Drain stopped after the failed publish instead of trying the third one
+    assert mock._attempts == 2
+    assert len(list((tmp_path / "queue").glob("*.json"))) == 2
@@ -168,3 +168,61 @@ def test_cli_publisher_wiring(monkeypatch):
     assert result == 0
     assert len(published) == 2
     assert all(topic == cfg.mqtt_topic for topic, _payload in published)
+
+
+def test_paho_not_imported_until_publisher_constructed():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import neo_rx.telemetry.mqtt_publisher\n"
+        "assert 'paho.mqtt.client' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class AsyncMockClient(MockClient):
+    """Client exposing paho's connect_async; the handshake completes later."""
+
+    def __init__(self, behavior=None):
+        super().__init__(behavior)
+        self.async_calls = []
+        self.loop_started_after_connect = None
+
+    def connect_async(self, host, port):
+        self.async_calls.append((host, port))
+
+    def reconnect_delay_set(self, min_delay, max_delay):
+        self.reconnect_delay = (min_delay, max_delay)
+
+    def loop_start(self):
+        self.loop_started_after_connect = bool(self.async_calls)
+
+
+def test_connect_async_returns_without_blocking(monkeypatch, tmp_path):
+    def no_sleep(_x):
+        raise AssertionError("connect() should not sleep with connect_async")
+
+    monkeypatch.setattr(mp.time, "sleep", no_sleep)
+    client = AsyncMockClient()
+    monkeypatch.setattr(mp, "mqtt", types.SimpleNamespace(Client=lambda: client))
+
+    pub = mp.MqttPublisher(host="fake", port=1883, buffer_dir=tmp_path)
+    pub.connect()
+
+    assert client.async_calls == [("fake", 1883)]
+    assert client.loop_started_after_connect is True
+    assert client._connect_calls == 0
+    assert pub.wait_connected(timeout=0) is False
+
+    # Messages published before the handshake are buffered, then drained
+    pub.publish("neo_rx/wspr/spots", {"call": "K1ABC"})
+    client.on_connect(client, None, None, 0)
+    pub.flush()
+
+    assert pub.wait_connected(timeout=0) is True
+    assert len(client._publish_calls) == 1
+
+    client.on_disconnect(client, None, 1)
+    assert pub.wait_connected(timeout=0) is False
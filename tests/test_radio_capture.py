@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import io
+import threading
 from typing import Any
 
 import pytest
@@ -101,6 +102,29 @@ def test_rtl_fm_capture_builds_command(monkeypatch) -> None:
     capture.stop()
 
 
+def test_rtl_fm_capture_buffers_stdout(monkeypatch) -> None:
+    popen_kwargs: list[dict[str, Any]] = []
+
+    def fake_popen(args: list[str], **kwargs: Any) -> _FakeProcess:
+        popen_kwargs.append(kwargs)
+        return _FakeProcess(args)
+
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.shutil.which", lambda _: "/usr/bin/rtl_fm")
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.subprocess.Popen", fake_popen)
+
+    small = RtlFmAudioCapture(RtlFmConfig(frequency_hz=144_390_000))
+    small.start()
+    small.stop()
+    large = RtlFmAudioCapture(
+        RtlFmConfig(frequency_hz=144_390_000, read_chunk_bytes=1 << 16)
+    )
+    large.start()
+    large.stop()
+
+    assert popen_kwargs[0]["bufsize"] == max(4096, io.DEFAULT_BUFFER_SIZE)
+    assert popen_kwargs[1]["bufsize"] == 1 << 16
+
+
 def test_rtl_fm_missing_command(monkeypatch) -> None:
     monkeypatch.setattr(f"{CAPTURE_MODULE}.shutil.which", lambda _: None)
     capture = RtlFmAudioCapture(RtlFmConfig(frequency_hz=144_390_000))
@@ -168,3 +192,87 @@ def test_rtl_fm_exit_reports_stderr(monkeypatch) -> None:
     assert "Hint:" in message
     assert "Ensure no other software" in message
     capture.stop()
+
+
+def test_rtl_fm_stderr_tail_keeps_last_lines(monkeypatch) -> None:
+    noise = b"".join(b"tuner noise line %d\n" % i for i in range(2000))
+    stderr_data = noise + b"usb_claim_interface error -6\n"
+
+    class _FailingProcess(_FakeProcess):
+        def __init__(self, args: list[str]) -> None:
+            super().__init__(args, data=b"", stderr_data=stderr_data, return_code=1)
+
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.shutil.which", lambda _: "/usr/bin/rtl_fm")
+    monkeypatch.setattr(
+        f"{CAPTURE_MODULE}.subprocess.Popen",
+        lambda args, **_: _FailingProcess(args),
+    )
+
+    capture = RtlFmAudioCapture(RtlFmConfig(frequency_hz=144_390_000))
+    capture.start()
+
+    with pytest.raises(AudioCaptureError) as exc:
+        capture.read(8)
+    tail = str(exc.value).split("stderr tail: ", 1)[1].split("\n", 1)[0]
+    parts = tail.split(" | ")
+    assert len(parts) == 8
+    assert parts[0] == "tuner noise line 1993"
+    assert parts[-1] == "usb_claim_interface error -6"
+    assert "could not claim the SDR" in str(exc.value)
+    capture.stop()
+
+
+def test_rtl_fm_stop_kills_unresponsive_process(monkeypatch) -> None:
+    class _StuckProcess(_FakeProcess):
+        def __init__(self, args: list[str]) -> None:
+            super().__init__(args)
+            self._exited = threading.Event()
+
+        def wait(self, timeout: float | None = None) -> int | None:
+            self._exited.wait()
+            return -9
+
+        def kill(self) -> None:
+            super().kill()
+            self._exited.set()
+
+    processes: list[_StuckProcess] = []
+
+    def fake_popen(args: list[str], **_: Any) -> _StuckProcess:
+        processes.append(_StuckProcess(args))
+        return processes[-1]
+
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.shutil.which", lambda _: "/usr/bin/rtl_fm")
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.subprocess.Popen", fake_popen)
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.STOP_TIMEOUT_S", 0.01)
+
+    capture = RtlFmAudioCapture(RtlFmConfig(frequency_hz=144_390_000))
+    capture.start()
+    capture.stop()
+
+    assert processes[0].terminated
+    assert processes[0].killed
+
+
+def test_rtl_fm_read_into_reuses_buffer(monkeypatch) -> None:
+    class _ShortProcess(_FakeProcess):
+        def poll(self) -> int | None:
+            return 1 if self.stdout.tell() >= 6 else None
+
+    monkeypatch.setattr(f"{CAPTURE_MODULE}.shutil.which", lambda _: "/usr/bin/rtl_fm")
+    monkeypatch.setattr(
+        f"{CAPTURE_MODULE}.subprocess.Popen",
+        lambda args, **_: _ShortProcess(args, data=b"abcdEF"),
+    )
+
+    capture = RtlFmAudioCapture(RtlFmConfig(frequency_hz=144_390_000))
+    capture.start()
+
+    buffer = bytearray(4)
+    assert capture.read_into(buffer) == 4
+    assert buffer == b"abcd"
+    assert capture.read_into(buffer) == 2
+    assert buffer[:2] == b"EF"
+    with pytest.raises(AudioCaptureError):
+        capture.read_into(buffer)
+    capture.stop()
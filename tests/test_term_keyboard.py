@@ -2,7 +2,13 @@ import threading
 import time
 from queue import Queue
 
-from neo_core.term import start_keyboard_listener, process_commands, drain_command_queue
+from neo_core.term import (
+    color_text,
+    drain_command_queue,
+    process_commands,
+    start_keyboard_listener,
+    status_label,
+)
 
 
 def test_process_commands_dispatch_basic():
@@ -24,6 +30,23 @@ def test_process_commands_dispatch_basic():
     assert q.empty()
 
 
+def test_process_commands_timeout_wakes_on_command():
+    q: Queue[str] = Queue()
+    seen: list[str] = []
+
+    threading.Timer(0.05, q.put, args=("a",)).start()
+    process_commands(q, {"a": lambda: seen.append("a")}, timeout=5.0)
+
+    assert seen == ["a"]
+
+
+def test_process_commands_timeout_returns_when_idle():
+    q: Queue[str] = Queue()
+    start = time.monotonic()
+    process_commands(q, {}, timeout=0.05)
+    assert time.monotonic() - start >= 0.04
+
+
 def test_start_keyboard_listener_stops_with_event():
     stop = threading.Event()
     q: Queue[str] = Queue()
@@ -36,3 +59,16 @@ def test_start_keyboard_listener_stops_with_event():
     # Ensure no residual commands in queue
     drain_command_queue(q)
     assert q.empty()
+
+
+def test_status_label_levels():
+    assert status_label("ok", enabled=False) == "[OK     ]"
+    assert status_label("WARNING", enabled=False) == "[WARNING]"
+    assert status_label("bogus", enabled=False) == "[INFO   ]"  # type: ignore[arg-type]
+    assert status_label("error") == "\x1b[31m[ERROR  ]\x1b[0m"
+
+
+def test_color_text_wraps_known_colors_only():
+    assert color_text("hi", color="green") == "\x1b[32mhi\x1b[0m"
+    assert color_text("hi", color="green", enabled=False) == "hi"
+    assert color_text("hi", color="mauve") == "hi"
@@ -112,6 +112,27 @@ class TestEstimateOffsetFromSpots:
         result = estimate_offset_from_spots(spots)
         assert result["count"] == 1
 
+    def test_mixed_invalid_values_are_skipped(self):
+        spots = [
+            {"freq_hz": "14097000", "snr_db": "bad"},
+            {"freq_hz": "not-a-number", "snr_db": -5},
+            {"snr_db": -7},
+            {"freq_hz": 14_097_100},
+        ]
+        result = estimate_offset_from_spots(spots, expected_freq_hz=14_097_000)
+        assert result["count"] == 2
+        assert result["median_observed_freq_hz"] == 14_097_050
+        assert result["offset_hz"] == 50
+        assert result["median_snr_db"] == -6
+        assert isinstance(result["median_observed_freq_hz"], float)
+
+    def test_accepts_generator(self):
+        result = estimate_offset_from_spots(
+            {"freq_hz": f} for f in (14_097_000, 14_097_200, 14_097_100)
+        )
+        assert result["median_observed_freq_hz"] == 14_097_100
+        assert result["median_snr_db"] is None
+
 
 class TestLoadSpotsFromJsonl:
     def test_load_valid_file(self):
@@ -136,6 +157,39 @@ class TestLoadSpotsFromJsonl:
         spots = load_spots_from_jsonl(Path("/nonexistent.jsonl"))
         assert spots == []
 
+    def test_skips_blank_and_malformed_lines(self, tmp_path):
+        path = tmp_path / "spots.jsonl"
+        path.write_bytes(
+            b'{"freq_hz": 14097000}\n\n   \nnot-json\n{"freq_hz": 14097100}'
+        )
+
+        spots = load_spots_from_jsonl(path)
+        assert [s["freq_hz"] for s in spots] == [14097000, 14097100]
+
+    def test_tail_keeps_most_recent_lines(self, tmp_path):
+        path = tmp_path / "spots.jsonl"
+        path.write_bytes(
+            b"".join(b'{"freq_hz": %d}\n' % f for f in range(14097000, 14097010))
+        )
+
+        spots = load_spots_from_jsonl(path, tail_n=3)
+        assert [s["freq_hz"] for s in spots] == [14097007, 14097008, 14097009]
+
+    def test_negative_tail_raises(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_spots_from_jsonl(tmp_path / "spots.jsonl", tail_n=-1)
+
+    def test_reload_sees_appended_lines(self, tmp_path):
+        path = tmp_path / "spots.jsonl"
+        path.write_bytes(b'{"freq_hz": 14097000}\n')
+        load_spots_from_jsonl(path)
+
+        with path.open("ab") as fh:
+            fh.write(b'{"freq_hz": 14097100}\n')
+
+        spots = load_spots_from_jsonl(path)
+        assert [s["freq_hz"] for s in spots] == [14097000, 14097100]
+
 
 def test_compute_ppm_from_offset_basic():
     # 1 kHz offset at 14.08 MHz -> ~0.0710 ppm
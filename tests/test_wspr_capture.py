@@ -97,3 +97,250 @@ def test_capture_skips_enqueue_without_grid(tmp_path: Path):
     cap.stop()
 
     assert uploader.enqueued == []
+
+
+def test_wait_returns_once_capture_loop_exits(tmp_path: Path):
+    capture = WsprCapture(bands_hz=[14_095_600], data_dir=tmp_path)
+    assert capture.wait(timeout=0) is True  # not started
+
+    capture.start()
+    capture.stop()
+    assert capture.wait(timeout=5) is True
+    assert capture.is_running() is False
+
+
+def test_spots_file_opened_once_per_cycle(tmp_path: Path, monkeypatch):
+    import neo_wspr.wspr.capture as capture_mod
+
+    cap = WsprCapture(bands_hz=[14080000, 7038600], data_dir=tmp_path)
+
+    opens = []
+    writes = []
+    real_open = capture_mod.os.open
+    real_write = capture_mod.os.write
+
+    def counting_open(path, *args, **kwargs):
+        if Path(path) == cap._spots_file:
+            opens.append(path)
+        return real_open(path, *args, **kwargs)
+
+    def counting_write(fd, data):
+        if fd == cap._spots_fd:
+            writes.append(bytes(data))
+        return real_write(fd, data)
+
+    monkeypatch.setattr(capture_mod.os, "open", counting_open)
+    monkeypatch.setattr(capture_mod.os, "write", counting_write)
+    spots = cap.run_capture_cycle(fake_capture_fn)
+
+    assert len(spots) == 4
+    assert len(opens) == 1
+    # One append per band, each holding only whole lines
+    assert len(writes) == 2
+    assert all(chunk.endswith(b"\n") for chunk in writes)
+    assert cap._spots_fd is None  # closed at the end of the cycle
+    lines = cap._spots_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 4
+
+
+def test_failed_spots_append_is_retried(tmp_path: Path, monkeypatch):
+    import neo_wspr.wspr.capture as capture_mod
+
+    cap = WsprCapture(bands_hz=[14080000], data_dir=tmp_path)
+    real_write = capture_mod.os.write
+    failures = [OSError(28, "No space left on device")]
+
+    def flaky_write(fd, data):
+        if failures:
+            raise failures.pop()
+        # Short write: the rest stays buffered for the next call.
+        return real_write(fd, bytes(data[:10]))
+
+    monkeypatch.setattr(capture_mod.os, "write", flaky_write)
+    cap._persist_spot({"call": "K1ABC"})
+    cap._flush_spots()
+    assert cap._spots_buf  # kept after the failed append
+
+    cap._persist_spot({"call": "G4XYZ"})
+    cap._close_spots()
+    lines = cap._spots_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["call"] for line in lines] == ["K1ABC", "G4XYZ"]
+
+
+def test_handle_spot_takes_ownership_of_spot(tmp_path: Path):
+    cap = WsprCapture(
+        bands_hz=[14080000], data_dir=tmp_path, station_config=_station_cfg()
+    )
+    spot = {"call": "K1ABC", "timestamp": "2025-11-08T12:35:10Z"}
+    kept = dict(spot)
+
+    enriched = cap._handle_spot(spot, 14080000)
+    cap._close_spots()
+    cap._stop_publisher()
+
+    # Enriched in place: the caller's dict is the returned, enriched one.
+    assert enriched is spot
+    assert spot["slot_start_utc"] == "2025-11-08T12:34:00Z"
+    assert kept == {"call": "K1ABC", "timestamp": "2025-11-08T12:35:10Z"}
+
+
+def test_tune_capture_thread_pins_and_falls_back_to_nice(monkeypatch):
+    import neo_wspr.wspr.capture as capture_mod
+
+    calls = []
+
+    def denied(*args):
+        raise PermissionError("no CAP_SYS_NICE")
+
+    monkeypatch.setattr(capture_mod.os, "sched_getaffinity", lambda tid: {0, 1, 2})
+    monkeypatch.setattr(
+        capture_mod.os,
+        "sched_setaffinity",
+        lambda tid, cpus: calls.append(("affinity", cpus)),
+    )
+    monkeypatch.setattr(capture_mod.os, "sched_setscheduler", denied)
+    monkeypatch.setattr(
+        capture_mod.os,
+        "setpriority",
+        lambda which, who, prio: calls.append(("nice", prio)),
+    )
+
+    capture_mod._tune_capture_thread(realtime=True)
+
+    assert calls == [("affinity", {2}), ("nice", capture_mod.CAPTURE_NICE)]
+
+
+def test_tune_capture_thread_requests_fifo_only_when_opted_in(monkeypatch):
+    import neo_wspr.wspr.capture as capture_mod
+
+    calls = []
+    monkeypatch.setattr(capture_mod.os, "sched_getaffinity", lambda tid: {0})
+    monkeypatch.setattr(
+        capture_mod.os,
+        "sched_setscheduler",
+        lambda tid, policy, param: calls.append(("fifo", policy)),
+    )
+    monkeypatch.setattr(
+        capture_mod.os,
+        "setpriority",
+        lambda which, who, prio: calls.append(("nice", prio)),
+    )
+
+    capture_mod._tune_capture_thread()
+    assert calls == [("nice", capture_mod.CAPTURE_NICE)]
+
+    calls.clear()
+    capture_mod._tune_capture_thread(realtime=True)
+    assert calls == [("fifo", capture_mod.os.SCHED_FIFO)]
+
+
+def test_decode_worker_does_not_inherit_capture_tuning(monkeypatch):
+    import threading
+
+    import neo_wspr.wspr.capture as capture_mod
+
+    # New threads inherit the affinity last set by their creator, as on Linux.
+    affinity = {"inherited": {0, 1, 2}}
+
+    def getaffinity(tid):
+        return affinity.get(tid, affinity["inherited"])
+
+    def setaffinity(tid, cpus):
+        affinity[tid] = affinity["inherited"] = set(cpus)
+
+    monkeypatch.setattr(capture_mod.os, "sched_getaffinity", getaffinity)
+    monkeypatch.setattr(capture_mod.os, "sched_setaffinity", setaffinity)
+    monkeypatch.setattr(capture_mod.os, "sched_getscheduler", lambda tid: 0)
+    monkeypatch.setattr(capture_mod.os, "sched_getparam", lambda tid: None)
+    monkeypatch.setattr(capture_mod.os, "sched_setscheduler", lambda *a: None)
+    monkeypatch.setattr(capture_mod.os, "getpriority", lambda which, who: 0)
+    monkeypatch.setattr(capture_mod.os, "setpriority", lambda *a: None)
+
+    cap = WsprCapture()
+    seen = {}
+
+    def capture_thread():
+        cap._base_sched = capture_mod._thread_scheduling()
+        capture_mod._tune_capture_thread()
+        seen["capture"] = getaffinity(threading.get_native_id())
+        pool = cap._new_decode_pool()
+        try:
+            seen["decode"] = pool.submit(
+                lambda: getaffinity(threading.get_native_id())
+            ).result()
+        finally:
+            pool.shutdown()
+
+    t = threading.Thread(target=capture_thread)
+    t.start()
+    t.join()
+
+    assert seen == {"capture": {2}, "decode": {0, 1, 2}}
+
+
+def test_wait_for_wspr_slot_targets_next_even_minute(tmp_path: Path, monkeypatch):
+    import threading
+
+    import neo_wspr.wspr.capture as capture_mod
+
+    clock = [120.0 * 1000 + 60 + 25]  # 25 s into an odd minute
+    waits = []
+
+    class FakeEvent(threading.Event):
+        def wait(self, timeout=None):
+            waits.append(round(timeout, 6))
+            clock[0] += timeout
+            return False
+
+    monkeypatch.setattr(capture_mod.time, "time", lambda: clock[0])
+    capture = WsprCapture(bands_hz=[14_095_600], data_dir=tmp_path)
+    capture._stop_event = FakeEvent()
+
+    assert capture._wait_for_wspr_slot() is True
+    assert waits == [5.0, 10.0, 10.0, 10.0]
+    assert clock[0] % 120 == 0
+
+    capture._stop_event = threading.Event()
+    capture._stop_event.set()
+    assert capture._wait_for_wspr_slot() is False
+
+
+def test_band_tunings_apply_upconverter_offset(tmp_path: Path):
+    plain = WsprCapture(bands_hz=[14_095_600], data_dir=tmp_path)
+    assert plain._band_tunings() == [
+        (14_095_600, 14_095_600, "RTL-SDR tuning to 14.096 MHz (no upconverter)")
+    ]
+
+    upconverted = WsprCapture(
+        bands_hz=[7_038_600], data_dir=tmp_path, upconverter_enabled=True
+    )
+    [(band, freq, msg)] = upconverted._band_tunings()
+    assert (band, freq) == (7_038_600, 132_038_600)
+    assert msg.endswith("(HF: 7.039 MHz + 125 MHz upconverter offset)")
+
+
+def test_decode_stage_handles_spots_and_always_cleans_up(tmp_path: Path):
+    class FakeStage:
+        cleaned = False
+
+        def cleanup(self):
+            self.cleaned = True
+
+    class FakeDecoder:
+        def __init__(self, fail):
+            self.fail = fail
+
+        def run_wsprd_staged(self, stage, band_hz):
+            yield {"timestamp": "2025-11-08T12:34:00Z", "call": "K1ABC"}
+            if self.fail:
+                raise RuntimeError("wsprd crashed")
+
+    cap = WsprCapture(bands_hz=[14_095_600], data_dir=tmp_path)
+    for fail in (False, True):
+        stage = FakeStage()
+        cap._decode_stage(FakeDecoder(fail), stage, 14_095_600)
+        assert stage.cleaned
+    cap._close_spots()
+
+    lines = cap._spots_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
@@ -41,3 +41,72 @@ def test_capture_publishes(tmp_path: Path):
     topic, payload = publisher.publishes[0]
     assert topic == "neo_rx/wspr/spots"
     assert payload["call"] == "K1ABC"
+
+
+def test_capture_publishes_to_default_topic_when_unset(tmp_path: Path):
+    publisher = MockPublisher()
+    publisher.topic = None
+    cap = WsprCapture(bands_hz=[14080000], data_dir=tmp_path, publisher=publisher)
+
+    cap.run_capture_cycle(fake_capture_fn)
+
+    assert [topic for topic, _ in publisher.publishes] == ["neo_rx/wspr/spots"]
+
+
+def test_capture_without_publisher_still_persists(tmp_path: Path):
+    cap = WsprCapture(bands_hz=[14080000], data_dir=tmp_path)
+
+    spots = cap.run_capture_cycle(fake_capture_fn)
+
+    assert len(spots) == 1
+    assert (tmp_path / "wspr_spots.jsonl").read_text(encoding="utf-8").count("\n") == 1
+
+
+class BatchPublisher(MockPublisher):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def publish_batch(self, topic, payloads):
+        self.batches.append((topic, list(payloads)))
+
+
+def test_capture_publishes_spots_in_batches(tmp_path: Path):
+    publisher = BatchPublisher()
+    cap = WsprCapture(bands_hz=[14080000], data_dir=tmp_path, publisher=publisher)
+
+    def many_spots(band_hz: int, duration_s: int):
+        return ["2025-11-08 12:34:00 14080000 K1ABC FN42 -12 0.5\n"] * 5
+
+    cap.run_capture_cycle(many_spots)
+
+    assert publisher.publishes == []
+    assert sum(len(batch) for _, batch in publisher.batches) == 5
+    assert {topic for topic, _ in publisher.batches} == {"neo_rx/wspr/spots"}
+
+
+def test_capture_drops_spots_when_publish_backlog_full(tmp_path: Path, monkeypatch):
+    import neo_wspr.wspr.capture as capture_mod
+
+    publisher = MockPublisher()
+    cap = WsprCapture(bands_hz=[14080000], data_dir=tmp_path, publisher=publisher)
+    cap._pub_q = capture_mod.queue.Queue(maxsize=1)
+    # Keep the publisher thread from draining so the backlog stays full.
+    monkeypatch.setattr(cap, "_ensure_publisher", lambda: None)
+
+    cap._publish_spot({"call": "K1ABC"})
+    cap._publish_spot({"call": "K2DEF"})
+
+    assert cap._dropped_spots == 1
+    assert cap._pub_q.qsize() == 1
+
+
+def test_capture_reuses_decoder_across_cycles(tmp_path: Path):
+    cap = WsprCapture(bands_hz=[14080000], data_dir=tmp_path)
+
+    cap.run_capture_cycle(fake_capture_fn)
+    decoder = cap._decoder
+    cap.run_capture_cycle(fake_capture_fn)
+
+    assert decoder is not None
+    assert cap._decoder is decoder
@@ -1,5 +1,7 @@
 import pathlib
 
+import pytest
+
 from neo_wspr.wspr.decoder import WsprDecoder
 
 
@@ -16,3 +18,379 @@ def test_parse_wsprd_fixture():
     assert first["freq_hz"] == 14080000
     assert isinstance(first["snr_db"], int)
     assert spots[1]["call"] == "G4XYZ"
+
+
+def test_parse_line_rejects_non_spot_lines():
+    decoder = WsprDecoder()
+    for line in (
+        "<DecodeFinished>",
+        "Decoding 14.0956 MHz...",
+        "2025-11-08",
+        "2025/11/08 12:34:00 14080000 K1ABC FN42 -12",
+        "# 2025-11-08 12:34:00 14080000 K1ABC FN42 -12",
+    ):
+        assert decoder._parse_line(line) is None
+    spot = decoder._parse_line("2025-11-08\t12:34:00 14080000 K1ABC FN42 -12 0.5")
+    assert spot is not None and spot["call"] == "K1ABC"
+
+
+def test_scratch_dir_prefers_tmpfs_with_room(monkeypatch, tmp_path):
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(tmp_path))
+    monkeypatch.setattr(decoder_mod, "SHM_HEADROOM_BYTES", 0)
+    assert decoder_mod._scratch_dir(1024) == str(tmp_path)
+
+    # Too large for the available space -> fall back to the default temp dir
+    assert decoder_mod._scratch_dir(1 << 62) is None
+
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(tmp_path / "missing"))
+    assert decoder_mod._scratch_dir(1024) is None
+
+
+def test_run_wsprd_subprocess_stages_input_in_scratch_dir(monkeypatch, tmp_path):
+    import sys
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    shm = tmp_path / "shm"
+    shm.mkdir()
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(shm))
+    monkeypatch.setattr(decoder_mod, "SHM_HEADROOM_BYTES", 0)
+
+    # Stand-in for wsprd that echoes the input file path it was given
+    fake = tmp_path / "wsprd"
+    fake.write_text(f"#!{sys.executable}\nimport sys\nprint(sys.argv[-1])\n")
+    fake.chmod(0o755)
+    decoder = WsprDecoder()
+    decoder.wsprd_path = str(fake)
+
+    seen: list[str] = []
+    monkeypatch.setattr(decoder, "_parse_line", lambda line: seen.append(line))
+    list(decoder.run_wsprd_subprocess(b"\x00" * 16, 14_095_600))
+
+    assert len(seen) == 1
+    assert seen[0].startswith(str(shm))
+    assert list(shm.iterdir()) == []  # temp dir cleaned up afterwards
+
+
+def test_wsprd_lookup_caches_only_found_binary(monkeypatch, tmp_path):
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    calls = []
+    found: list[str | None] = [None]
+    monkeypatch.setattr(
+        decoder_mod.shutil, "which", lambda name: calls.append(name) or found[0]
+    )
+    monkeypatch.setattr(decoder_mod.os.path, "exists", lambda path: False)
+    monkeypatch.setattr(decoder_mod, "_wsprd_path", None)
+
+    # Misses are retried, so a later install is noticed without a restart.
+    decoder = WsprDecoder()
+    assert decoder.wsprd_path is None
+    found[0] = str(tmp_path / "wsprd")
+    assert list(decoder.run_wsprd_subprocess(b"", 14_095_600, cmd=["true"])) == []
+    assert decoder.wsprd_path == found[0]
+
+    # Once found, the path is reused by every decoder.
+    calls.clear()
+    WsprDecoder()
+    WsprDecoder()
+    assert calls == []
+
+
+def test_iq_staging_file_converts_in_place_and_trims(monkeypatch, tmp_path):
+    import numpy as np
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(tmp_path))
+    monkeypatch.setattr(decoder_mod, "SHM_HEADROOM_BYTES", 0)
+
+    stage = decoder_mod.IqStagingFile(4)
+    assert stage.dir.startswith(str(tmp_path))
+    samples = np.array([0.5 - 0.25j, 1.0 + -1.0j, 2.0 - 2.0j], dtype=np.complex64)
+    assert stage.append(samples) == 3
+    assert stage.append(samples) == 1  # only one slot left
+    assert stage.append([]) == 0
+    stage.close()
+
+    out = np.fromfile(stage.path, dtype="<i2")
+    assert out.tolist() == [16383, -8191, 32767, -32767, 32767, -32768, 16383, -8191]
+    assert stage.append(samples) == 0  # closed
+
+    stage.cleanup()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_run_wsprd_staged_reads_stage_in_place(tmp_path):
+    import sys
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    fake = tmp_path / "wsprd"
+    fake.write_text(f"#!{sys.executable}\nimport sys\nprint(sys.argv[-1])\n")
+    fake.chmod(0o755)
+    decoder = WsprDecoder()
+    decoder.wsprd_path = str(fake)
+
+    stage = decoder_mod.IqStagingFile(8)
+    try:
+        stage.append([0.1 + 0.1j])
+        stage.close()
+        seen: list[str] = []
+        decoder._parse_line = lambda line: seen.append(line.strip())
+        list(decoder.run_wsprd_staged(stage, 14_095_600))
+        assert seen == [stage.path]
+    finally:
+        stage.cleanup()
+
+
+def test_run_wsprd_reaps_clean_exit_and_kills_abandoned_run(monkeypatch, tmp_path):
+    import subprocess
+    import sys
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    procs = []
+    real_popen = subprocess.Popen
+
+    def tracking_popen(*args, **kwargs):
+        proc = real_popen(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(decoder_mod.subprocess, "Popen", tracking_popen)
+    spot = "2025-11-08 12:34:00 14080000 K1ABC FN42 -12 0.5"
+    fake = tmp_path / "wsprd"
+    fake.write_text(
+        f"#!{sys.executable}\nimport sys, time\n"
+        f"print({spot!r}); print({spot!r}); sys.stdout.flush()\n"
+        "if '--hang' in sys.argv: time.sleep(30)\n"
+    )
+    fake.chmod(0o755)
+    decoder = WsprDecoder()
+    decoder.wsprd_path = str(fake)
+
+    spots = list(decoder.run_wsprd_subprocess(b"\x00" * 16, 14_095_600))
+    assert [s["call"] for s in spots] == ["K1ABC", "K1ABC"]
+    assert procs[-1].returncode == 0  # exited on its own, not signalled
+
+    gen = decoder.run_wsprd_subprocess(
+        b"\x00" * 16, 14_095_600, cmd=[str(fake), "--hang"]
+    )
+    assert next(gen)["call"] == "K1ABC"
+    gen.close()
+    assert procs[-1].returncode is not None and procs[-1].returncode < 0
+
+
+def test_iq_staging_file_keeps_data_after_releasing_pages(monkeypatch, tmp_path):
+    import mmap
+
+    import numpy as np
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(tmp_path / "missing"))
+    monkeypatch.setattr(decoder_mod, "STAGE_RELEASE_BYTES", mmap.PAGESIZE)
+
+    per_chunk = mmap.PAGESIZE // 2  # samples; two pages per chunk
+    stage = decoder_mod.IqStagingFile(per_chunk * 4)
+    try:
+        for i in range(4):
+            stage.append(np.full(per_chunk, (i + 1) / 8 + 0j, dtype=np.complex64))
+        if decoder_mod._MADV_DONTNEED is not None:
+            assert stage._released == stage.samples * 4
+        stage.close()
+        out = np.fromfile(stage.path, dtype="<i2")[0::2].reshape(4, -1)
+        assert [int(row[0]) for row in out] == [4095, 8191, 12287, 16383]
+        assert all((row == row[0]).all() for row in out)
+    finally:
+        stage.cleanup()
+
+
+def test_run_wsprd_subprocess_writes_all_iq_bytes(monkeypatch, tmp_path):
+    import sys
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    monkeypatch.setattr(decoder_mod, "IQ_WRITE_CHUNK", 7)  # force many writes
+    fake = tmp_path / "wsprd"
+    fake.write_text(
+        f"#!{sys.executable}\nimport sys\n"
+        "print(open(sys.argv[-1], 'rb').read().hex())\n"
+    )
+    fake.chmod(0o755)
+    decoder = WsprDecoder()
+    decoder.wsprd_path = str(fake)
+    seen: list[str] = []
+    monkeypatch.setattr(decoder, "_parse_line", lambda line: seen.append(line.strip()))
+
+    payload = bytes(range(50))
+    list(decoder.run_wsprd_subprocess(bytearray(payload), 14_095_600))
+
+    assert seen == [payload.hex()]
+
+
+def test_decode_stream_splits_bytes_chunks_before_decoding():
+    decoder = WsprDecoder()
+    chunk = (
+        b"<DecodeFinished>\r\n"
+        b"2025-11-08 12:34:00 14080000 K1ABC FN42 -12 0.5\r\n"
+        b"caf\xc3\xa9 \xff chatter\n"
+        b"2025-11-08 12:36:00 7040000 G4XYZ IO91 -20\n"
+    )
+    spots = list(decoder.decode_stream([chunk]))
+    assert [s["call"] for s in spots] == ["K1ABC", "G4XYZ"]
+    assert spots[0]["drift"] == 0.5
+
+
+def test_line_pattern_is_a_class_attribute_subclasses_can_override():
+    import re
+
+    class NoDriftDecoder(WsprDecoder):
+        _LINE_RE = re.compile(r"(\S+) (\S+) (\d+) (\S+) (\S+) (-?\d+)()$")
+
+    assert WsprDecoder()._LINE_RE is WsprDecoder._LINE_RE
+    line = "2025-11-08 12:34:00 14080000 K1ABC FN42 -12 0.5"
+    assert WsprDecoder()._parse_line(line)["drift"] == 0.5
+    assert NoDriftDecoder()._parse_line(line) is None
+    spot = NoDriftDecoder()._parse_line("2025-11-08 12:34:00 14080000 K1ABC FN42 -12")
+    assert spot["call"] == "K1ABC" and spot["drift"] is None
+
+
+def test_decode_stream_handles_chunk_type_changes_mid_stream():
+    decoder = WsprDecoder()
+    chunks = [
+        "2025-11-08 12:34:00 14080000 K1ABC FN42 -12",
+        b"2025-11-08 12:36:00 7040000 G4XYZ IO91 -20\n",
+        "2025-11-08 12:38:00 7040000 W1AW FN31 -5",
+    ]
+    spots = list(decoder.decode_stream(chunks))
+    assert [s["call"] for s in spots] == ["K1ABC", "G4XYZ", "W1AW"]
+
+
+def test_run_wsprd_discards_stderr_unless_requested(monkeypatch, tmp_path, caplog):
+    import logging
+    import subprocess
+    import sys
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    stderr_args = []
+    real_popen = subprocess.Popen
+
+    def tracking_popen(*args, **kwargs):
+        stderr_args.append(kwargs.get("stderr"))
+        return real_popen(*args, **kwargs)
+
+    monkeypatch.setattr(decoder_mod.subprocess, "Popen", tracking_popen)
+    fake = tmp_path / "wsprd"
+    fake.write_text(
+        f"#!{sys.executable}\nimport sys\n"
+        "print('2025-11-08 12:34:00 14080000 K1ABC FN42 -12')\n"
+        "print('chatty diagnostics', file=sys.stderr)\n"
+    )
+    fake.chmod(0o755)
+    decoder = WsprDecoder()
+    decoder.wsprd_path = str(fake)
+
+    caplog.set_level(logging.INFO, logger=decoder_mod.LOG.name)
+    assert len(list(decoder.run_wsprd_subprocess(b"\x00" * 16, 14_095_600))) == 1
+    assert stderr_args[-1] is subprocess.DEVNULL
+
+    spots = list(
+        decoder.run_wsprd_subprocess(b"\x00" * 16, 14_095_600, capture_stderr=True)
+    )
+    assert len(spots) == 1
+    assert stderr_args[-1] is subprocess.PIPE
+    assert "chatty diagnostics" in caplog.text
+
+
+def test_iq_staging_file_reserves_space_before_mapping(monkeypatch, tmp_path):
+    import errno
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    shm = tmp_path / "shm"
+    shm.mkdir()
+    fallback = tmp_path / "tmp"
+    fallback.mkdir()
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(shm))
+    monkeypatch.setattr(decoder_mod, "SHM_HEADROOM_BYTES", 0)
+    monkeypatch.setattr(decoder_mod.tempfile, "tempdir", str(fallback))
+
+    reserved = []
+    real_fallocate = decoder_mod.os.posix_fallocate
+
+    def tmpfs_full(fd, offset, length):
+        reserved.append(length)
+        if len(reserved) == 1:
+            raise OSError(errno.ENOSPC, "No space left on device")
+        real_fallocate(fd, offset, length)
+
+    monkeypatch.setattr(decoder_mod.os, "posix_fallocate", tmpfs_full)
+
+    # A full tmpfs falls back to the default temp directory.
+    stage = decoder_mod.IqStagingFile(4)
+    try:
+        assert reserved == [16, 16]
+        assert stage.dir.startswith(str(fallback))
+        assert list(shm.iterdir()) == []
+        assert stage.append([0.5 + 0.5j]) == 1
+    finally:
+        stage.cleanup()
+
+    # With nowhere to put it, the error is raised and nothing is left behind.
+    def always_full(fd, offset, length):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(decoder_mod.os, "posix_fallocate", always_full)
+    with pytest.raises(OSError):
+        decoder_mod.IqStagingFile(4)
+    assert list(shm.iterdir()) == []
+    assert list(fallback.iterdir()) == []
+
+    # Filesystems without fallocate support still get a (sparse) file.
+    def unsupported(fd, offset, length):
+        raise OSError(errno.EOPNOTSUPP, "Operation not supported")
+
+    monkeypatch.setattr(decoder_mod.os, "posix_fallocate", unsupported)
+    stage = decoder_mod.IqStagingFile(4)
+    try:
+        assert stage.append([0.5 + 0.5j] * 4) == 4
+    finally:
+        stage.cleanup()
+
+
+def test_iq_staging_file_budgets_tmpfs_for_two_stages(monkeypatch, tmp_path):
+    import shutil
+
+    import neo_wspr.wspr.decoder as decoder_mod
+
+    shm = tmp_path / "shm"
+    shm.mkdir()
+    fallback = tmp_path / "tmp"
+    fallback.mkdir()
+    monkeypatch.setattr(decoder_mod, "SHM_DIR", str(shm))
+    monkeypatch.setattr(decoder_mod, "SHM_HEADROOM_BYTES", 0)
+    monkeypatch.setattr(decoder_mod.tempfile, "tempdir", str(fallback))
+    usage = shutil.disk_usage(tmp_path)
+
+    def free(nbytes):
+        return lambda path: usage._replace(free=nbytes)
+
+    # Room for one 16-byte stage but not two: stage on disk instead.
+    monkeypatch.setattr(decoder_mod.shutil, "disk_usage", free(16))
+    stage = decoder_mod.IqStagingFile(4)
+    try:
+        assert stage.dir.startswith(str(fallback))
+    finally:
+        stage.cleanup()
+
+    monkeypatch.setattr(decoder_mod.shutil, "disk_usage", free(32))
+    stage = decoder_mod.IqStagingFile(4)
+    try:
+        assert stage.dir.startswith(str(shm))
+    finally:
+        stage.cleanup()
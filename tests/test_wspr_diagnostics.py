@@ -134,3 +134,23 @@ def test_upconverter_hint_single_spot():
     result = detect_upconverter_hint(spots)
     assert result["median_freq_hz"] == 14130000
     assert result["mean_snr_db"] == -12.0
+
+
+def test_detect_upconverter_hint_from_arrays_matches_dict_form():
+    import numpy as np
+
+    from neo_wspr.wspr.diagnostics import detect_upconverter_hint_from_arrays
+
+    spots = [
+        {"freq_hz": 139_080_000, "snr_db": -30},
+        {"freq_hz": 139_080_100, "snr_db": None},
+        {"freq_hz": None, "snr_db": 50},  # no frequency: SNR ignored too
+        {"freq_hz": 139_079_900, "snr_db": -28},
+    ]
+    freqs = np.array([139_080_000, 139_080_100, np.nan, 139_079_900])
+    snrs = np.array([-30, np.nan, 50, -28])
+
+    result = detect_upconverter_hint_from_arrays(freqs, snrs)
+    assert result == detect_upconverter_hint(spots)
+    assert result["mean_snr_db"] == -29.0
+    assert result["recommended_lo_offset_hz"] == -111_000_000
@@ -69,6 +69,14 @@ def test_scan_json_output(monkeypatch, capsys, tmp_path):
     assert data[0]["band_hz"] == 14080000
     assert data[0]["band_decodes"] == 2
     assert data[1]["band_hz"] == 7080000
+    # Machine-readable output is compact unless --pretty is given
+    assert "\n" not in output
+
+    args.pretty = True
+    assert run_scan(args) == 0
+    pretty = capsys.readouterr().out.strip()
+    assert "\n  " in pretty
+    assert json.loads(pretty) == data
 
 
 def test_upload_json_output(monkeypatch, capsys, tmp_path):
@@ -31,3 +31,115 @@ def test_scan_bands_ranks_and_metrics():
     assert reports[0]["band_decodes"] == 2
     assert reports[0]["median_snr_db"] == -11
     assert reports[1]["band_decodes"] == 0
+
+
+def test_run_scan_resolves_wsprd_once(monkeypatch):
+    from argparse import Namespace
+
+    from neo_core import config as config_module
+    from neo_wspr.commands.scan import run_scan
+    from neo_wspr.wspr.decoder import WsprDecoder
+
+    cfg = config_module.StationConfig(
+        callsign="TEST",
+        passcode="12345",
+        wspr_bands_hz=[14080000, 7080000, 3572000],
+        wspr_capture_duration_s=1,
+    )
+    monkeypatch.setattr(config_module, "load_config", lambda path=None: cfg)
+    lookups = []
+    monkeypatch.setattr(
+        WsprDecoder, "_find_wsprd", lambda self: lookups.append(1) or None
+    )
+
+    assert run_scan(Namespace(config=None, json=False)) == 0
+    # One lookup for the scan command, one for scan_bands' decoder
+    assert len(lookups) == 2
+
+
+def test_collect_output_honours_duration_without_output():
+    import subprocess
+    import sys
+    import time
+
+    from neo_wspr.commands.scan import _collect_output
+
+    script = "import sys, time; print('first'); sys.stdout.flush(); time.sleep(10)"
+    proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+    try:
+        started = time.monotonic()
+        lines = _collect_output(proc.stdout, 0.5)
+        elapsed = time.monotonic() - started
+    finally:
+        proc.kill()
+        proc.wait()
+
+    assert lines == [b"first"]
+    assert elapsed < 5
+
+
+def test_collect_output_stops_at_eof_and_keeps_partial_line():
+    import subprocess
+    import sys
+
+    from neo_wspr.commands.scan import _collect_output
+
+    script = "import sys; sys.stdout.write('a\\nb\\npartial')"
+    proc = subprocess.Popen([sys.executable, "-c", script], stdout=subprocess.PIPE)
+    try:
+        lines = _collect_output(proc.stdout, 30)
+    finally:
+        proc.wait()
+
+    assert lines == [b"a", b"b", b"partial"]
+
+
+def test_stop_process_group_kills_grandchildren():
+    import os
+    import subprocess
+    import time
+
+    from neo_wspr.commands.scan import _stop_process_group
+
+    proc = subprocess.Popen(
+        ["sh", "-c", "sleep 30 & echo $!; wait"],
+        stdout=subprocess.PIPE,
+        start_new_session=True,
+    )
+    grandchild = int(proc.stdout.readline())
+
+    _stop_process_group(proc)
+
+    assert proc.returncode is not None
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        try:
+            os.kill(grandchild, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.05)
+    else:
+        raise AssertionError("grandchild survived process group stop")
+
+
+def test_stop_process_group_escalates_to_sigkill(monkeypatch):
+    import subprocess
+    import sys
+
+    import neo_wspr.commands.scan as scan_cmd
+
+    monkeypatch.setattr(scan_cmd, "_TERMINATE_TIMEOUT_S", 0.2)
+    script = (
+        "import signal, sys, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+        "print('ready'); sys.stdout.flush(); time.sleep(30)"
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        start_new_session=True,
+    )
+    proc.stdout.readline()
+
+    scan_cmd._stop_process_group(proc)
+
+    assert proc.returncode == -9